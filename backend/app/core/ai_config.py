@@ -4,124 +4,184 @@ AI Configuration Module
 This module handles configuration for AI services including LLM and vector database settings.
 """
 
-import os
-from typing import Optional
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 import logging
-
-# Load environment variables
-load_dotenv()
+from app.core.env import get_env, load_env
 
 logger = logging.getLogger(__name__)
 
+# Validation messages reported by AIConfig.validate_config()
+_E_GOOGLE_API_KEY = "GOOGLE_API_KEY is required for LLM operations"
+_E_PINECONE_API_KEY = "PINECONE_API_KEY is required when RAG is enabled"
+_E_PINECONE_ENVIRONMENT = "PINECONE_ENVIRONMENT is required when RAG is enabled"
+_W_SERPER_API_KEY = "SERPER_API_KEY is recommended when web search is enabled"
+_W_GEMINI_TEMPERATURE = "GEMINI_TEMPERATURE should be between 0 and 2"
+_W_HSA_CONFIDENCE_THRESHOLD = "HSA_CONFIDENCE_THRESHOLD should be between 0 and 1"
+_W_RAG_SIMILARITY_THRESHOLD = "RAG_SIMILARITY_THRESHOLD should be between 0 and 1"
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment flag"""
+    return value.lower() == "true"
+
 
 class AIConfig:
-    """Configuration class for AI services"""
-    
-    # Google Gemini Configuration
-    GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
-    GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
-    GEMINI_TEMPERATURE: float = float(os.getenv("GEMINI_TEMPERATURE", "0.1"))
-    GEMINI_MAX_TOKENS: int = int(os.getenv("GEMINI_MAX_TOKENS", "1000"))
-    
-    # Pinecone Configuration
-    PINECONE_API_KEY: str = os.getenv("PINECONE_API_KEY", "")
-    PINECONE_ENVIRONMENT: str = os.getenv("PINECONE_ENVIRONMENT", "")
-    PINECONE_INDEX_NAME: str = os.getenv("PINECONE_INDEX_NAME", "helpdesk-knowledge-base")
-
-    # Google Serper Configuration (for web search)
-    SERPER_API_KEY: str = os.getenv("SERPER_API_KEY", "")
-    WEB_SEARCH_ENABLED: bool = os.getenv("WEB_SEARCH_ENABLED", "true").lower() == "true"
-    
-    # HSA Configuration
-    HSA_ENABLED: bool = os.getenv("HSA_ENABLED", "true").lower() == "true"
-    HSA_CONFIDENCE_THRESHOLD: float = float(os.getenv("HSA_CONFIDENCE_THRESHOLD", "0.7"))
-    
-    # RAG Configuration
-    RAG_ENABLED: bool = os.getenv("RAG_ENABLED", "true").lower() == "true"
-    RAG_TOP_K: int = int(os.getenv("RAG_TOP_K", "5"))
-    RAG_SIMILARITY_THRESHOLD: float = float(os.getenv("RAG_SIMILARITY_THRESHOLD", "0.8"))
-    
-    # Logging Configuration
-    AI_LOG_LEVEL: str = os.getenv("AI_LOG_LEVEL", "DEBUG")
+    """
+    Configuration class for AI services
+
+    Settings are parsed from the environment on first access and memoized on
+    the instance, so importing this module does no parsing work.
+    """
+
+    # Attribute name -> (environment variable, parser, default)
+    _SPEC = {
+        # Google Gemini Configuration
+        "GOOGLE_API_KEY": ("GOOGLE_API_KEY", str, ""),
+        "GEMINI_MODEL": ("GEMINI_MODEL", str, "gemini-2.0-flash"),
+        "GEMINI_TEMPERATURE": ("GEMINI_TEMPERATURE", float, "0.1"),
+        "GEMINI_MAX_TOKENS": ("GEMINI_MAX_TOKENS", int, "1000"),
+
+        # Pinecone Configuration
+        "PINECONE_API_KEY": ("PINECONE_API_KEY", str, ""),
+        "PINECONE_ENVIRONMENT": ("PINECONE_ENVIRONMENT", str, ""),
+        "PINECONE_INDEX_NAME": ("PINECONE_INDEX_NAME", str, "helpdesk-knowledge-base"),
+
+        # Google Serper Configuration (for web search)
+        "SERPER_API_KEY": ("SERPER_API_KEY", str, ""),
+        "WEB_SEARCH_ENABLED": ("WEB_SEARCH_ENABLED", _parse_bool, "true"),
+
+        # HSA Configuration
+        "HSA_ENABLED": ("HSA_ENABLED", _parse_bool, "true"),
+        "HSA_CONFIDENCE_THRESHOLD": ("HSA_CONFIDENCE_THRESHOLD", float, "0.7"),
+
+        # RAG Configuration
+        "RAG_ENABLED": ("RAG_ENABLED", _parse_bool, "true"),
+        "RAG_TOP_K": ("RAG_TOP_K", int, "5"),
+        "RAG_SIMILARITY_THRESHOLD": ("RAG_SIMILARITY_THRESHOLD", float, "0.8"),
+
+        # Agent Configuration
+        "AGENT_MAX_WORKERS": ("AGENT_MAX_WORKERS", int, "8"),
+
+        # Logging Configuration
+        "AI_LOG_LEVEL": ("AI_LOG_LEVEL", str, "DEBUG"),
+    }
+
+    GOOGLE_API_KEY: str
+    GEMINI_MODEL: str
+    GEMINI_TEMPERATURE: float
+    GEMINI_MAX_TOKENS: int
+    PINECONE_API_KEY: str
+    PINECONE_ENVIRONMENT: str
+    PINECONE_INDEX_NAME: str
+    SERPER_API_KEY: str
+    WEB_SEARCH_ENABLED: bool
+    HSA_ENABLED: bool
+    HSA_CONFIDENCE_THRESHOLD: float
+    RAG_ENABLED: bool
+    RAG_TOP_K: int
+    RAG_SIMILARITY_THRESHOLD: float
+    AGENT_MAX_WORKERS: int
+    AI_LOG_LEVEL: str
+
+    def __getattr__(self, name: str):
+        """
+        Parse a configuration value on first access and memoize it
+
+        Args:
+            name: Configuration attribute name
+
+        Returns:
+            Parsed configuration value
+        """
+        try:
+            env_key, parser, default = self._SPEC[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+
+        value = parser(get_env(env_key, default))
+        self.__dict__[name] = value
+        return value
     
-    @classmethod
-    def validate_config(cls) -> dict:
+    def reload(self) -> None:
+        """
+        Discard all parsed settings and cached results so they are re-read from the environment
+        """
+        load_env.cache_clear()
+        self.__dict__.clear()
+
+    def validate_config(self) -> Mapping[str, Any]:
         """
         Validate AI configuration and return status
+
+        The result is computed once and cached until reload() is called.
         
         Returns:
-            dict: Configuration validation status
+            Mapping[str, Any]: Read-only configuration validation status
         """
+        cached = self.__dict__.get("_validation")
+        if cached is not None:
+            return cached
+
+        errors = tuple(message for message, failed in (
+            # Check required API keys
+            (_E_GOOGLE_API_KEY, not self.GOOGLE_API_KEY),
+            (_E_PINECONE_API_KEY, not self.PINECONE_API_KEY and self.RAG_ENABLED),
+            (_E_PINECONE_ENVIRONMENT, not self.PINECONE_ENVIRONMENT and self.RAG_ENABLED),
+        ) if failed)
+
+        warnings = tuple(message for message, failed in (
+            (_W_SERPER_API_KEY, not self.SERPER_API_KEY and self.WEB_SEARCH_ENABLED),
+            # Check configuration values
+            (_W_GEMINI_TEMPERATURE, not 0 <= self.GEMINI_TEMPERATURE <= 2),
+            (_W_HSA_CONFIDENCE_THRESHOLD, not 0 <= self.HSA_CONFIDENCE_THRESHOLD <= 1),
+            (_W_RAG_SIMILARITY_THRESHOLD, not 0 <= self.RAG_SIMILARITY_THRESHOLD <= 1),
+        ) if failed)
+
         validation_result = {
-            "valid": True,
-            "errors": [],
-            "warnings": []
+            "valid": not errors,
+            "errors": errors,
+            "warnings": warnings
         }
-        
-        # Check required API keys
-        if not cls.GOOGLE_API_KEY:
-            validation_result["errors"].append("GOOGLE_API_KEY is required for LLM operations")
-            validation_result["valid"] = False
-            
-        if not cls.PINECONE_API_KEY and cls.RAG_ENABLED:
-            validation_result["errors"].append("PINECONE_API_KEY is required when RAG is enabled")
-            validation_result["valid"] = False
-            
-        if not cls.PINECONE_ENVIRONMENT and cls.RAG_ENABLED:
-            validation_result["errors"].append("PINECONE_ENVIRONMENT is required when RAG is enabled")
-            validation_result["valid"] = False
-
-        if not cls.SERPER_API_KEY and cls.WEB_SEARCH_ENABLED:
-            validation_result["warnings"].append("SERPER_API_KEY is recommended when web search is enabled")
-        
-        # Check configuration values
-        if cls.GEMINI_TEMPERATURE < 0 or cls.GEMINI_TEMPERATURE > 2:
-            validation_result["warnings"].append("GEMINI_TEMPERATURE should be between 0 and 2")
-            
-        if cls.HSA_CONFIDENCE_THRESHOLD < 0 or cls.HSA_CONFIDENCE_THRESHOLD > 1:
-            validation_result["warnings"].append("HSA_CONFIDENCE_THRESHOLD should be between 0 and 1")
-            
-        if cls.RAG_SIMILARITY_THRESHOLD < 0 or cls.RAG_SIMILARITY_THRESHOLD > 1:
-            validation_result["warnings"].append("RAG_SIMILARITY_THRESHOLD should be between 0 and 1")
-        
-        return validation_result
+        cached = MappingProxyType(validation_result)
+        self.__dict__["_validation"] = cached
+        return cached
     
-    @classmethod
-    def get_safe_config(cls) -> dict:
+    def get_safe_config(self) -> dict:
         """
         Get configuration with sensitive data masked
+
+        The masked configuration is built once and cached until reload() is
+        called; each call returns a shallow copy.
         
         Returns:
             dict: Safe configuration for logging
         """
+        cached = self.__dict__.get("_safe_config")
+        if cached is None:
+            cached = self.__dict__["_safe_config"] = self._build_safe_config()
+        return dict(cached)
+
+    def _build_safe_config(self) -> dict:
+        """Build the masked configuration dict"""
         return {
-            "gemini_model": cls.GEMINI_MODEL,
-            "gemini_temperature": cls.GEMINI_TEMPERATURE,
-            "gemini_max_tokens": cls.GEMINI_MAX_TOKENS,
-            "google_api_key_configured": bool(cls.GOOGLE_API_KEY),
-            "pinecone_api_key_configured": bool(cls.PINECONE_API_KEY),
-            "pinecone_environment": cls.PINECONE_ENVIRONMENT,
-            "pinecone_index_name": cls.PINECONE_INDEX_NAME,
-            "serper_api_key_configured": bool(cls.SERPER_API_KEY),
-            "web_search_enabled": cls.WEB_SEARCH_ENABLED,
-            "hsa_enabled": cls.HSA_ENABLED,
-            "hsa_confidence_threshold": cls.HSA_CONFIDENCE_THRESHOLD,
-            "rag_enabled": cls.RAG_ENABLED,
-            "rag_top_k": cls.RAG_TOP_K,
-            "rag_similarity_threshold": cls.RAG_SIMILARITY_THRESHOLD,
-            "ai_log_level": cls.AI_LOG_LEVEL
+            "gemini_model": self.GEMINI_MODEL,
+            "gemini_temperature": self.GEMINI_TEMPERATURE,
+            "gemini_max_tokens": self.GEMINI_MAX_TOKENS,
+            "google_api_key_configured": bool(self.GOOGLE_API_KEY),
+            "pinecone_api_key_configured": bool(self.PINECONE_API_KEY),
+            "pinecone_environment": self.PINECONE_ENVIRONMENT,
+            "pinecone_index_name": self.PINECONE_INDEX_NAME,
+            "serper_api_key_configured": bool(self.SERPER_API_KEY),
+            "web_search_enabled": self.WEB_SEARCH_ENABLED,
+            "hsa_enabled": self.HSA_ENABLED,
+            "hsa_confidence_threshold": self.HSA_CONFIDENCE_THRESHOLD,
+            "rag_enabled": self.RAG_ENABLED,
+            "rag_top_k": self.RAG_TOP_K,
+            "rag_similarity_threshold": self.RAG_SIMILARITY_THRESHOLD,
+            "ai_log_level": self.AI_LOG_LEVEL
         }
 
 
 # Global configuration instance
 ai_config = AIConfig()
-
-# Validate configuration on import
-config_validation = ai_config.validate_config()
-if not config_validation["valid"]:
-    logger.warning(f"AI Configuration validation failed: {config_validation['errors']}")
-if config_validation["warnings"]:
-    logger.warning(f"AI Configuration warnings: {config_validation['warnings']}")
-
-logger.info(f"AI Configuration loaded: {ai_config.get_safe_config()}")
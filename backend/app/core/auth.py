@@ -5,23 +5,83 @@ This module provides centralized authentication and authorization functions
 that can be used across different routers.
 """
 
+import hashlib
 import logging
-from fastapi import HTTPException, Depends, status
+import threading
+import time
+from typing import Optional
+from cachetools import TLRUCache
+from fastapi import HTTPException, Depends, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.services.auth_service import get_token_data
+from app.services.auth_service import decode_access_token, token_data_from_payload
 from app.models.user import UserModel
 
 logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
+_AGENT_ROLES = frozenset({"it_agent", "hr_agent"})
+_ADMIN_ROLE = "admin"
+
+# Decoded token cache: entries live for at most TOKEN_CACHE_TTL_SECONDS and never past the token's own exp
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 10000
+
+_token_cache = TLRUCache(
+    maxsize=TOKEN_CACHE_MAX_SIZE,
+    ttu=lambda _key, value, now: min(now + TOKEN_CACHE_TTL_SECONDS, value[1]),
+    timer=time.time,
+)
+_token_cache_lock = threading.Lock()
+
+
+def get_cached_token_data(token: str) -> Optional[dict]:
+    """
+    Get user data from a JWT token, reusing recently verified tokens
+
+    Only successful validations are cached, keyed on a hash of the token so raw
+    tokens are never kept in memory.
+
+    Args:
+        token: Encoded JWT token
+
+    Returns:
+        Optional[dict]: User data from token, or None if the token is invalid
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()[:32]
+
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        return cached[0]
+
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+
+    token_data = token_data_from_payload(payload)
+    if token_data is None:
+        return None
+
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)) and expires_at > time.time():
+        with _token_cache_lock:
+            _token_cache[key] = (token_data, expires_at)
+
+    return token_data
+
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> dict:
     """
     Get current user from JWT token
+
+    The decoded user is stored on request.state.user so any later lookup
+    within the same request reuses it without touching the token again.
     
     Args:
+        request: Incoming request
         credentials: HTTP Bearer token credentials
         
     Returns:
@@ -30,9 +90,13 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or expired
     """
+    current_user = getattr(request.state, "user", None)
+    if current_user is not None:
+        return current_user
+
     logger.debug("Extracting user from JWT token")
     
-    token_data = get_token_data(credentials.credentials)
+    token_data = get_cached_token_data(credentials.credentials)
     if token_data is None:
         logger.warning("Invalid authentication credentials provided")
         raise HTTPException(
@@ -41,61 +105,56 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    logger.debug(f"Successfully authenticated user: {token_data['username']}")
+    logger.debug("Successfully authenticated user: %s", token_data['username'])
+    request.state.user = token_data
     return token_data
 
 
-async def require_admin(
-    current_user: dict = Depends(get_current_user)
-) -> dict:
-    """
-    Verify that the current user has admin role
-    
-    Args:
-        current_user: Current authenticated user from get_current_user
-        
-    Returns:
-        dict: User information if authorized
-        
-    Raises:
-        HTTPException: If user is not an admin
+def require_roles(*roles: str, role_label: str):
     """
-    logger.debug(f"Checking admin role for user: {current_user['username']}")
-    
-    if current_user["role"] != "admin":
-        logger.warning(f"Non-admin user {current_user['username']} attempted to access admin endpoint")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Admin role required."
-        )
-    
-    logger.debug(f"Admin access granted for user: {current_user['username']}")
-    return current_user
+    Build a dependency that only admits users holding one of the given roles
 
+    The allowed roles are captured once in a frozenset, so each check is a
+    single hash lookup with no per-request allocation.
 
-async def require_agent(
-    current_user: dict = Depends(get_current_user)
-) -> dict:
-    """
-    Verify that the current user has agent role (IT or HR agent)
-    
     Args:
-        current_user: Current authenticated user from get_current_user
-        
+        *roles: Role names that are granted access
+        role_label: Human readable role name used in error and log messages
+
     Returns:
-        dict: User information if authorized
-        
+        Dependency callable returning the current user if authorized
+
     Raises:
-        HTTPException: If user is not an agent
+        HTTPException: From the dependency, if the user lacks an allowed role
     """
-    logger.debug(f"Checking agent role for user: {current_user['username']}")
-    
-    if current_user["role"] not in ["it_agent", "hr_agent"]:
-        logger.warning(f"Non-agent user {current_user['username']} attempted to access agent endpoint")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Agent role required."
-        )
-    
-    logger.debug(f"Agent access granted for user: {current_user['username']} ({current_user['role']})")
-    return current_user
+    allowed_roles = frozenset(roles)
+    detail = f"Access denied. {role_label.capitalize()} role required."
+
+    async def _require_roles(
+        current_user: dict = Depends(get_current_user)
+    ) -> dict:
+        if current_user["role"] not in allowed_roles:
+            logger.warning(
+                "Non-%s user %s attempted to access %s endpoint",
+                role_label, current_user['username'], role_label
+            )
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+            )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s access granted for user: %s (%s)",
+                role_label.capitalize(), current_user['username'], current_user['role']
+            )
+        return current_user
+
+    return _require_roles
+
+
+# Verify that the current user has admin role
+require_admin = require_roles(_ADMIN_ROLE, role_label="admin")
+
+# Verify that the current user has agent role (IT or HR agent)
+require_agent = require_roles(*_AGENT_ROLES, role_label="agent")
@@ -1,10 +1,19 @@
-import os
+import logging
+import re
+from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient
-from dotenv import load_dotenv
-from urllib.parse import urlparse
+from app.core.env import get_env
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Connection pool bounds for the shared client. Every request and background job
+# uses this one client, so the pool must cover peak concurrent queries; a few
+# connections are kept warm so bursts don't pay the connection handshake.
+DEFAULT_MAX_POOL_SIZE = 100
+DEFAULT_MIN_POOL_SIZE = 10
+
+# Captures the database path segment of a MongoDB URI in a single scan
+_DB_NAME_RE = re.compile(r"^mongodb(?:\+srv)?://[^/]+/([^?]+)")
 
 
 class Database:
@@ -16,19 +25,28 @@ class Database:
 db = Database()
 
 
-async def ping_mongodb(uri: str = None, timeout: int = 10) -> dict:
+def _database_name_from_uri(uri: str) -> str:
+    """Extract the database name from a MongoDB URI, defaulting to helpdesk_db"""
+    match = _DB_NAME_RE.match(uri)
+    return match.group(1) if match else "helpdesk_db"
+
+
+async def ping_mongodb(
+    uri: str = None, timeout: int = 10, client: Optional[AsyncIOMotorClient] = None
+) -> dict:
     """
     Ping MongoDB to test connection and return detailed status
 
     Args:
         uri: MongoDB URI (if None, uses environment variable)
         timeout: Connection timeout in seconds
+        client: Existing client to ping; a temporary client is created (and closed) if None
 
     Returns:
         dict with connection status and details
     """
     if uri is None:
-        uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/helpdesk_db")
+        uri = get_env("MONGODB_URI", "mongodb://localhost:27017/helpdesk_db")
 
     result = {
         "uri": uri,
@@ -38,60 +56,62 @@ async def ping_mongodb(uri: str = None, timeout: int = 10) -> dict:
         "ping_response": None,
     }
 
+    owns_client = client is None
     try:
         # Parse URI to extract database name
-        parsed_uri = urlparse(uri)
-        if parsed_uri.path and len(parsed_uri.path) > 1:
-            result["database_name"] = parsed_uri.path[1:].split("?")[0]
-        else:
-            result["database_name"] = "helpdesk_db"
+        result["database_name"] = _database_name_from_uri(uri)
 
-        # Create client with timeout
-        client = AsyncIOMotorClient(uri, serverSelectionTimeoutMS=timeout * 1000)
+        # Create client with timeout unless the caller supplied one
+        if owns_client:
+            client = AsyncIOMotorClient(uri, serverSelectionTimeoutMS=timeout * 1000)
 
         # Test connection with ping
         ping_response = await client.admin.command("ping")
         result["ping_response"] = ping_response
         result["connected"] = ping_response.get("ok") == 1.0
 
-        # Close the test client
-        client.close()
-
     except Exception as e:
         result["error"] = str(e)
         result["connected"] = False
 
+    finally:
+        # Close the test client only if we created it
+        if owns_client and client is not None:
+            client.close()
+
     return result
 
 
 async def connect_to_mongo():
     """Create database connection"""
-    mongodb_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/helpdesk_db")
-
-    # First ping to check connection
-    ping_result = await ping_mongodb(mongodb_uri)
-    if not ping_result["connected"]:
-        raise ConnectionError(f"Cannot connect to MongoDB: {ping_result['error']}")
+    mongodb_uri = get_env("MONGODB_URI", "mongodb://localhost:27017/helpdesk_db")
 
-    db.client = AsyncIOMotorClient(mongodb_uri)
-    db.database = db.client[ping_result["database_name"]]
+    # Single client used for both the connectivity check and the application
+    client = AsyncIOMotorClient(
+        mongodb_uri,
+        serverSelectionTimeoutMS=10000,
+        maxPoolSize=int(get_env("MONGODB_MAX_POOL_SIZE", str(DEFAULT_MAX_POOL_SIZE))),
+        minPoolSize=int(get_env("MONGODB_MIN_POOL_SIZE", str(DEFAULT_MIN_POOL_SIZE))),
+    )
+    database_name = _database_name_from_uri(mongodb_uri)
 
-    # Final verification
     try:
-        await db.client.admin.command("ping")
-        print(
-            f"Successfully connected to MongoDB database: {ping_result['database_name']}"
-        )
+        await client.admin.command("ping")
     except Exception as e:
-        print(f"Failed to connect to MongoDB: {e}")
-        raise
+        client.close()
+        logger.exception("Failed to connect to MongoDB")
+        raise ConnectionError(f"Cannot connect to MongoDB: {e}") from e
+
+    db.client = client
+    db.database = client[database_name]
+    logger.info("Successfully connected to MongoDB database: %s", database_name)
 
 
 async def close_mongo_connection():
     """Close database connection"""
     if db.client:
         db.client.close()
-        print("Disconnected from MongoDB")
+        logger.info("Disconnected from MongoDB")
 
 
 def get_database():
@@ -0,0 +1,45 @@
+"""
+Environment Module
+
+This module loads environment configuration once per process. The .env file is
+parsed a single time, exported to the process environment (like load_dotenv) and
+the resulting read-only mapping is shared by every module that needs
+configuration values.
+"""
+
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+from dotenv import dotenv_values
+
+
+@lru_cache(maxsize=1)
+def load_env() -> Mapping[str, str]:
+    """
+    Load environment variables from .env and the process environment
+
+    Values already present in the process environment take precedence over
+    the .env file, matching the behaviour of dotenv.load_dotenv().
+
+    Returns:
+        Mapping[str, str]: Read-only mapping of environment variables
+    """
+    for key, value in dotenv_values().items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    return MappingProxyType(dict(os.environ))
+
+
+def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Get a single environment variable from the cached environment
+
+    Args:
+        key: Environment variable name
+        default: Value returned when the variable is not set
+
+    Returns:
+        Optional[str]: Environment variable value or default
+    """
+    return load_env().get(key, default)
@@ -0,0 +1,53 @@
+"""
+OpenAPI helpers for the helpdesk API.
+
+Some endpoints parse their JSON body in a dependency instead of declaring it
+as a body parameter, so FastAPI never registers the body model's schema. This
+module builds those request body schemas and publishes the models they refer
+to under components/schemas, so every $ref in the spec resolves.
+"""
+
+from typing import Any, Dict, Type
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+_COMPONENTS_REF_TEMPLATE = "#/components/schemas/{model}"
+
+# Nested model schemas referenced by request bodies built with request_body_schema
+_extra_component_schemas: Dict[str, Dict[str, Any]] = {}
+
+
+def request_body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build the OpenAPI request body schema for a model parsed by a dependency
+
+    Args:
+        model: Request body model
+
+    Returns:
+        dict: JSON schema for the body; nested models are referenced from
+        components/schemas and registered for install_openapi_components
+    """
+    schema = model.model_json_schema(ref_template=_COMPONENTS_REF_TEMPLATE)
+    _extra_component_schemas.update(schema.pop("$defs", {}))
+    return schema
+
+
+def install_openapi_components(app: FastAPI) -> None:
+    """
+    Make the app's OpenAPI spec include the schemas registered by request_body_schema
+
+    Args:
+        app: Application whose openapi() is wrapped
+    """
+    default_openapi = app.openapi
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema is None:
+            schema = default_openapi()
+            schemas = schema.setdefault("components", {}).setdefault("schemas", {})
+            for name, component in _extra_component_schemas.items():
+                schemas.setdefault(name, component)
+        return app.openapi_schema
+
+    app.openapi = openapi
@@ -0,0 +1,59 @@
+"""
+Response classes for the helpdesk API.
+
+This module provides an orjson-backed JSON response used as the application's
+default response class, and helpers for serving payloads that are serialized
+once ahead of time.
+"""
+
+from typing import Any, Dict
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse, Response
+
+
+def _encode(obj: Any) -> Any:
+    """Fallback for types orjson does not handle natively (datetimes and enums are native)"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (C-level encoding, native datetime support)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_encode, option=orjson.OPT_NON_STR_KEYS)
+
+
+class PreSerializedJSONResponse(Response):
+    """JSON response whose body is already-encoded bytes"""
+
+    media_type = "application/json"
+
+
+def json_object_tail(fields: Dict[str, Any]) -> bytes:
+    """
+    Serialize the static trailing fields of a JSON object once
+
+    Args:
+        fields: Fields that are the same for every response
+
+    Returns:
+        bytes: The serialized fields without the opening brace, for join_json_object
+    """
+    return orjson.dumps(fields, default=_encode)[1:]
+
+
+def join_json_object(fields: Dict[str, Any], tail: bytes) -> bytes:
+    """
+    Serialize per-request fields and append a pre-serialized tail
+
+    Args:
+        fields: Non-empty per-request fields, which come first in the object
+        tail: Output of json_object_tail for the static fields
+
+    Returns:
+        bytes: The complete JSON object
+    """
+    return orjson.dumps(fields, default=_encode)[:-1] + b"," + tail
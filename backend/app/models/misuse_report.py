@@ -5,12 +5,17 @@ Defines the data model for misuse detection reports stored in MongoDB.
 Based on the PRD schema for misuse_reports collection.
 """
 
+import re
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from bson import ObjectId
 from enum import Enum
 
+# Module-level bindings used by the bulk ObjectId conversions below
+_OID = ObjectId
+_OID_RE = re.compile(r"[0-9a-fA-F]{24}")
+
 
 class MisuseType(str, Enum):
     """Enumeration of misuse types"""
@@ -60,13 +65,7 @@ class MisuseReportModel(BaseModel):
     ai_analysis_metadata: AIAnalysisMetadata = Field(..., description="AI analysis metadata")
     reviewed_at: Optional[datetime] = Field(None, description="When the report was reviewed by admin")
     
-    class Config:
-        """Pydantic configuration"""
-        populate_by_name = True
-        json_encoders = {
-            ObjectId: str,
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(populate_by_name=True)
         
     @classmethod
     def from_mongo(cls, data: Dict[str, Any]) -> "MisuseReportModel":
@@ -85,10 +84,10 @@ class MisuseReportModel(BaseModel):
             data["user_id"] = str(data["user_id"])
         
         # Convert ticket_ids in evidence_data to strings
-        if "evidence_data" in data and "ticket_ids" in data["evidence_data"]:
-            data["evidence_data"]["ticket_ids"] = [
-                str(tid) for tid in data["evidence_data"]["ticket_ids"]
-            ]
+        evidence = data.get("evidence_data")
+        ticket_ids = evidence.get("ticket_ids") if evidence else None
+        if ticket_ids:
+            evidence["ticket_ids"] = list(map(str, ticket_ids))
         
         return cls(**data)
     
@@ -103,15 +102,16 @@ class MisuseReportModel(BaseModel):
         
         # Convert string IDs back to ObjectIds for MongoDB
         if "_id" in data and data["_id"]:
-            data["_id"] = ObjectId(data["_id"])
+            data["_id"] = _OID(data["_id"])
         if "user_id" in data:
-            data["user_id"] = ObjectId(data["user_id"])
+            data["user_id"] = _OID(data["user_id"])
         
-        # Convert ticket_ids in evidence_data to ObjectIds
-        if "evidence_data" in data and "ticket_ids" in data["evidence_data"]:
-            data["evidence_data"]["ticket_ids"] = [
-                ObjectId(tid) for tid in data["evidence_data"]["ticket_ids"] if tid
-            ]
+        # Convert ticket_ids in evidence_data to ObjectIds, skipping malformed IDs
+        evidence = data.get("evidence_data")
+        ticket_ids = evidence.get("ticket_ids") if evidence else None
+        if ticket_ids:
+            match = _OID_RE.fullmatch
+            evidence["ticket_ids"] = [_OID(tid) for tid in ticket_ids if tid and match(tid)]
         
         return data
 
@@ -137,6 +137,7 @@ class MisuseReportResponseSchema(BaseModel):
     action_taken: Optional[str] = Field(None, description="Action taken by admin (if any)")
     ai_analysis_metadata: AIAnalysisMetadata = Field(..., description="AI analysis metadata")
     reviewed_at: Optional[datetime] = Field(None, description="When the report was reviewed by admin")
+    user_name: Optional[str] = Field(None, description="Username of the flagged user (list responses)")
 
 
 class MisuseReportUpdateSchema(BaseModel):
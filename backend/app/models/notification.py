@@ -6,7 +6,8 @@ and database operations.
 """
 
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from bson import ObjectId
 from app.schemas.notification import NotificationType
@@ -21,6 +22,11 @@ class NotificationModel:
     This class provides methods for creating, updating, and managing
     notification documents in MongoDB.
     """
+
+    __slots__ = (
+        "_id", "user_id", "title", "message", "type",
+        "data", "read", "created_at", "read_at", "notification_id"
+    )
     
     def __init__(
         self,
@@ -57,7 +63,7 @@ class NotificationModel:
         self.type = type
         self.data = data or {}
         self.read = read
-        self.created_at = created_at or datetime.utcnow()
+        self.created_at = created_at or datetime.now(timezone.utc)
         self.read_at = read_at
         
         # Auto-generate notification ID if not provided
@@ -66,7 +72,7 @@ class NotificationModel:
         else:
             self.notification_id = self._generate_notification_id()
         
-        logger.debug(f"Created notification model: {self.notification_id} for user {self.user_id}")
+        logger.debug("Created notification model: %s for user %s", self.notification_id, self.user_id)
     
     def _generate_notification_id(self) -> str:
         """
@@ -75,14 +81,11 @@ class NotificationModel:
         Returns:
             str: Unique notification ID in format "NOT-<timestamp>-<random>"
         """
-        import random
-        import string
-        
         timestamp = int(self.created_at.timestamp())
-        random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+        random_suffix = os.urandom(3).hex().upper()
         notification_id = f"NOT-{timestamp}-{random_suffix}"
         
-        logger.debug(f"Generated notification ID: {notification_id}")
+        logger.debug("Generated notification ID: %s", notification_id)
         return notification_id
     
     def mark_as_read(self) -> None:
@@ -91,10 +94,10 @@ class NotificationModel:
         """
         if not self.read:
             self.read = True
-            self.read_at = datetime.utcnow()
-            logger.info(f"Marked notification {self.notification_id} as read")
+            self.read_at = datetime.now(timezone.utc)
+            logger.info("Marked notification %s as read", self.notification_id)
         else:
-            logger.debug(f"Notification {self.notification_id} already marked as read")
+            logger.debug("Notification %s already marked as read", self.notification_id)
     
     def mark_as_unread(self) -> None:
         """
@@ -103,9 +106,9 @@ class NotificationModel:
         if self.read:
             self.read = False
             self.read_at = None
-            logger.info(f"Marked notification {self.notification_id} as unread")
+            logger.info("Marked notification %s as unread", self.notification_id)
         else:
-            logger.debug(f"Notification {self.notification_id} already marked as unread")
+            logger.debug("Notification %s already marked as unread", self.notification_id)
     
     def update_data(self, new_data: Dict[str, Any]) -> None:
         """
@@ -118,12 +121,15 @@ class NotificationModel:
             self.data = {}
         
         self.data.update(new_data)
-        logger.debug(f"Updated data for notification {self.notification_id}")
+        logger.debug("Updated data for notification %s", self.notification_id)
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the notification model to a dictionary for MongoDB storage
-        
+
+        The returned dict shares self.data by reference; callers that need to
+        mutate it independently should copy it first.
+
         Returns:
             dict: Dictionary representation of the notification
         """
@@ -142,7 +148,7 @@ class NotificationModel:
         if self._id:
             doc["_id"] = self._id
         
-        logger.debug(f"Converted notification {self.notification_id} to dict")
+        logger.debug("Converted notification %s to dict", self.notification_id)
         return doc
     
     @classmethod
@@ -175,11 +181,11 @@ class NotificationModel:
                 read_at=doc.get("read_at")
             )
             
-            logger.debug(f"Created notification model from dict: {notification.notification_id}")
+            logger.debug("Created notification model from dict: %s", notification.notification_id)
             return notification
             
         except Exception as e:
-            logger.error(f"Error creating notification model from dict: {str(e)}")
+            logger.error("Error creating notification model from dict: %s", e)
             raise ValueError(f"Invalid notification document: {str(e)}")
     
     def __str__(self) -> str:
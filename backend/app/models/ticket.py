@@ -1,18 +1,40 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, List, Optional
+import bson
 from bson import ObjectId
+import base64
+import os
 import time
-import random
-import string
 import logging
 from app.schemas.ticket import TicketUrgency, TicketStatus, TicketDepartment
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+_bson_encode = bson.encode
+
 
 class TicketModel:
     """Ticket model for MongoDB operations"""
 
+    __slots__ = (
+        "_id",
+        "ticket_id",
+        "title",
+        "description",
+        "urgency",
+        "status",
+        "department",
+        "assignee_id",
+        "user_id",
+        "created_at",
+        "updated_at",
+        "closed_at",
+        "misuse_flag",
+        "feedback",
+        "user_info",
+    )
+
     def __init__(
         self,
         title: str,
@@ -35,29 +57,39 @@ class TicketModel:
         self.ticket_id = ticket_id or self._generate_ticket_id()
         self.title = title
         self.description = description
+        # Normalize raw strings to enum members once so to_dict can read .value directly
+        if not isinstance(urgency, TicketUrgency):
+            urgency = TicketUrgency(urgency)
+        if not isinstance(status, TicketStatus):
+            status = TicketStatus(status)
+        if department is not None and not isinstance(department, TicketDepartment):
+            department = TicketDepartment(department)
         self.urgency = urgency
         self.status = status
         self.department = department
         self.assignee_id = assignee_id
         self.user_id = user_id
-        self.created_at = created_at or datetime.now(timezone.utc)
-        self.updated_at = updated_at or datetime.now(timezone.utc)
+        if created_at is None or updated_at is None:
+            now = datetime.now(_UTC)
+            if created_at is None:
+                created_at = now
+            if updated_at is None:
+                updated_at = now
+        self.created_at = created_at
+        self.updated_at = updated_at
         self.closed_at = closed_at
         self.misuse_flag = misuse_flag
         self.feedback = feedback
         self.user_info = user_info  # For agents/admins to see user details
 
-        logger.info(f"TicketModel initialized with ticket_id: {self.ticket_id}")
-
     @staticmethod
     def _generate_ticket_id() -> str:
         """Generate unique ticket ID in format TKT-<timestamp>-<random>"""
         timestamp = int(time.time())
-        random_suffix = "".join(
-            random.choices(string.ascii_uppercase + string.digits, k=6)
-        )
+        # Base32 output is uppercase letters and digits, so one urandom call yields the suffix
+        random_suffix = base64.b32encode(os.urandom(4))[:6].decode("ascii")
         ticket_id = f"TKT-{timestamp}-{random_suffix}"
-        logger.debug(f"Generated ticket_id: {ticket_id}")
+        logger.debug("Generated ticket_id: %s", ticket_id)
         return ticket_id
 
     def to_dict(self) -> dict:
@@ -66,21 +98,9 @@ class TicketModel:
             "ticket_id": self.ticket_id,
             "title": self.title,
             "description": self.description,
-            "urgency": (
-                self.urgency.value
-                if isinstance(self.urgency, TicketUrgency)
-                else self.urgency
-            ),
-            "status": (
-                self.status.value
-                if isinstance(self.status, TicketStatus)
-                else self.status
-            ),
-            "department": (
-                self.department.value
-                if isinstance(self.department, TicketDepartment)
-                else self.department
-            ),
+            "urgency": self.urgency.value,
+            "status": self.status.value,
+            "department": self.department.value if self.department else None,
             "assignee_id": self.assignee_id,
             "user_id": self.user_id,
             "created_at": self.created_at,
@@ -94,34 +114,59 @@ class TicketModel:
         if self._id is not None:
             data["_id"] = self._id
 
-        logger.debug(f"TicketModel.to_dict() for ticket_id: {self.ticket_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TicketModel.to_dict() for ticket_id: %s", self.ticket_id)
         return data
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "TicketModel":
-        """Create model from MongoDB document"""
-        logger.debug(
-            f"Creating TicketModel from dict for ticket_id: {data.get('ticket_id', 'unknown')}"
-        )
+    def to_raw_bson(self) -> bytes:
+        """
+        Encode model as a BSON document for inserts wrapped in RawBSONDocument
+
+        pymongo cannot add an _id to raw BSON, so one is assigned here when the
+        model has none, keeping result.inserted_id populated.
+        """
+        if self._id is None:
+            self._id = ObjectId()
+        return _bson_encode(self.to_dict())
+
+    def to_response_dict(self) -> dict:
+        """
+        Convert model to the field set of TicketSchema for API responses
+
+        Unlike to_dict (the Mongo write path), ObjectIds are stringified here so
+        the response encoder never has to handle them.
+        """
+        return {
+            "id": str(self._id),
+            "ticket_id": self.ticket_id,
+            "title": self.title,
+            "description": self.description,
+            "urgency": self.urgency,
+            "status": self.status,
+            "department": self.department,
+            "assignee_id": str(self.assignee_id) if self.assignee_id else None,
+            "user_id": str(self.user_id),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "closed_at": self.closed_at,
+            "misuse_flag": self.misuse_flag,
+            "feedback": self.feedback,
+        }
 
+    @classmethod
+    def _from_doc(cls, data: dict) -> "TicketModel":
+        """Map a MongoDB document's fields onto a new model"""
+        urgency = data.get("urgency")
+        status = data.get("status")
+        department = data.get("department")
         return cls(
             _id=data.get("_id"),
             ticket_id=data.get("ticket_id"),
             title=data["title"],
             description=data["description"],
-            urgency=(
-                TicketUrgency(data["urgency"])
-                if data.get("urgency")
-                else TicketUrgency.MEDIUM
-            ),
-            status=(
-                TicketStatus(data["status"])
-                if data.get("status")
-                else TicketStatus.OPEN
-            ),
-            department=(
-                TicketDepartment(data["department"]) if data.get("department") else None
-            ),
+            urgency=TicketUrgency(urgency) if urgency else TicketUrgency.MEDIUM,
+            status=TicketStatus(status) if status else TicketStatus.OPEN,
+            department=TicketDepartment(department) if department else None,
             assignee_id=data.get("assignee_id"),
             user_id=data["user_id"],
             created_at=data.get("created_at"),
@@ -131,45 +176,73 @@ class TicketModel:
             feedback=data.get("feedback"),
         )
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "TicketModel":
+        """Create model from MongoDB document"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Creating TicketModel from dict for ticket_id: %s",
+                data.get("ticket_id", "unknown"),
+            )
+
+        return cls._from_doc(data)
+
+    @classmethod
+    def from_dicts(cls, docs: Iterable[dict]) -> List["TicketModel"]:
+        """Create models from a batch of MongoDB documents (e.g. a cursor page)"""
+        from_doc = cls._from_doc
+        tickets = [from_doc(data) for data in docs]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Created %d TicketModels from dicts", len(tickets))
+        return tickets
+
     def update_status(self, new_status: TicketStatus):
         """Update ticket status with logging and timestamp"""
         old_status = self.status
         self.status = new_status
-        self.updated_at = datetime.now(timezone.utc)
+        now = datetime.now(_UTC)
+        self.updated_at = now
 
         # Set closed_at when status changes to closed
         if new_status == TicketStatus.CLOSED:
-            self.closed_at = datetime.now(timezone.utc)
-            logger.info(f"Ticket {self.ticket_id} closed at {self.closed_at}")
+            self.closed_at = now
+            logger.info("Ticket %s closed at %s", self.ticket_id, self.closed_at)
 
         logger.info(
-            f"Ticket {self.ticket_id} status changed from {old_status.value} to {new_status.value}"
+            "Ticket %s status changed from %s to %s",
+            self.ticket_id,
+            old_status.value,
+            new_status.value,
         )
 
     def update_department(self, new_department: TicketDepartment):
         """Update ticket department with logging"""
         old_department = self.department
         self.department = new_department
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = datetime.now(_UTC)
         logger.info(
-            f"Ticket {self.ticket_id} department changed from {old_department} to {new_department.value}"
+            "Ticket %s department changed from %s to %s",
+            self.ticket_id,
+            old_department.value if old_department else None,
+            new_department.value,
         )
 
     def assign_to_agent(self, agent_id: ObjectId):
         """Assign ticket to an agent"""
         self.assignee_id = agent_id
         self.status = TicketStatus.ASSIGNED
-        self.updated_at = datetime.now(timezone.utc)
-        logger.info(f"Ticket {self.ticket_id} assigned to agent {agent_id}")
+        self.updated_at = datetime.now(_UTC)
+        logger.info("Ticket %s assigned to agent %s", self.ticket_id, agent_id)
 
     def flag_misuse(self, flag: bool = True):
         """Flag or unflag ticket for misuse"""
         self.misuse_flag = flag
-        self.updated_at = datetime.now(timezone.utc)
-        logger.warning(f"Ticket {self.ticket_id} misuse flag set to {flag}")
+        self.updated_at = datetime.now(_UTC)
+        logger.warning("Ticket %s misuse flag set to %s", self.ticket_id, flag)
 
     def add_feedback(self, feedback: str):
         """Add post-resolution feedback"""
         self.feedback = feedback
-        self.updated_at = datetime.now(timezone.utc)
-        logger.info(f"Feedback added to ticket {self.ticket_id}")
+        self.updated_at = datetime.now(_UTC)
+        logger.info("Feedback added to ticket %s", self.ticket_id)
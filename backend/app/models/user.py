@@ -1,12 +1,38 @@
+import sys
 from datetime import datetime, timezone
+from functools import partial
 from typing import Optional
 from bson import ObjectId
 from app.schemas.user import UserRole
 
+_utc_now = partial(datetime.now, timezone.utc)
+
+# UserRole is a str Enum, so each member and its value are the same dict key;
+# these lookups accept either form
+
+# Role -> stored string value, used by to_dict
+_USER_ROLE_VAL = {role: role.value for role in UserRole}
+
+# Role -> UserRole member, used by from_dict
+_USER_ROLE_CLS = {role.value: role for role in UserRole}
+
 
 class UserModel:
     """User model for MongoDB operations"""
 
+    __slots__ = (
+        "_id",
+        "username",
+        "email",
+        "password_hash",
+        "role",
+        "is_active",
+        "created_at",
+        "updated_at",
+        "last_login",
+        "rate_limit_reset",
+    )
+
     def __init__(
         self,
         username: str,
@@ -26,8 +52,14 @@ class UserModel:
         self.password_hash = password_hash
         self.role = role
         self.is_active = is_active
-        self.created_at = created_at or datetime.now(timezone.utc)
-        self.updated_at = updated_at or datetime.now(timezone.utc)
+        if created_at is None or updated_at is None:
+            now = _utc_now()
+            if created_at is None:
+                created_at = now
+            if updated_at is None:
+                updated_at = now
+        self.created_at = created_at
+        self.updated_at = updated_at
         self.last_login = last_login
         self.rate_limit_reset = rate_limit_reset
 
@@ -37,7 +69,7 @@ class UserModel:
             "username": self.username,
             "email": self.email,
             "password_hash": self.password_hash,
-            "role": self.role.value,
+            "role": _USER_ROLE_VAL.get(self.role, self.role),
             "is_active": self.is_active,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
@@ -54,12 +86,17 @@ class UserModel:
     @classmethod
     def from_dict(cls, data: dict) -> "UserModel":
         """Create model from MongoDB document"""
+        role = _USER_ROLE_CLS.get(data["role"])
+        if role is None:
+            # Unknown values still raise the usual ValueError
+            role = UserRole(data["role"])
         return cls(
             _id=data.get("_id"),
-            username=data["username"],
-            email=data["email"],
+            # Low-cardinality identifiers repeat across ticket/user lists; share one str each
+            username=sys.intern(data["username"]),
+            email=sys.intern(data["email"]),
             password_hash=data["password_hash"],
-            role=UserRole(data["role"]),
+            role=role,
             is_active=data.get("is_active", True),
             created_at=data.get("created_at"),
             updated_at=data.get("updated_at"),
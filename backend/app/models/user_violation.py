@@ -5,12 +5,15 @@ Tracks users who attempt to create tickets with inappropriate content.
 This helps identify repeat offenders and potential misuse patterns.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from bson import ObjectId
 from enum import Enum
 
+_utc_now = partial(datetime.now, timezone.utc)
+
 
 class ViolationType(str, Enum):
     """Types of content violations"""
@@ -40,24 +43,30 @@ class UserViolationModel(BaseModel):
     attempted_description: str = Field(..., description="Description of the attempted ticket")
     detection_reason: str = Field(..., description="Reason why content was flagged")
     detection_confidence: float = Field(..., description="AI confidence score (0.0-1.0)")
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow(), description="When violation was recorded")
+    created_at: datetime = Field(default_factory=_utc_now, description="When violation was recorded")
     admin_reviewed: bool = Field(default=False, description="Whether admin has reviewed this violation")
     action_taken: Optional[str] = Field(None, description="Action taken by admin")
     
-    class Config:
-        populate_by_name = True
-        json_encoders = {
-            ObjectId: str,
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(populate_by_name=True)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary for MongoDB storage"""
-        data = self.model_dump(by_alias=True, exclude_none=True)
+        data = {
+            "user_id": self.user_id,
+            "violation_type": self.violation_type.value,
+            "severity": self.severity.value,
+            "attempted_title": self.attempted_title,
+            "attempted_description": self.attempted_description,
+            "detection_reason": self.detection_reason,
+            "detection_confidence": self.detection_confidence,
+            "created_at": self.created_at,
+            "admin_reviewed": self.admin_reviewed,
+        }
+        # Optional fields are omitted rather than stored as null
+        if self.action_taken is not None:
+            data["action_taken"] = self.action_taken
         if self.id:
             data["_id"] = ObjectId(self.id)
-        elif "_id" in data:
-            del data["_id"]
         return data
     
     @classmethod
@@ -5,33 +5,112 @@ Provides admin-only endpoints for system management including misuse detection,
 reports management, manual job triggers, and system health monitoring.
 """
 
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
+import operator
+import time
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
+from cachetools import TTLCache
+from pydantic import TypeAdapter
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, UploadFile, File, Form, Request, Response
 from fastapi.security import HTTPBearer
 from app.core.auth import require_admin
+from app.core.responses import ORJSONResponse
 from app.services.scheduler_service import scheduler_service
 from app.services.misuse_reports_service import misuse_reports_service
 from app.services.analytics_service import analytics_service
 from app.services.user_service import user_service
 from app.services.document_service import document_service
 from app.services.user_violation_service import user_violation_service
-from app.models.misuse_report import MisuseReportResponseSchema
+from app.services.trending_topics_cache import trending_topics_cache_service
+from app.models.misuse_report import (
+    AIAnalysisMetadata, EvidenceData, MisuseReportResponseSchema, MisuseType, SeverityLevel
+)
 from app.models.user_violation import (
+    UserViolationModel,
     UserViolationResponseSchema,
     UserViolationSummarySchema
 )
-from app.schemas.document import DocumentCategory, DocumentUploadResponse, KnowledgeBaseStats
+from app.schemas.document import DocumentCategory, DocumentUploadResponse, DocumentProcessingStatus, KnowledgeBaseStats
 from app.core.database import ping_mongodb
 from app.services.ai.startup import health_check as ai_health_check, get_ai_services_status
 from app.services.webhook_service import webhook_health_check
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/admin", tags=["admin"])
+router = APIRouter(prefix="/admin", tags=["admin"], default_response_class=ORJSONResponse)
 security = HTTPBearer()
 
+# Required misuse report fields, extracted in one C-level call per report, and
+# the response keys they map to (the stored _id is returned as id)
+_REPORT_FIELDS = operator.itemgetter(
+    "_id", "user_id", "detection_date", "misuse_type", "severity_level",
+    "evidence_data", "admin_reviewed", "ai_analysis_metadata", "user_name"
+)
+_REPORT_RESPONSE_KEYS = (
+    "id", "user_id", "detection_date", "misuse_type", "severity_level",
+    "evidence_data", "admin_reviewed", "ai_analysis_metadata", "user_name"
+)
+
+class TimeGranularity(str, Enum):
+    """Bucket size for time-series analytics"""
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+# Serializes a whole list of violations in one pass instead of a model_dump() per item
+_VIOLATIONS_ADAPTER = TypeAdapter(List[UserViolationModel])
+
+# Analytics change on the order of minutes and are the same for every admin, so
+# service results are shared (keyed by query parameters, never by user)
+_ANALYTICS_CACHE_TTL_SECONDS = 300
+_analytics_cache: TTLCache = TTLCache(maxsize=128, ttl=_ANALYTICS_CACHE_TTL_SECONDS)
+
+
+async def _cached_analytics(
+    key: Tuple[Any, ...],
+    compute: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Return a cached analytics result, computing and storing it on a miss
+
+    Args:
+        key: Cache key made of the analytics name and its parameters
+        compute: Zero-argument coroutine function producing the result
+
+    Returns:
+        Dict[str, Any]: Analytics result (shared; callers must not mutate it)
+    """
+    result = _analytics_cache.get(key)
+    if result is None:
+        result = await compute()
+        _analytics_cache[key] = result
+    return result
+
+
+# Last formatted UTC timestamp, keyed by the whole second it was formatted for
+_timestamp_cache = {"second": -1, "iso": ""}
+
+
+def _now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string at one-second resolution
+
+    The formatted string is reused for every call within the same second.
+
+    Returns:
+        str: Current UTC timestamp, e.g. "2024-01-01T12:00:00+00:00"
+    """
+    second = int(time.time())
+    if _timestamp_cache["second"] != second:
+        _timestamp_cache["iso"] = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _timestamp_cache["second"] = second
+    return _timestamp_cache["iso"]
+
 
 @router.post("/trigger-misuse-detection", status_code=status.HTTP_200_OK)
 async def trigger_manual_misuse_detection(
@@ -52,12 +131,12 @@ async def trigger_manual_misuse_detection(
         Dict containing job execution results
     """
     try:
-        logger.info(f"Admin {current_user['username']} triggered manual misuse detection")
+        logger.info("Admin %s triggered manual misuse detection", current_user['username'])
 
         # Trigger the manual misuse detection job
         result = await scheduler_service.trigger_manual_misuse_detection(window_hours)
 
-        logger.info(f"Manual misuse detection completed for admin {current_user['username']}")
+        logger.info("Manual misuse detection completed for admin %s", current_user['username'])
         return {
             "message": "Misuse detection job completed",
             "triggered_by": current_user["username"],
@@ -65,7 +144,7 @@ async def trigger_manual_misuse_detection(
         }
         
     except Exception as e:
-        logger.error(f"Error in manual misuse detection trigger: {str(e)}")
+        logger.error("Error in manual misuse detection trigger: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to trigger misuse detection: {str(e)}"
@@ -74,88 +153,71 @@ async def trigger_manual_misuse_detection(
 
 @router.get("/misuse-reports")
 async def get_misuse_reports(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
     limit: int = Query(20, ge=1, le=100, description="Number of reports per page"),
     unreviewed_only: bool = Query(False, description="Show only unreviewed reports"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = Query(False, description="Count all matching reports (slower)"),
     current_user: dict = Depends(require_admin)
 ) -> Dict[str, Any]:
     """
     Get paginated list of misuse reports for admin dashboard.
     
     Args:
-        page: Page number (1-based)
+        page: Page number (1-based), used when no cursor is given
         limit: Number of reports per page
         unreviewed_only: If True, show only unreviewed reports
+        cursor: Opaque cursor returned as next_cursor by the previous page
+        include_total: If True, include total_count (None otherwise)
         current_user: Current authenticated admin user
         
     Returns:
         Paginated list of misuse reports
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting misuse reports - Page: {page}, Limit: {limit}")
-        
-        if unreviewed_only:
-            # Get only unreviewed reports
-            reports = await misuse_reports_service.get_all_unreviewed_reports()
-            total_count = len(reports)
-            unreviewed_count = total_count
-
-            # Apply pagination
-            start_idx = (page - 1) * limit
-            end_idx = start_idx + limit
-            paginated_reports = reports[start_idx:end_idx]
-        else:
-            # Get all reports (both reviewed and unreviewed) with pagination
-            result = await misuse_reports_service.get_all_reports(page, limit)
-            paginated_reports = result["reports"]
-            total_count = result["total_count"]
-            unreviewed_count = result["unreviewed_count"]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Admin %s requesting misuse reports - Page: %s, Limit: %s", current_user['username'], page, limit)
+
+        try:
+            result = await misuse_reports_service.get_reports_page(
+                limit=limit,
+                cursor=cursor,
+                unreviewed_only=unreviewed_only,
+                page=page,
+                include_total=include_total,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        paginated_reports = result["reports"]
+        total_count = result["total_count"]
+        unreviewed_count = result["unreviewed_count"]
         
-        # Convert to response schema and add user names
-        report_responses = []
-        for report in paginated_reports:
-            # Get user information
-            user_name = "Unknown User"
-            try:
-                user = await user_service.get_user_by_id(report["user_id"])
-                if user:
-                    user_name = user.username
-            except Exception as e:
-                logger.warning(f"Failed to get user name for user_id {report['user_id']}: {str(e)}")
-
-            # Create a modified report dict with user_name
-            report_with_user = report.copy()
-            report_with_user["user_name"] = user_name
-
-            report_response = MisuseReportResponseSchema(
-                id=report["_id"],
-                user_id=report["user_id"],
-                detection_date=report["detection_date"],
-                misuse_type=report["misuse_type"],
-                severity_level=report["severity_level"],
-                evidence_data=report["evidence_data"],
-                admin_reviewed=report["admin_reviewed"],
+        # Reports come straight from the misuse_reports service in the schema's shape,
+        # with user_name already joined, so build the response dicts directly
+        report_responses = [
+            dict(
+                zip(_REPORT_RESPONSE_KEYS, _REPORT_FIELDS(report)),
                 action_taken=report.get("action_taken"),
-                ai_analysis_metadata=report["ai_analysis_metadata"],
-                reviewed_at=report.get("reviewed_at")
+                reviewed_at=report.get("reviewed_at"),
             )
+            for report in paginated_reports
+        ]
 
-            # Add user_name to the response (we'll need to modify the schema or use model_dump)
-            report_dict = report_response.model_dump()
-            report_dict["user_name"] = user_name
-            report_responses.append(report_dict)
-        
-        # Return as dict since we modified the reports to include user_name
         return {
             "reports": report_responses,
             "total_count": total_count,
             "unreviewed_count": unreviewed_count,
             "page": page,
-            "limit": limit
+            "limit": limit,
+            "next_cursor": result["next_cursor"],
+            "has_next": result["has_next"]
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error getting misuse reports: {str(e)}")
+        logger.error("Error getting misuse reports: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get misuse reports: {str(e)}"
@@ -180,7 +242,7 @@ async def mark_misuse_report_reviewed(
         Dict containing success message
     """
     try:
-        logger.info(f"Admin {current_user['username']} marking report {report_id} as reviewed")
+        logger.info("Admin %s marking report %s as reviewed", current_user['username'], report_id)
 
         # Mark the report as reviewed
         success = await misuse_reports_service.mark_report_reviewed(report_id, action_taken)
@@ -191,7 +253,7 @@ async def mark_misuse_report_reviewed(
                 detail=f"Misuse report {report_id} not found"
             )
 
-        logger.info(f"Report {report_id} marked as reviewed by admin {current_user['username']}")
+        logger.info("Report %s marked as reviewed by admin %s", report_id, current_user['username'])
         return {
             "message": "Misuse report marked as reviewed",
             "report_id": report_id,
@@ -202,7 +264,7 @@ async def mark_misuse_report_reviewed(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error marking report {report_id} as reviewed: {str(e)}")
+        logger.error("Error marking report %s as reviewed: %s", report_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to mark report as reviewed: {str(e)}"
@@ -223,7 +285,7 @@ async def get_scheduler_status(
         Dict containing scheduler status information
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting scheduler status")
+        logger.info("Admin %s requesting scheduler status", current_user['username'])
 
         status = scheduler_service.get_scheduler_status()
 
@@ -234,13 +296,120 @@ async def get_scheduler_status(
         }
 
     except Exception as e:
-        logger.error(f"Error getting scheduler status: {str(e)}")
+        logger.error("Error getting scheduler status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get scheduler status: {str(e)}"
         )
 
 
+# Upper bound for each component check so one hung dependency cannot stall the page
+_HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+
+
+async def _check_database() -> Tuple[str, Dict[str, Any]]:
+    """Check database health, returning (status, details)"""
+    logger.debug("Checking database health...")
+    try:
+        db_ping_result = await ping_mongodb()
+        if db_ping_result["connected"]:
+            logger.debug("Database health check: HEALTHY")
+            return "healthy", {
+                "connected": True,
+                "database_name": str(db_ping_result["database_name"]),
+                "ping_ok": bool(db_ping_result.get("ping_response", {}).get("ok", False))
+            }
+        logger.warning("Database health check: UNHEALTHY - %s", db_ping_result.get('error', 'Unknown error'))
+        return "unhealthy", {
+            "connected": False,
+            "error": str(db_ping_result.get("error", "Unknown error"))
+        }
+    except Exception as e:
+        logger.error("Database health check failed: %s", e)
+        return "error", {"error": str(e)}
+
+
+async def _check_ai_services() -> Tuple[str, Dict[str, Any]]:
+    """Check AI services health, returning (status, details)"""
+    logger.debug("Checking AI services health...")
+    try:
+        # health_check is synchronous; keep it off the event loop
+        ai_health_status = await asyncio.to_thread(ai_health_check)
+        ai_services_status = get_ai_services_status()
+
+        if ai_health_status.get("healthy", False):
+            component_status = "healthy"
+            logger.debug("AI services health check: HEALTHY")
+        else:
+            component_status = "unhealthy"
+            logger.warning("AI services health check: UNHEALTHY")
+
+        # Simplify AI status for JSON serialization
+        services_available = ai_services_status.get("services_available", {})
+        return component_status, {
+            "healthy": bool(ai_health_status.get("healthy", False)),
+            "config_valid": bool(ai_services_status.get("ai_config_valid", False)),
+            "vector_store_initialized": bool(ai_services_status.get("vector_store_initialized", False)),
+            "services_available": {
+                "hsa": bool(services_available.get("hsa", False)),
+                "routing": bool(services_available.get("routing", False)),
+                "rag": bool(services_available.get("rag", False))
+            }
+        }
+    except Exception as e:
+        logger.error("AI services health check failed: %s", e)
+        return "error", {"error": str(e)}
+
+
+async def _check_scheduler() -> Tuple[str, Dict[str, Any]]:
+    """Check scheduler health, returning (status, details)"""
+    logger.debug("Checking scheduler health...")
+    try:
+        scheduler_status = scheduler_service.get_scheduler_status()
+
+        if scheduler_status.get("running", False):
+            component_status = "healthy"
+            logger.debug("Scheduler health check: HEALTHY")
+        else:
+            component_status = "unhealthy"
+            logger.warning("Scheduler health check: UNHEALTHY - Not running")
+
+        # Simplify scheduler status for JSON serialization
+        jobs_info = [
+            {
+                "id": str(job.get("id", "")),
+                "name": str(job.get("name", "")),
+                "next_run": str(job.get("next_run", "")) if job.get("next_run") else None
+            }
+            for job in scheduler_status.get("jobs", [])
+        ]
+
+        return component_status, {
+            "running": bool(scheduler_status.get("running", False)),
+            "jobs_count": len(jobs_info),
+            "jobs": jobs_info,
+            "misuse_detection_enabled": bool(scheduler_status.get("configuration", {}).get("misuse_detection_enabled", False))
+        }
+    except Exception as e:
+        logger.error("Scheduler health check failed: %s", e)
+        return "error", {"error": str(e)}
+
+
+async def _check_webhooks() -> Tuple[str, Dict[str, Any]]:
+    """Check webhook system health, returning (status, details)"""
+    logger.debug("Checking webhook health...")
+    try:
+        webhook_healthy = await webhook_health_check()
+        if webhook_healthy:
+            logger.debug("Webhook health check: HEALTHY")
+            return "healthy", {"responding": True, "health_check_passed": True}
+        logger.warning("Webhook health check: UNHEALTHY - Not responding")
+        return "unhealthy", {"responding": False, "health_check_passed": False}
+    except Exception as e:
+        logger.error("Webhook health check failed: %s", e)
+        return "error", {"error": str(e)}
+
+
 @router.get("/system-management", status_code=status.HTTP_200_OK)
 async def get_system_management_status(
     current_user: dict = Depends(require_admin)
@@ -262,170 +431,63 @@ async def get_system_management_status(
         Dict containing comprehensive system management information
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting system management status")
-
-        # Initialize system status response
-        system_status = {
-            "message": "System management status retrieved",
-            "requested_by": current_user["username"],
-            "timestamp": None,
-            "overall_health": "healthy",
-            "components": {
-                "database": {"status": "unknown", "details": {}},
-                "ai_services": {"status": "unknown", "details": {}},
-                "scheduler": {"status": "unknown", "details": {}},
-                "webhooks": {"status": "unknown", "details": {}}
-            },
-            "summary": {
-                "total_components": 4,
-                "healthy_components": 0,
-                "unhealthy_components": 0,
-                "error_components": 0
-            }
-        }
-
-        # Add timestamp
-        from datetime import datetime, timezone
-        system_status["timestamp"] = datetime.now(timezone.utc).isoformat()
+        logger.info("Admin %s requesting system management status", current_user['username'])
+
+        timestamp = _now_iso()
+
+        # Run all component checks concurrently, each bounded by a timeout
+        component_names = ("database", "ai_services", "scheduler", "webhooks")
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(check(), timeout=_HEALTH_CHECK_TIMEOUT_SECONDS)
+                for check in (_check_database, _check_ai_services, _check_scheduler, _check_webhooks)
+            ),
+            return_exceptions=True,
+        )
 
-        # Check Database Health
-        logger.debug("Checking database health...")
-        try:
-            db_ping_result = await ping_mongodb()
-            if db_ping_result["connected"]:
-                system_status["components"]["database"]["status"] = "healthy"
-                system_status["components"]["database"]["details"] = {
-                    "connected": True,
-                    "database_name": str(db_ping_result["database_name"]),
-                    "ping_ok": bool(db_ping_result.get("ping_response", {}).get("ok", False))
-                }
-                system_status["summary"]["healthy_components"] += 1
-                logger.debug("Database health check: HEALTHY")
+        components = {}
+        healthy_components = unhealthy_components = error_components = 0
+        for component_name, result in zip(component_names, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning("%s health check timed out after %ss", component_name, _HEALTH_CHECK_TIMEOUT_SECONDS)
+                result = ("error", {"error": "timeout"})
+            elif isinstance(result, BaseException):
+                logger.error("%s health check failed: %s", component_name, result)
+                result = ("error", {"error": str(result)})
+            component_status, details = result
+
+            components[component_name] = {"status": component_status, "details": details}
+            if component_status == "healthy":
+                healthy_components += 1
+            elif component_status == "unhealthy":
+                unhealthy_components += 1
             else:
-                system_status["components"]["database"]["status"] = "unhealthy"
-                system_status["components"]["database"]["details"] = {
-                    "connected": False,
-                    "error": str(db_ping_result.get("error", "Unknown error"))
-                }
-                system_status["summary"]["unhealthy_components"] += 1
-                system_status["overall_health"] = "unhealthy"
-                logger.warning(f"Database health check: UNHEALTHY - {db_ping_result.get('error', 'Unknown error')}")
-        except Exception as e:
-            system_status["components"]["database"]["status"] = "error"
-            system_status["components"]["database"]["details"] = {"error": str(e)}
-            system_status["summary"]["error_components"] += 1
-            system_status["overall_health"] = "unhealthy"
-            logger.error(f"Database health check failed: {str(e)}")
-
-        # Check AI Services Health
-        logger.debug("Checking AI services health...")
-        try:
-            ai_health_status = ai_health_check()
-            ai_services_status = get_ai_services_status()
+                error_components += 1
 
-            if ai_health_status.get("healthy", False):
-                system_status["components"]["ai_services"]["status"] = "healthy"
-                system_status["summary"]["healthy_components"] += 1
-                logger.debug("AI services health check: HEALTHY")
-            else:
-                system_status["components"]["ai_services"]["status"] = "unhealthy"
-                system_status["summary"]["unhealthy_components"] += 1
-                system_status["overall_health"] = "unhealthy"
-                logger.warning("AI services health check: UNHEALTHY")
-
-            # Simplify AI status for JSON serialization
-            system_status["components"]["ai_services"]["details"] = {
-                "healthy": bool(ai_health_status.get("healthy", False)),
-                "config_valid": bool(ai_services_status.get("ai_config_valid", False)),
-                "vector_store_initialized": bool(ai_services_status.get("vector_store_initialized", False)),
-                "services_available": {
-                    "hsa": bool(ai_services_status.get("services_available", {}).get("hsa", False)),
-                    "routing": bool(ai_services_status.get("services_available", {}).get("routing", False)),
-                    "rag": bool(ai_services_status.get("services_available", {}).get("rag", False))
-                }
-            }
-        except Exception as e:
-            system_status["components"]["ai_services"]["status"] = "error"
-            system_status["components"]["ai_services"]["details"] = {"error": str(e)}
-            system_status["summary"]["error_components"] += 1
-            system_status["overall_health"] = "unhealthy"
-            logger.error(f"AI services health check failed: {str(e)}")
-
-        # Check Scheduler Health
-        logger.debug("Checking scheduler health...")
-        try:
-            scheduler_status = scheduler_service.get_scheduler_status()
-
-            if scheduler_status.get("running", False):
-                system_status["components"]["scheduler"]["status"] = "healthy"
-                system_status["summary"]["healthy_components"] += 1
-                logger.debug("Scheduler health check: HEALTHY")
-            else:
-                system_status["components"]["scheduler"]["status"] = "unhealthy"
-                system_status["summary"]["unhealthy_components"] += 1
-                system_status["overall_health"] = "unhealthy"
-                logger.warning("Scheduler health check: UNHEALTHY - Not running")
-
-            # Simplify scheduler status for JSON serialization
-            jobs_info = []
-            for job in scheduler_status.get("jobs", []):
-                jobs_info.append({
-                    "id": str(job.get("id", "")),
-                    "name": str(job.get("name", "")),
-                    "next_run": str(job.get("next_run", "")) if job.get("next_run") else None
-                })
-
-            system_status["components"]["scheduler"]["details"] = {
-                "running": bool(scheduler_status.get("running", False)),
-                "jobs_count": len(jobs_info),
-                "jobs": jobs_info,
-                "misuse_detection_enabled": bool(scheduler_status.get("configuration", {}).get("misuse_detection_enabled", False))
-            }
-        except Exception as e:
-            system_status["components"]["scheduler"]["status"] = "error"
-            system_status["components"]["scheduler"]["details"] = {"error": str(e)}
-            system_status["summary"]["error_components"] += 1
-            system_status["overall_health"] = "unhealthy"
-            logger.error(f"Scheduler health check failed: {str(e)}")
-
-        # Check Webhook Health
-        logger.debug("Checking webhook health...")
-        try:
-            webhook_healthy = await webhook_health_check()
-
-            if webhook_healthy:
-                system_status["components"]["webhooks"]["status"] = "healthy"
-                system_status["components"]["webhooks"]["details"] = {
-                    "responding": True,
-                    "health_check_passed": True
-                }
-                system_status["summary"]["healthy_components"] += 1
-                logger.debug("Webhook health check: HEALTHY")
-            else:
-                system_status["components"]["webhooks"]["status"] = "unhealthy"
-                system_status["components"]["webhooks"]["details"] = {
-                    "responding": False,
-                    "health_check_passed": False
-                }
-                system_status["summary"]["unhealthy_components"] += 1
-                system_status["overall_health"] = "unhealthy"
-                logger.warning("Webhook health check: UNHEALTHY - Not responding")
-        except Exception as e:
-            system_status["components"]["webhooks"]["status"] = "error"
-            system_status["components"]["webhooks"]["details"] = {"error": str(e)}
-            system_status["summary"]["error_components"] += 1
-            system_status["overall_health"] = "unhealthy"
-            logger.error(f"Webhook health check failed: {str(e)}")
+        overall_health = "healthy" if healthy_components == len(component_names) else "unhealthy"
 
         # Log final system health summary
-        logger.info(f"System management status completed for admin {current_user['username']} - "
-                   f"Overall: {system_status['overall_health']}, "
-                   f"Healthy: {system_status['summary']['healthy_components']}/{system_status['summary']['total_components']}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("System management status completed for admin %s - Overall: %s, Healthy: %s/%s",
+                        current_user['username'], overall_health,
+                        healthy_components, len(component_names))
 
-        return system_status
+        return {
+            "message": "System management status retrieved",
+            "requested_by": current_user["username"],
+            "timestamp": timestamp,
+            "overall_health": overall_health,
+            "components": components,
+            "summary": {
+                "total_components": len(component_names),
+                "healthy_components": healthy_components,
+                "unhealthy_components": unhealthy_components,
+                "error_components": error_components
+            }
+        }
 
     except Exception as e:
-        logger.error(f"Error getting system management status: {str(e)}")
+        logger.error("Error getting system management status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get system management status: {str(e)}"
@@ -450,9 +512,11 @@ async def get_analytics_overview(
         Dict containing comprehensive analytics overview
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting analytics overview for {days or 'all-time'} days")
+        logger.info("Admin %s requesting analytics overview for %s days", current_user['username'], days or 'all-time')
 
-        overview = await analytics_service.get_overview_analytics(days)
+        overview = await _cached_analytics(
+            ("overview", days), lambda: analytics_service.get_overview_analytics(days)
+        )
 
         return {
             "message": "Analytics overview retrieved successfully",
@@ -461,15 +525,85 @@ async def get_analytics_overview(
         }
 
     except Exception as e:
-        logger.error(f"Error getting analytics overview: {str(e)}")
+        logger.error("Error getting analytics overview: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get analytics overview: {str(e)}"
         )
 
 
+@router.get("/dashboard", status_code=status.HTTP_200_OK)
+async def get_admin_dashboard(
+    days: Optional[int] = Query(None, ge=1, le=365, description="Number of days for the analytics overview (None for all-time)"),
+    limit: int = Query(20, ge=1, le=100, description="Number of misuse reports on the first page"),
+    current_user: dict = Depends(require_admin)
+) -> Dict[str, Any]:
+    """
+    Get the data for the admin dashboard in a single request.
+
+    Combines system management status, analytics overview, the first page of
+    misuse reports and scheduler status. The admin is authenticated once and
+    the underlying endpoints run concurrently.
+
+    Args:
+        days: Number of days for the analytics overview (None for all-time)
+        limit: Number of misuse reports on the first page
+        current_user: Current authenticated admin user
+
+    Returns:
+        Dict containing each dashboard section under its own key
+    """
+    logger.info("Admin %s requesting dashboard", current_user['username'])
+
+    system_management, analytics_overview, misuse_reports, scheduler_status = await asyncio.gather(
+        get_system_management_status(current_user=current_user),
+        get_analytics_overview(days=days, current_user=current_user),
+        get_misuse_reports(
+            page=1,
+            limit=limit,
+            unreviewed_only=False,
+            cursor=None,
+            include_total=False,
+            current_user=current_user,
+        ),
+        get_scheduler_status(current_user=current_user),
+    )
+
+    return {
+        "message": "Admin dashboard retrieved successfully",
+        "requested_by": current_user["username"],
+        "system_management": system_management,
+        "analytics_overview": analytics_overview,
+        "misuse_reports": misuse_reports,
+        "scheduler_status": scheduler_status
+    }
+
+
+def _trending_topics_etag(topics: Dict[str, Any], *parts: Any) -> Optional[str]:
+    """
+    Build an ETag for a trending topics response
+
+    The cached analysis only changes when it is regenerated, so its generated_at
+    timestamp plus the other values that vary the response body identify it.
+
+    Args:
+        topics: Trending topics analysis returned by the analytics service
+        parts: Other values included in the response body
+
+    Returns:
+        Optional[str]: Quoted ETag, or None when the analysis has no timestamp
+    """
+    generated_at = topics.get("generated_at")
+    if not generated_at:
+        return None
+    key = "|".join(str(part) for part in (generated_at, *parts))
+    return f'"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'
+
+
 @router.get("/analytics/trending-topics", status_code=status.HTTP_200_OK)
 async def get_trending_topics(
+    request: Request,
+    response: Response,
     days: Optional[int] = Query(30, ge=1, le=365, description="Number of days to analyze"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of topics to return"),
     force_refresh: bool = Query(False, description="Force refresh cache"),
@@ -479,9 +613,13 @@ async def get_trending_topics(
     Get trending topics from cache or fresh analysis.
 
     This endpoint now uses caching to avoid expensive LLM analysis on every request.
-    Topics are cached for 24 hours and refreshed via scheduled jobs.
+    Topics are cached for 24 hours and refreshed via scheduled jobs. Responses
+    carry an ETag so polling clients get 304 Not Modified until the cache is
+    regenerated.
 
     Args:
+        request: Incoming request (read for If-None-Match)
+        response: Outgoing response (ETag and Cache-Control headers are set on it)
         days: Number of days to analyze
         limit: Maximum number of topics to return
         force_refresh: Force refresh even if cache is valid (default: False)
@@ -491,23 +629,36 @@ async def get_trending_topics(
         Dict containing trending topics analysis (cached or fresh)
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting trending topics for {days} days (force_refresh: {force_refresh})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Admin %s requesting trending topics for %s days (force_refresh: %s)", current_user['username'], days, force_refresh)
 
         topics = await analytics_service.get_trending_topics(days, limit, force_refresh)
+        from_cache = topics.get("from_cache", False)
+        cache_refresh = topics.get("cache_refresh", False)
+
+        etag = _trending_topics_etag(
+            topics, days, limit, current_user["username"], from_cache, cache_refresh, force_refresh
+        )
+        if etag is not None:
+            headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            response.headers.update(headers)
 
         return {
             "message": "Trending topics retrieved successfully",
             "requested_by": current_user["username"],
             "topics_analysis": topics,
             "cache_info": {
-                "from_cache": topics.get("from_cache", False),
-                "cache_refresh": topics.get("cache_refresh", False),
+                "from_cache": from_cache,
+                "cache_refresh": cache_refresh,
                 "force_refresh_requested": force_refresh
             }
         }
 
     except Exception as e:
-        logger.error(f"Error getting trending topics: {str(e)}")
+        logger.error("Error getting trending topics: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get trending topics: {str(e)}"
@@ -535,9 +686,7 @@ async def refresh_trending_topics_cache(
         Dict containing refresh status and fresh trending topics
     """
     try:
-        logger.info(f"Admin {current_user['username']} manually refreshing trending topics cache for {days} days")
-
-        from app.services.trending_topics_cache import trending_topics_cache_service
+        logger.info("Admin %s manually refreshing trending topics cache for %s days", current_user['username'], days)
 
         # Force refresh the cache
         topics = await trending_topics_cache_service.refresh_trending_topics_cache(days, limit)
@@ -550,7 +699,7 @@ async def refresh_trending_topics_cache(
         }
 
     except Exception as e:
-        logger.error(f"Error refreshing trending topics cache: {str(e)}")
+        logger.error("Error refreshing trending topics cache: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to refresh trending topics cache: {str(e)}"
@@ -574,9 +723,7 @@ async def get_trending_topics_cache_status(
         Dict containing cache status information
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting trending topics cache status")
-
-        from app.services.trending_topics_cache import trending_topics_cache_service
+        logger.info("Admin %s requesting trending topics cache status", current_user['username'])
 
         cache_status = await trending_topics_cache_service.get_cache_status()
 
@@ -587,7 +734,7 @@ async def get_trending_topics_cache_status(
         }
 
     except Exception as e:
-        logger.error(f"Error getting trending topics cache status: {str(e)}")
+        logger.error("Error getting trending topics cache status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get trending topics cache status: {str(e)}"
@@ -611,9 +758,7 @@ async def clear_trending_topics_cache(
         Dict containing clear operation status
     """
     try:
-        logger.info(f"Admin {current_user['username']} clearing trending topics cache")
-
-        from app.services.trending_topics_cache import trending_topics_cache_service
+        logger.info("Admin %s clearing trending topics cache", current_user['username'])
 
         success = await trending_topics_cache_service.clear_cache()
 
@@ -621,7 +766,7 @@ async def clear_trending_topics_cache(
             return {
                 "message": "Trending topics cache cleared successfully",
                 "requested_by": current_user["username"],
-                "cleared_at": datetime.now().isoformat()
+                "cleared_at": _now_iso()
             }
         else:
             raise HTTPException(
@@ -630,7 +775,7 @@ async def clear_trending_topics_cache(
             )
 
     except Exception as e:
-        logger.error(f"Error clearing trending topics cache: {str(e)}")
+        logger.error("Error clearing trending topics cache: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to clear trending topics cache: {str(e)}"
@@ -641,7 +786,7 @@ async def clear_trending_topics_cache(
 async def get_flagged_users_analytics(
     days: Optional[int] = Query(None, ge=1, le=365, description="Number of days to analyze (None for all-time)"),
     current_user: dict = Depends(require_admin)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get analytics about flagged users and their violations.
 
@@ -650,32 +795,24 @@ async def get_flagged_users_analytics(
         current_user: Current authenticated admin user
 
     Returns:
-        Dict containing flagged users analytics
+        JSON response containing flagged users analytics
     """
-    try:
-        logger.info(f"Admin {current_user['username']} requesting flagged users analytics for {days or 'all-time'} days")
-
-        flagged_analytics = await analytics_service.get_flagged_users_analytics(days)
+    logger.info("Admin %s requesting flagged users analytics for %s days", current_user['username'], days or 'all-time')
 
-        return {
-            "message": "Flagged users analytics retrieved successfully",
-            "requested_by": current_user["username"],
-            "flagged_users_analytics": flagged_analytics
-        }
+    flagged_analytics = await analytics_service.get_flagged_users_analytics(days)
 
-    except Exception as e:
-        logger.error(f"Error getting flagged users analytics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get flagged users analytics: {str(e)}"
-        )
+    return ORJSONResponse({
+        "message": "Flagged users analytics retrieved successfully",
+        "requested_by": current_user["username"],
+        "flagged_users_analytics": flagged_analytics
+    })
 
 
 @router.get("/analytics/user-activity", status_code=status.HTTP_200_OK)
 async def get_user_activity_analytics(
     days: Optional[int] = Query(30, ge=1, le=365, description="Number of days to analyze"),
     current_user: dict = Depends(require_admin)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get user activity analytics including most active users.
 
@@ -684,32 +821,24 @@ async def get_user_activity_analytics(
         current_user: Current authenticated admin user
 
     Returns:
-        Dict containing user activity analytics
+        JSON response containing user activity analytics
     """
-    try:
-        logger.info(f"Admin {current_user['username']} requesting user activity analytics for {days} days")
+    logger.info("Admin %s requesting user activity analytics for %s days", current_user['username'], days)
 
-        activity_analytics = await analytics_service.get_user_activity_analytics(days)
+    activity_analytics = await analytics_service.get_user_activity_analytics(days)
 
-        return {
-            "message": "User activity analytics retrieved successfully",
-            "requested_by": current_user["username"],
-            "user_activity_analytics": activity_analytics
-        }
-
-    except Exception as e:
-        logger.error(f"Error getting user activity analytics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get user activity analytics: {str(e)}"
-        )
+    return ORJSONResponse({
+        "message": "User activity analytics retrieved successfully",
+        "requested_by": current_user["username"],
+        "user_activity_analytics": activity_analytics
+    })
 
 
 @router.get("/analytics/resolution-times", status_code=status.HTTP_200_OK)
 async def get_resolution_time_analytics(
     days: Optional[int] = Query(None, ge=1, le=365, description="Number of days to analyze (None for all-time)"),
     current_user: dict = Depends(require_admin)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get resolution time analytics by department.
 
@@ -718,35 +847,25 @@ async def get_resolution_time_analytics(
         current_user: Current authenticated admin user
 
     Returns:
-        Dict containing resolution time analytics
+        JSON response containing resolution time analytics
     """
-    try:
-        logger.info(f"Admin {current_user['username']} requesting resolution time analytics for {days or 'all-time'} days")
+    logger.info("Admin %s requesting resolution time analytics for %s days", current_user['username'], days or 'all-time')
 
-        # Get resolution stats from overview analytics
-        overview = await analytics_service.get_overview_analytics(days)
-        resolution_stats = overview.get("resolution_statistics", {})
+    resolution_stats = await analytics_service.get_resolution_statistics(days)
 
-        return {
-            "message": "Resolution time analytics retrieved successfully",
-            "requested_by": current_user["username"],
-            "period": f"Last {days} days" if days else "All time",
-            "resolution_analytics": resolution_stats
-        }
-
-    except Exception as e:
-        logger.error(f"Error getting resolution time analytics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get resolution time analytics: {str(e)}"
-        )
+    return ORJSONResponse({
+        "message": "Resolution time analytics retrieved successfully",
+        "requested_by": current_user["username"],
+        "period": f"Last {days} days" if days else "All time",
+        "resolution_analytics": resolution_stats
+    })
 
 
 @router.get("/analytics/ticket-volume", status_code=status.HTTP_200_OK)
 async def get_ticket_volume_analytics(
     days: Optional[int] = Query(None, ge=1, le=365, description="Number of days to analyze (None for all-time)"),
     current_user: dict = Depends(require_admin)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get ticket volume analytics by status, department, and urgency.
 
@@ -755,35 +874,29 @@ async def get_ticket_volume_analytics(
         current_user: Current authenticated admin user
 
     Returns:
-        Dict containing ticket volume analytics
+        JSON response containing ticket volume analytics
     """
-    try:
-        logger.info(f"Admin {current_user['username']} requesting ticket volume analytics for {days or 'all-time'} days")
+    logger.info("Admin %s requesting ticket volume analytics for %s days", current_user['username'], days or 'all-time')
 
-        # Get ticket stats from overview analytics
-        overview = await analytics_service.get_overview_analytics(days)
-        ticket_stats = overview.get("ticket_statistics", {})
+    # Get ticket stats from overview analytics
+    overview = await _cached_analytics(
+        ("overview", days), lambda: analytics_service.get_overview_analytics(days)
+    )
+    ticket_stats = overview.get("ticket_statistics", {})
 
-        return {
-            "message": "Ticket volume analytics retrieved successfully",
-            "requested_by": current_user["username"],
-            "period": f"Last {days} days" if days else "All time",
-            "ticket_volume_analytics": ticket_stats
-        }
-
-    except Exception as e:
-        logger.error(f"Error getting ticket volume analytics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get ticket volume analytics: {str(e)}"
-        )
+    return ORJSONResponse({
+        "message": "Ticket volume analytics retrieved successfully",
+        "requested_by": current_user["username"],
+        "period": f"Last {days} days" if days else "All time",
+        "ticket_volume_analytics": ticket_stats
+    })
 
 
 @router.get("/analytics/dashboard-metrics", status_code=status.HTTP_200_OK)
 async def get_dashboard_metrics(
     days: Optional[int] = Query(7, ge=1, le=365, description="Number of days to analyze"),
     current_user: dict = Depends(require_admin)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get comprehensive dashboard metrics for interactive visualizations.
 
@@ -792,33 +905,27 @@ async def get_dashboard_metrics(
         current_user: Current authenticated admin user
 
     Returns:
-        Dict containing dashboard metrics optimized for charts
+        JSON response containing dashboard metrics optimized for charts
     """
-    try:
-        logger.info(f"Admin {current_user['username']} requesting dashboard metrics for {days} days")
+    logger.info("Admin %s requesting dashboard metrics for %s days", current_user['username'], days)
 
-        dashboard_metrics = await analytics_service.get_dashboard_metrics(days)
+    dashboard_metrics = await _cached_analytics(
+        ("dashboard_metrics", days), lambda: analytics_service.get_dashboard_metrics(days)
+    )
 
-        return {
-            "message": "Dashboard metrics retrieved successfully",
-            "requested_by": current_user["username"],
-            "dashboard_metrics": dashboard_metrics
-        }
-
-    except Exception as e:
-        logger.error(f"Error getting dashboard metrics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get dashboard metrics: {str(e)}"
-        )
+    return ORJSONResponse({
+        "message": "Dashboard metrics retrieved successfully",
+        "requested_by": current_user["username"],
+        "dashboard_metrics": dashboard_metrics
+    })
 
 
 @router.get("/analytics/time-series", status_code=status.HTTP_200_OK)
 async def get_time_series_analytics(
     days: Optional[int] = Query(30, ge=7, le=365, description="Number of days to analyze"),
-    granularity: str = Query("daily", regex="^(daily|weekly|monthly)$", description="Time granularity"),
+    granularity: TimeGranularity = Query(TimeGranularity.DAILY, description="Time granularity"),
     current_user: dict = Depends(require_admin)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get time-series analytics for trend visualization.
 
@@ -828,32 +935,28 @@ async def get_time_series_analytics(
         current_user: Current authenticated admin user
 
     Returns:
-        Dict containing time-series data for charts
+        JSON response containing time-series data for charts
     """
-    try:
-        logger.info(f"Admin {current_user['username']} requesting time-series analytics for {days} days with {granularity} granularity")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Admin %s requesting time-series analytics for %s days with %s granularity", current_user['username'], days, granularity.value)
 
-        time_series_data = await analytics_service.get_time_series_analytics(days, granularity)
+    time_series_data = await _cached_analytics(
+        ("time_series", days, granularity.value),
+        lambda: analytics_service.get_time_series_analytics(days, granularity.value)
+    )
 
-        return {
-            "message": "Time-series analytics retrieved successfully",
-            "requested_by": current_user["username"],
-            "time_series_analytics": time_series_data
-        }
-
-    except Exception as e:
-        logger.error(f"Error getting time-series analytics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get time-series analytics: {str(e)}"
-        )
+    return ORJSONResponse({
+        "message": "Time-series analytics retrieved successfully",
+        "requested_by": current_user["username"],
+        "time_series_analytics": time_series_data
+    })
 
 
 @router.get("/analytics/performance-metrics", status_code=status.HTTP_200_OK)
 async def get_performance_metrics(
     days: Optional[int] = Query(30, ge=1, le=365, description="Number of days to analyze"),
     current_user: dict = Depends(require_admin)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get performance metrics for agents and departments.
 
@@ -862,32 +965,78 @@ async def get_performance_metrics(
         current_user: Current authenticated admin user
 
     Returns:
-        Dict containing performance metrics
+        JSON response containing performance metrics
     """
-    try:
-        logger.info(f"Admin {current_user['username']} requesting performance metrics for {days} days")
+    logger.info("Admin %s requesting performance metrics for %s days", current_user['username'], days)
 
-        performance_metrics = await analytics_service.get_performance_metrics(days)
+    performance_metrics = await _cached_analytics(
+        ("performance_metrics", days), lambda: analytics_service.get_performance_metrics(days)
+    )
 
-        return {
-            "message": "Performance metrics retrieved successfully",
-            "requested_by": current_user["username"],
-            "performance_metrics": performance_metrics
-        }
+    return ORJSONResponse({
+        "message": "Performance metrics retrieved successfully",
+        "requested_by": current_user["username"],
+        "performance_metrics": performance_metrics
+    })
 
-    except Exception as e:
-        logger.error(f"Error getting performance metrics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get performance metrics: {str(e)}"
-        )
+
+@router.get("/analytics/bundle", status_code=status.HTTP_200_OK)
+async def get_analytics_bundle(
+    days: int = Query(30, ge=7, le=365, description="Number of days to analyze"),
+    granularity: TimeGranularity = Query(TimeGranularity.DAILY, description="Time granularity"),
+    current_user: dict = Depends(require_admin)
+) -> ORJSONResponse:
+    """
+    Get the analytics dashboard data in a single request.
+
+    Overview, dashboard metrics, time-series and performance analytics are
+    computed concurrently, so the response takes as long as the slowest of
+    them rather than their sum. A section that fails is returned as
+    {"error": ...} without failing the others.
+
+    Args:
+        days: Number of days to analyze
+        granularity: Time granularity for the time-series section (daily, weekly, monthly)
+        current_user: Current authenticated admin user
+
+    Returns:
+        JSON response containing each analytics section under its own key
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Admin %s requesting analytics bundle for %s days with %s granularity", current_user['username'], days, granularity.value)
+
+    section_names = ("overview", "dashboard_metrics", "time_series_analytics", "performance_metrics")
+    results = await asyncio.gather(
+        _cached_analytics(("overview", days), lambda: analytics_service.get_overview_analytics(days)),
+        _cached_analytics(("dashboard_metrics", days), lambda: analytics_service.get_dashboard_metrics(days)),
+        _cached_analytics(
+            ("time_series", days, granularity.value),
+            lambda: analytics_service.get_time_series_analytics(days, granularity.value)
+        ),
+        _cached_analytics(("performance_metrics", days), lambda: analytics_service.get_performance_metrics(days)),
+        return_exceptions=True,
+    )
+
+    sections = {}
+    for section_name, result in zip(section_names, results):
+        if isinstance(result, Exception):
+            logger.error("Error getting %s for analytics bundle: %s", section_name, result)
+            result = {"error": str(result)}
+        sections[section_name] = result
+
+    return ORJSONResponse({
+        "message": "Analytics bundle retrieved successfully",
+        "requested_by": current_user["username"],
+        "period": f"Last {days} days",
+        **sections
+    })
 
 
 @router.get("/misuse-reports/{report_id}", response_model=MisuseReportResponseSchema)
 async def get_misuse_report_by_id(
     report_id: str,
     current_user: dict = Depends(require_admin)
-) -> MisuseReportResponseSchema:
+) -> ORJSONResponse:
     """
     Get a specific misuse report by ID.
     
@@ -899,31 +1048,54 @@ async def get_misuse_report_by_id(
         Misuse report details
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting misuse report {report_id}")
+        logger.info("Admin %s requesting misuse report %s", current_user['username'], report_id)
         
-        # TODO: Implement get_report_by_id method in misuse_reports_service
-        # For now, return a placeholder error
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail="Get report by ID not yet implemented"
+        report = await misuse_reports_service.get_report_by_id(report_id)
+        if report is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Misuse report {report_id} not found"
+            )
+
+        # The document comes from our own collection, so build the response
+        # without re-validating it
+        response = MisuseReportResponseSchema.model_construct(
+            id=report["_id"],
+            user_id=report["user_id"],
+            detection_date=report["detection_date"],
+            misuse_type=MisuseType(report["misuse_type"]),
+            severity_level=SeverityLevel(report["severity_level"]),
+            evidence_data=EvidenceData.model_construct(**report["evidence_data"]),
+            admin_reviewed=report["admin_reviewed"],
+            action_taken=report.get("action_taken"),
+            ai_analysis_metadata=AIAnalysisMetadata.model_construct(**report["ai_analysis_metadata"]),
+            reviewed_at=report.get("reviewed_at")
         )
+        return ORJSONResponse(response.model_dump())
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting misuse report {report_id}: {str(e)}")
+        logger.error("Error getting misuse report %s: %s", report_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get misuse report: {str(e)}"
         )
 
 
-@router.post("/documents/upload", response_model=DocumentUploadResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/documents/upload",
+    response_model=DocumentUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": DocumentProcessingStatus}}
+)
 async def upload_document(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     category: DocumentCategory = Form(...),
+    background: bool = Query(False, description="Process the document after responding with 202 Accepted"),
     current_user: dict = Depends(require_admin)
-) -> DocumentUploadResponse:
+):
     """
     Upload a document to the knowledge base.
 
@@ -931,16 +1103,32 @@ async def upload_document(
     that will be processed, chunked, and stored in the vector database
     for RAG functionality.
 
+    With background=true the file is validated and staged, then processed after
+    the response is sent; poll /admin/documents/jobs/{document_id} for progress.
+
     Args:
+        background_tasks: FastAPI background task queue
         file: The document file to upload
         category: Document category for organization
+        background: Whether to process the document in the background
         current_user: Current authenticated admin user
 
     Returns:
-        DocumentUploadResponse with processing results
+        DocumentUploadResponse with processing results, or a 202 response with
+        the DocumentProcessingStatus of the queued job
     """
     try:
-        logger.info(f"Admin {current_user['username']} uploading document: {file.filename}")
+        logger.info("Admin %s uploading document: %s", current_user['username'], file.filename)
+
+        if background:
+            job_status, job_args = await document_service.start_upload_job(
+                file=file,
+                category=category,
+                uploaded_by=current_user["username"]
+            )
+            background_tasks.add_task(document_service.run_upload_job, **job_args)
+            logger.info("Document %s queued for processing as %s", file.filename, job_status.document_id)
+            return ORJSONResponse(status_code=status.HTTP_202_ACCEPTED, content=job_status.model_dump())
 
         result = await document_service.upload_document(
             file=file,
@@ -948,23 +1136,48 @@ async def upload_document(
             uploaded_by=current_user["username"]
         )
 
-        logger.info(f"Document uploaded successfully: {file.filename} -> {result.vectors_stored} vectors")
-        return result
+        logger.info("Document uploaded successfully: %s -> %s vectors", file.filename, result.vectors_stored)
+        # Built by the service from trusted values; skip re-validating it against the response model
+        return ORJSONResponse(status_code=status.HTTP_201_CREATED, content=result.model_dump())
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Document upload failed: {str(e)}")
+        logger.error("Document upload failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Document upload failed: {str(e)}"
         )
 
 
+@router.get("/documents/jobs/{document_id}", response_model=DocumentProcessingStatus, status_code=status.HTTP_200_OK)
+async def get_document_upload_job(
+    document_id: str,
+    current_user: dict = Depends(require_admin)
+) -> ORJSONResponse:
+    """
+    Get the processing status of a background document upload.
+
+    Args:
+        document_id: Document ID returned by the upload endpoint
+        current_user: Current authenticated admin user
+
+    Returns:
+        DocumentProcessingStatus of the upload job
+    """
+    job_status = await document_service.get_upload_job(document_id)
+    if job_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Upload job {document_id} not found"
+        )
+    return ORJSONResponse(job_status.model_dump())
+
+
 @router.get("/documents/stats", response_model=KnowledgeBaseStats, status_code=status.HTTP_200_OK)
 async def get_knowledge_base_stats(
     current_user: dict = Depends(require_admin)
-) -> KnowledgeBaseStats:
+) -> ORJSONResponse:
     """
     Get statistics about the knowledge base.
 
@@ -975,15 +1188,16 @@ async def get_knowledge_base_stats(
         Knowledge base statistics including document counts, categories, and storage info
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting knowledge base stats")
+        logger.info("Admin %s requesting knowledge base stats", current_user['username'])
 
         stats = await document_service.get_knowledge_base_stats()
 
-        logger.debug(f"Knowledge base stats retrieved: {stats.total_documents} documents, {stats.total_vectors} vectors")
-        return stats
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Knowledge base stats retrieved: %s documents, %s vectors", stats.total_documents, stats.total_vectors)
+        return ORJSONResponse(stats.model_dump())
 
     except Exception as e:
-        logger.error(f"Failed to get knowledge base stats: {str(e)}")
+        logger.error("Failed to get knowledge base stats: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get knowledge base statistics: {str(e)}"
@@ -1010,7 +1224,7 @@ async def get_flagged_users(
         Dict containing flagged users summary
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting flagged users for {days or 'all-time'} days")
+        logger.info("Admin %s requesting flagged users for %s days", current_user['username'], days or 'all-time')
 
         flagged_users = await user_violation_service.get_flagged_users_summary(days, limit)
 
@@ -1023,7 +1237,7 @@ async def get_flagged_users(
         }
 
     except Exception as e:
-        logger.error(f"Error getting flagged users: {str(e)}")
+        logger.error("Error getting flagged users: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get flagged users: {str(e)}"
@@ -1048,19 +1262,17 @@ async def get_user_violations(
         Dict containing user violations
     """
     try:
-        logger.info(f"Admin {current_user['username']} requesting violations for user {user_id}")
-
-        violations = await user_violation_service.get_user_violations(user_id, days)
+        logger.info("Admin %s requesting violations for user %s", current_user['username'], user_id)
 
-        # Get user information
-        user = await user_service.get_user_by_id(user_id)
+        # The violations query and the user lookup are independent
+        violations, user = await asyncio.gather(
+            user_violation_service.get_user_violations(user_id, days),
+            user_service.get_user_by_id(user_id)
+        )
         username = user.username if user else "Unknown User"
 
         # Convert to response format
-        violation_responses = []
-        for violation in violations:
-            violation_dict = violation.model_dump()
-            violation_responses.append(violation_dict)
+        violation_responses = _VIOLATIONS_ADAPTER.dump_python(violations)
 
         return {
             "message": "User violations retrieved successfully",
@@ -1073,7 +1285,7 @@ async def get_user_violations(
         }
 
     except Exception as e:
-        logger.error(f"Error getting violations for user {user_id}: {str(e)}")
+        logger.error("Error getting violations for user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get user violations: {str(e)}"
@@ -1098,7 +1310,7 @@ async def mark_violation_reviewed(
         Dict containing success message
     """
     try:
-        logger.info(f"Admin {current_user['username']} marking violation {violation_id} as reviewed")
+        logger.info("Admin %s marking violation %s as reviewed", current_user['username'], violation_id)
 
         success = await user_violation_service.mark_violation_reviewed(violation_id, action_taken)
 
@@ -1108,7 +1320,7 @@ async def mark_violation_reviewed(
                 detail=f"User violation {violation_id} not found"
             )
 
-        logger.info(f"Violation {violation_id} marked as reviewed by admin {current_user['username']}")
+        logger.info("Violation %s marked as reviewed by admin %s", violation_id, current_user['username'])
         return {
             "message": "User violation marked as reviewed",
             "violation_id": violation_id,
@@ -1119,7 +1331,7 @@ async def mark_violation_reviewed(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error marking violation {violation_id} as reviewed: {str(e)}")
+        logger.error("Error marking violation %s as reviewed: %s", violation_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to mark violation as reviewed: {str(e)}"
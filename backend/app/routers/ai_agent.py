@@ -5,63 +5,116 @@ This module provides endpoints for agent-side AI functionality,
 including response suggestions and other AI-powered agent tools.
 """
 
+import asyncio
 import logging
-from fastapi import APIRouter, HTTPException, status, Depends
-from pydantic import BaseModel, Field
+from types import MappingProxyType
+from fastapi import APIRouter, HTTPException, Request, status, Depends
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError
 from typing import List
+from app.core.openapi import request_body_schema
+from app.core.responses import ORJSONResponse
 from app.schemas.message import MessageSchema
 from app.services.ai.response_suggestion_rag import response_suggestion_rag
-from app.routers.auth import get_current_user
+from app.core.auth import require_agent
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ai", tags=["ai-agent"])
 
+# Everything in the agent tools response except the requesting agent, built once
+_AGENT_TOOLS_STATIC = MappingProxyType({
+    "service": "Agent AI Tools",
+    "description": "AI-powered tools to help agents provide better support",
+    "tools": (
+        {
+            "name": "Response Suggestions",
+            "endpoint": "/ai/suggest-response",
+            "method": "POST",
+            "description": "Get AI-generated response suggestions based on conversation context",
+            "features": (
+                "Context-aware suggestions",
+                "Department-specific responses",
+                "Professional tone guidance",
+                "Troubleshooting assistance",
+                "Policy information support"
+            )
+        },
+    ),
+    "usage_guidelines": (
+        "Review and customize AI suggestions before sending",
+        "Use suggestions as starting points for responses",
+        "Maintain professional and helpful tone",
+        "Verify technical information before sharing",
+        "Add personal touch to AI-generated content"
+    ),
+    "limitations": (
+        "AI suggestions are recommendations, not final answers",
+        "Always review content for accuracy and appropriateness",
+        "Consider user's specific context and needs",
+        "Use professional judgment when applying suggestions"
+    )
+})
+
 
 class SuggestResponseRequest(BaseModel):
     """Request model for AI response suggestions"""
     ticket_id: str = Field(..., min_length=1, max_length=100, description="ID of the ticket")
     conversation_context: List[MessageSchema] = Field(
         ..., 
-        min_items=0, 
-        max_items=50, 
+        min_length=0,
+        max_length=50,
         description="List of messages providing conversation context"
     )
 
 
-class SuggestResponseResponse(BaseModel):
-    """Response model for AI response suggestions"""
-    suggested_response: str = Field(..., description="AI-generated response suggestion")
+# Request body schema for OpenAPI, since the body is parsed by a dependency
+# rather than declared as a body parameter
+_SUGGEST_REQUEST_SCHEMA = request_body_schema(SuggestResponseRequest)
 
 
-def verify_agent_role(current_user: dict = Depends(get_current_user)) -> dict:
+async def parse_suggest_request(request: Request) -> SuggestResponseRequest:
     """
-    Verify that the current user has agent role
-    
+    Parse and validate the suggest-response body straight from the raw JSON
+
+    model_validate_json validates the bytes in a single pydantic-core pass,
+    skipping the intermediate dict FastAPI would build with json.loads.
+
     Args:
-        current_user: Current authenticated user
-        
+        request: Incoming request
+
     Returns:
-        dict: User information if authorized
-        
+        SuggestResponseRequest: Validated request body
+
     Raises:
-        HTTPException: If user is not an agent
+        RequestValidationError: If the body is not valid JSON or fails validation
     """
-    if current_user["role"] not in ["it_agent", "hr_agent"]:
-        logger.warning(f"Non-agent user {current_user['username']} attempted to access agent AI endpoint")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Agent role required."
+    try:
+        return SuggestResponseRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
         )
-    
-    logger.debug(f"Agent {current_user['username']} ({current_user['role']}) accessing AI suggestion endpoint")
-    return current_user
 
 
-@router.post("/suggest-response", response_model=SuggestResponseResponse)
+class SuggestResponseResponse(BaseModel):
+    """Response model for AI response suggestions"""
+    suggested_response: str = Field(..., description="AI-generated response suggestion")
+
+
+@router.post(
+    "/suggest-response",
+    response_model=SuggestResponseResponse,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": _SUGGEST_REQUEST_SCHEMA}},
+            "required": True
+        }
+    }
+)
 async def suggest_response(
-    request: SuggestResponseRequest,
-    current_user: dict = Depends(verify_agent_role)
+    current_user: dict = Depends(require_agent),
+    request: SuggestResponseRequest = Depends(parse_suggest_request)
 ):
     """
     Generate AI-powered response suggestions for agents
@@ -84,8 +137,10 @@ async def suggest_response(
             f"for ticket {request.ticket_id} with {len(request.conversation_context)} context messages"
         )
         
-        # Call the response suggestion RAG service
-        suggested_response = response_suggestion_rag(
+        # Call the response suggestion RAG service in a worker thread; it
+        # blocks on the vector store and LLM round trips
+        suggested_response = await asyncio.to_thread(
+            response_suggestion_rag,
             ticket_id=request.ticket_id,
             conversation_context=request.conversation_context
         )
@@ -95,7 +150,8 @@ async def suggest_response(
             f"- Response length: {len(suggested_response)}"
         )
         
-        return SuggestResponseResponse(suggested_response=suggested_response)
+        # The payload is built here, so skip re-validating it against the response model
+        return ORJSONResponse({"suggested_response": suggested_response})
         
     except ValueError as e:
         logger.error(f"Validation error in AI response suggestion: {e}")
@@ -112,7 +168,7 @@ async def suggest_response(
 
 
 @router.get("/agent-tools")
-async def agent_tools_info(current_user: dict = Depends(verify_agent_role)):
+async def agent_tools_info(current_user: dict = Depends(require_agent)):
     """
     Get information about available AI tools for agents
     
@@ -122,39 +178,10 @@ async def agent_tools_info(current_user: dict = Depends(verify_agent_role)):
     **Authorization**: Only agents (it_agent, hr_agent) can access this endpoint.
     """
     return {
-        "service": "Agent AI Tools",
-        "description": "AI-powered tools to help agents provide better support",
+        **_AGENT_TOOLS_STATIC,
         "agent": {
             "username": current_user["username"],
             "role": current_user["role"],
             "department": "IT" if current_user["role"] == "it_agent" else "HR"
-        },
-        "tools": [
-            {
-                "name": "Response Suggestions",
-                "endpoint": "/ai/suggest-response",
-                "method": "POST",
-                "description": "Get AI-generated response suggestions based on conversation context",
-                "features": [
-                    "Context-aware suggestions",
-                    "Department-specific responses",
-                    "Professional tone guidance",
-                    "Troubleshooting assistance",
-                    "Policy information support"
-                ]
-            }
-        ],
-        "usage_guidelines": [
-            "Review and customize AI suggestions before sending",
-            "Use suggestions as starting points for responses",
-            "Maintain professional and helpful tone",
-            "Verify technical information before sharing",
-            "Add personal touch to AI-generated content"
-        ],
-        "limitations": [
-            "AI suggestions are recommendations, not final answers",
-            "Always review content for accuracy and appropriateness",
-            "Consider user's specific context and needs",
-            "Use professional judgment when applying suggestions"
-        ]
+        }
     }
@@ -2,21 +2,32 @@
 AI Agent Endpoint for Dashboard Integration
 
 This module provides the endpoint for the "Resolve with AI" functionality
-that can be integrated with the dashboard frontend.
+that can be integrated with the dashboard frontend. Example frontend code for
+calling it lives in ai_agent_frontend_example.js next to this module.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
+import asyncio
 import logging
-from app.services.ai.agent import query_agent
+import uuid
+import orjson
+from cachetools import TTLCache, cached
+from app.core.ai_config import ai_config
+from app.services.ai.agent import run_agent_query
 from app.core.auth import get_current_user
-from app.schemas.user import UserSchema
+from app.core.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ai", tags=["AI Agent"])
 
+# /ai/status needs no authentication, so it is cached for a few seconds to keep
+# frequent health checks off get_safe_config; its payload only changes on config reload
+_AI_STATUS_TTL_SECONDS = 10
+
 
 class AIQueryRequest(BaseModel):
     """Request model for AI agent queries"""
@@ -37,8 +48,8 @@ class AIQueryResponse(BaseModel):
 @router.post("/resolve", response_model=AIQueryResponse)
 async def resolve_with_ai(
     request: AIQueryRequest,
-    current_user: UserSchema = Depends(get_current_user)
-) -> AIQueryResponse:
+    current_user: dict = Depends(get_current_user)
+) -> ORJSONResponse:
     """
     Resolve user queries using the AI agent with RAG and web search capabilities.
     
@@ -54,52 +65,81 @@ async def resolve_with_ai(
     Raises:
         HTTPException: If the query fails or user is not authenticated
     """
-    logger.info(f"AI resolve request from user {current_user.email}: '{request.query[:50]}...'")
+    logger.info(f"AI resolve request from user {current_user['username']}: '{request.query[:50]}...'")
     
     try:
         # Generate session ID if not provided
-        session_id = request.session_id or f"user_{current_user.user_id}_{hash(request.query) % 10000}"
+        session_id = request.session_id or f"user_{current_user['user_id']}_{uuid.uuid4().hex[:12]}"
         
-        # Query the AI agent
-        result = query_agent(request.query, session_id=session_id)
+        # Query the AI agent on its worker pool; it blocks on LLM and search calls
+        result = await run_agent_query(request.query, session_id=session_id)
         
         # Log successful resolution
-        logger.info(f"AI resolution successful for user {current_user.email} - Response length: {len(result['answer'])}")
+        logger.info(f"AI resolution successful for user {current_user['username']} - Response length: {len(result['answer'])}")
         
-        return AIQueryResponse(
+        # Validated once on construction; returning a response skips FastAPI's second pass
+        return ORJSONResponse(AIQueryResponse(
             success=True,
             answer=result["answer"],
             sources=result.get("sources", []),
             session_id=result.get("session_id"),
             metadata={
                 **result.get("metadata", {}),
-                "user_id": current_user.user_id,
-                "user_email": current_user.email,
+                "user_id": current_user["user_id"],
+                "username": current_user["username"],
                 "response_time": "< 2s"  # Would be calculated in real implementation
             }
-        )
+        ).model_dump())
         
     except ValueError as e:
         # Handle validation errors
-        logger.warning(f"AI resolve validation error for user {current_user.email}: {str(e)}")
+        logger.warning(f"AI resolve validation error for user {current_user['username']}: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
         
     except Exception as e:
         # Handle unexpected errors
-        logger.error(f"AI resolve failed for user {current_user.email}: {str(e)}")
+        logger.error(f"AI resolve failed for user {current_user['username']}: {str(e)}")
         
-        return AIQueryResponse(
+        return ORJSONResponse(AIQueryResponse(
             success=False,
             answer="I'm currently unable to process your request. Please try again later or contact support for assistance.",
             sources=[],
             session_id=request.session_id,
             metadata={
-                "user_id": current_user.user_id,
-                "user_email": current_user.email,
+                "user_id": current_user["user_id"],
+                "username": current_user["username"],
                 "error_type": type(e).__name__
             },
             error=str(e)
-        )
+        ).model_dump())
+
+
+@cached(cache=TTLCache(maxsize=1, ttl=_AI_STATUS_TTL_SECONDS))
+def _build_ai_status() -> Dict[str, Any]:
+    """
+    Build the AI status payload from the masked configuration.
+
+    Returns:
+        Dict containing the AI agent status and configuration
+    """
+    config = ai_config.get_safe_config()
+
+    return {
+        "status": "operational",
+        "capabilities": {
+            "knowledge_base_search": config["rag_enabled"],
+            "web_search": config["web_search_enabled"] and config["serper_api_key_configured"],
+            "llm_model": config["gemini_model"],
+            "tools_available": ["knowledge_base", "web_search"]
+        },
+        "configuration": {
+            "google_api_configured": config["google_api_key_configured"],
+            "rag_enabled": config["rag_enabled"],
+            "web_search_enabled": config["web_search_enabled"],
+            "serper_api_configured": config["serper_api_key_configured"]
+        },
+        "health": "healthy" if config["google_api_key_configured"] else "degraded"
+    }
 
 
 @router.get("/status")
@@ -111,26 +151,7 @@ async def get_ai_status() -> Dict[str, Any]:
         Dict containing the AI agent status and configuration
     """
     try:
-        from app.core.ai_config import ai_config
-        
-        config = ai_config.get_safe_config()
-        
-        return {
-            "status": "operational",
-            "capabilities": {
-                "knowledge_base_search": config["rag_enabled"],
-                "web_search": config["web_search_enabled"] and config["serper_api_key_configured"],
-                "llm_model": config["gemini_model"],
-                "tools_available": ["knowledge_base", "web_search"]
-            },
-            "configuration": {
-                "google_api_configured": config["google_api_key_configured"],
-                "rag_enabled": config["rag_enabled"],
-                "web_search_enabled": config["web_search_enabled"],
-                "serper_api_configured": config["serper_api_key_configured"]
-            },
-            "health": "healthy" if config["google_api_key_configured"] else "degraded"
-        }
+        return _build_ai_status()
         
     except Exception as e:
         logger.error(f"Failed to get AI status: {str(e)}")
@@ -141,97 +162,94 @@ async def get_ai_status() -> Dict[str, Any]:
         }
 
 
+# Predefined probe queries run by /ai/test
+_TEST_QUERIES = (
+    "What is the current price of Apple stock?",
+    "How do I reset my password?",
+    "What are the latest cybersecurity trends?",
+    "Company vacation policy"
+)
+
+
+async def _run_test_query(query: str, session_id: str) -> Dict[str, Any]:
+    """
+    Run one probe query against the agent and summarize the outcome.
+
+    The agent is synchronous, so it runs on the agent worker pool.
+
+    Args:
+        query: Probe query
+        session_id: Session ID for the probe
+
+    Returns:
+        Dict describing the probe result
+    """
+    try:
+        result = await run_agent_query(query, session_id=session_id)
+    except Exception as e:
+        return {
+            "query": query,
+            "success": False,
+            "error": str(e)
+        }
+    return {
+        "query": query,
+        "success": True,
+        "response_length": len(result["answer"]),
+        "sources": result.get("sources", []),
+        "preview": result["answer"][:100] + "..." if len(result["answer"]) > 100 else result["answer"]
+    }
+
+
 @router.post("/test")
 async def test_ai_agent(
-    current_user: UserSchema = Depends(get_current_user)
-) -> Dict[str, Any]:
+    stream: bool = Query(False, description="Stream each result as NDJSON as soon as it completes"),
+    current_user: dict = Depends(get_current_user)
+):
     """
     Test the AI agent with predefined queries to verify functionality.
     
     This endpoint is useful for testing and debugging the AI agent.
     
     Args:
+        stream: Whether to stream results as newline-delimited JSON
         current_user: The authenticated user (admin only recommended)
         
     Returns:
-        Dict containing test results
+        Dict containing test results, or an NDJSON stream with one line per
+        result in completion order followed by a summary line
     """
-    logger.info(f"AI agent test requested by user {current_user.email}")
+    logger.info(f"AI agent test requested by user {current_user['username']}")
     
-    test_queries = [
-        "What is the current price of Apple stock?",
-        "How do I reset my password?",
-        "What are the latest cybersecurity trends?",
-        "Company vacation policy"
+    # Probes run side by side; the agent keeps no conversation memory, so
+    # the session IDs only label each probe in the agent's logs
+    probes = [
+        _run_test_query(query, f"test_{current_user['user_id']}_{i}")
+        for i, query in enumerate(_TEST_QUERIES)
     ]
     
-    results = []
+    if stream:
+        async def generate_results():
+            successful_queries = 0
+            for probe in asyncio.as_completed(probes):
+                result = await probe
+                successful_queries += result["success"]
+                yield orjson.dumps(result) + b"\n"
+            yield orjson.dumps({
+                "test_completed": True,
+                "total_queries": len(_TEST_QUERIES),
+                "successful_queries": successful_queries,
+                "tester": current_user["username"]
+            }) + b"\n"
+        
+        return StreamingResponse(generate_results(), media_type="application/x-ndjson")
     
-    for query in test_queries:
-        try:
-            result = query_agent(query, session_id=f"test_{current_user.user_id}")
-            results.append({
-                "query": query,
-                "success": True,
-                "response_length": len(result["answer"]),
-                "sources": result.get("sources", []),
-                "preview": result["answer"][:100] + "..." if len(result["answer"]) > 100 else result["answer"]
-            })
-        except Exception as e:
-            results.append({
-                "query": query,
-                "success": False,
-                "error": str(e)
-            })
+    results = await asyncio.gather(*probes)
     
     return {
         "test_completed": True,
-        "total_queries": len(test_queries),
+        "total_queries": len(_TEST_QUERIES),
         "successful_queries": sum(1 for r in results if r["success"]),
         "results": results,
-        "tester": current_user.email
+        "tester": current_user["username"]
     }
-
-
-# Example frontend integration code (JavaScript)
-FRONTEND_INTEGRATION_EXAMPLE = """
-// Frontend integration example for the "Resolve with AI" button
-
-async function resolveWithAI(userQuery) {
-    try {
-        const response = await fetch('/api/ai/resolve', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-                'Authorization': `Bearer ${authToken}`
-            },
-            body: JSON.stringify({
-                query: userQuery,
-                session_id: `user_${userId}_${Date.now()}`
-            })
-        });
-        
-        const result = await response.json();
-        
-        if (result.success) {
-            // Display the AI response
-            displayAIResponse(result.answer, result.sources);
-        } else {
-            // Handle error
-            displayError(result.error || 'AI service unavailable');
-        }
-        
-    } catch (error) {
-        console.error('AI resolve failed:', error);
-        displayError('Failed to connect to AI service');
-    }
-}
-
-// Usage in dashboard
-document.getElementById('resolve-ai-btn').addEventListener('click', () => {
-    const userQuery = document.getElementById('user-query').value;
-    if (userQuery.trim()) {
-        resolveWithAI(userQuery);
-    }
-});
-"""
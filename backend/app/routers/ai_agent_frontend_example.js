@@ -0,0 +1,39 @@
+// Frontend integration example for the "Resolve with AI" button
+
+async function resolveWithAI(userQuery) {
+    try {
+        const response = await fetch('/api/ai/resolve', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Authorization': `Bearer ${authToken}`
+            },
+            body: JSON.stringify({
+                query: userQuery,
+                session_id: `user_${userId}_${Date.now()}`
+            })
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            // Display the AI response
+            displayAIResponse(result.answer, result.sources);
+        } else {
+            // Handle error
+            displayError(result.error || 'AI service unavailable');
+        }
+        
+    } catch (error) {
+        console.error('AI resolve failed:', error);
+        displayError('Failed to connect to AI service');
+    }
+}
+
+// Usage in dashboard
+document.getElementById('resolve-ai-btn').addEventListener('click', () => {
+    const userQuery = document.getElementById('user-query').value;
+    if (userQuery.trim()) {
+        resolveWithAI(userQuery);
+    }
+});
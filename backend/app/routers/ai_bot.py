@@ -5,11 +5,18 @@ This module provides endpoints for the self-serve AI bot functionality.
 Users can query the AI bot for instant help without authentication.
 """
 
+import asyncio
+import hashlib
 import logging
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
-from typing import Optional
-from app.services.ai.agent import query_agent
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError
+from typing import Dict, Optional
+from app.core.openapi import request_body_schema
+from app.core.responses import ORJSONResponse, PreSerializedJSONResponse
+from app.services.ai.agent import run_agent_query
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +29,119 @@ class SelfServeQueryRequest(BaseModel):
     session_id: Optional[str] = Field(None, max_length=100, description="Optional session identifier")
 
 
+# Request body schema for OpenAPI, since the body is parsed by a dependency
+# rather than declared as a body parameter
+_SELF_SERVE_REQUEST_SCHEMA = request_body_schema(SelfServeQueryRequest)
+
+
+async def parse_self_serve_request(request: Request) -> SelfServeQueryRequest:
+    """
+    Parse and validate the self-serve query body straight from the raw JSON
+
+    model_validate_json checks the length constraints while decoding the bytes
+    in pydantic-core, skipping the intermediate dict FastAPI would build.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        SelfServeQueryRequest: Validated request body
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON or fails validation
+    """
+    try:
+        return SelfServeQueryRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
 class SelfServeQueryResponse(BaseModel):
     """Response model for self-serve AI bot queries"""
     answer: str = Field(..., description="AI-generated response to the query")
 
 
-@router.post("/self-serve-query", response_model=SelfServeQueryResponse)
-async def self_serve_query(request: SelfServeQueryRequest):
+_ANSWER_CACHE_TTL_SECONDS = 600
+_FALLBACK_ANSWER = "I'm sorry, I couldn't process your query at the moment."
+
+# The agent keeps no conversation memory, so answers depend only on the query
+# text and are shared across sessions; in-flight calls are shared the same way
+_answer_cache: TTLCache = TTLCache(maxsize=2000, ttl=_ANSWER_CACHE_TTL_SECONDS)
+_pending_answers: Dict[bytes, "asyncio.Task[str]"] = {}
+
+
+def _answer_key(query: str) -> bytes:
+    """
+    Build the answer cache key for a query
+
+    Args:
+        query: User's question
+
+    Returns:
+        bytes: Digest of the normalized query text
+    """
+    return hashlib.blake2b(query.strip().lower().encode(), digest_size=16).digest()
+
+
+async def _query_and_cache(key: bytes, query: str, session_id: Optional[str]) -> str:
+    """
+    Ask the agent and cache the answer unless the agent reported an error
+
+    Args:
+        key: Answer cache key for the query
+        query: User's question
+        session_id: Optional session identifier
+
+    Returns:
+        str: Agent answer
+    """
+    agent_result = await run_agent_query(query, session_id=session_id)
+    answer = agent_result.get("answer", _FALLBACK_ANSWER)
+    if "error" not in agent_result.get("metadata", {}):
+        _answer_cache[key] = answer
+    return answer
+
+
+async def _get_answer(query: str, session_id: Optional[str]) -> str:
+    """
+    Get an agent answer, reusing cached and in-flight answers for the same query
+
+    Args:
+        query: User's question
+        session_id: Optional session identifier
+
+    Returns:
+        str: Agent answer
+    """
+    key = _answer_key(query)
+    answer = _answer_cache.get(key)
+    if answer is not None:
+        logger.debug("Self-serve answer served from cache")
+        return answer
+
+    task = _pending_answers.get(key)
+    if task is None:
+        task = asyncio.create_task(_query_and_cache(key, query, session_id))
+        _pending_answers[key] = task
+        task.add_done_callback(lambda _: _pending_answers.pop(key, None))
+
+    # Shielded so one client disconnecting doesn't cancel the call for the others
+    return await asyncio.shield(task)
+
+
+@router.post(
+    "/self-serve-query",
+    response_model=SelfServeQueryResponse,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": _SELF_SERVE_REQUEST_SCHEMA}},
+            "required": True
+        }
+    }
+)
+async def self_serve_query(request: SelfServeQueryRequest = Depends(parse_self_serve_request)):
     """
     Enhanced self-serve AI bot endpoint with RAG and web search capabilities
 
@@ -50,15 +163,14 @@ async def self_serve_query(request: SelfServeQueryRequest):
     try:
         logger.info(f"Self-serve query received - Query length: {len(request.query)}, Session: {request.session_id}")
 
-        # Use the enhanced AI agent with RAG and web search capabilities
-        agent_result = query_agent(request.query, session_id=request.session_id)
-
-        # Extract answer from agent result
-        answer = agent_result.get("answer", "I'm sorry, I couldn't process your query at the moment.")
+        # Use the enhanced AI agent with RAG and web search capabilities; it runs
+        # on the agent's own worker pool to keep the event loop free, and
+        # repeated questions are answered from the cache
+        answer = await _get_answer(request.query, request.session_id)
 
         logger.info(f"Self-serve query processed successfully with enhanced agent - Response length: {len(answer)}")
 
-        return SelfServeQueryResponse(answer=answer)
+        return ORJSONResponse({"answer": answer})
         
     except ValueError as e:
         logger.warning(f"Invalid query input: {e}")
@@ -80,6 +192,54 @@ async def self_serve_query(request: SelfServeQueryRequest):
         )
 
 
+# The self-serve info payload never changes, so it is serialized once at import
+_SELF_SERVE_INFO_BYTES = orjson.dumps({
+    "service": "Enhanced Self-Serve AI Bot",
+    "description": "Get intelligent AI assistance with RAG and web search capabilities",
+    "features": [
+        "No authentication required",
+        "Internal knowledge base search for company information",
+        "Web search for external information and current events",
+        "Intelligent tool selection based on query context",
+        "Comprehensive responses for stock prices, tech questions, and more",
+        "Fallback guidance when services are unavailable",
+        "Session tracking support"
+    ],
+    "usage": {
+        "endpoint": "/ai/self-serve-query",
+        "method": "POST",
+        "required_fields": ["query"],
+        "optional_fields": ["session_id"],
+        "query_limits": {
+            "min_length": 1,
+            "max_length": 1000
+        }
+    },
+    "examples": [
+        {
+            "query": "How do I reset my password?",
+            "description": "Get guidance on password reset procedures (uses knowledge base)"
+        },
+        {
+            "query": "What is the current price of Apple stock?",
+            "description": "Get current stock information (uses web search)"
+        },
+        {
+            "query": "What are the vacation policies?",
+            "description": "Learn about leave and vacation policies (uses knowledge base)"
+        },
+        {
+            "query": "How to troubleshoot wifi connection?",
+            "description": "Get troubleshooting guidance (uses both sources as needed)"
+        },
+        {
+            "query": "Latest cybersecurity trends 2024",
+            "description": "Get current information about cybersecurity (uses web search)"
+        }
+    ]
+})
+
+
 @router.get("/self-serve-info")
 async def self_serve_info():
     """
@@ -88,48 +248,4 @@ async def self_serve_info():
     Returns information about how to use the self-serve AI bot,
     including available features and usage guidelines.
     """
-    return {
-        "service": "Enhanced Self-Serve AI Bot",
-        "description": "Get intelligent AI assistance with RAG and web search capabilities",
-        "features": [
-            "No authentication required",
-            "Internal knowledge base search for company information",
-            "Web search for external information and current events",
-            "Intelligent tool selection based on query context",
-            "Comprehensive responses for stock prices, tech questions, and more",
-            "Fallback guidance when services are unavailable",
-            "Session tracking support"
-        ],
-        "usage": {
-            "endpoint": "/ai/self-serve-query",
-            "method": "POST",
-            "required_fields": ["query"],
-            "optional_fields": ["session_id"],
-            "query_limits": {
-                "min_length": 1,
-                "max_length": 1000
-            }
-        },
-        "examples": [
-            {
-                "query": "How do I reset my password?",
-                "description": "Get guidance on password reset procedures (uses knowledge base)"
-            },
-            {
-                "query": "What is the current price of Apple stock?",
-                "description": "Get current stock information (uses web search)"
-            },
-            {
-                "query": "What are the vacation policies?",
-                "description": "Learn about leave and vacation policies (uses knowledge base)"
-            },
-            {
-                "query": "How to troubleshoot wifi connection?",
-                "description": "Get troubleshooting guidance (uses both sources as needed)"
-            },
-            {
-                "query": "Latest cybersecurity trends 2024",
-                "description": "Get current information about cybersecurity (uses web search)"
-            }
-        ]
-    }
+    return PreSerializedJSONResponse(_SELF_SERVE_INFO_BYTES)
@@ -9,10 +9,11 @@ from app.schemas.user import (
     UserRegistrationResponse,
 )
 from app.services.auth_service import (
-    verify_password,
+    verify_password_async,
     create_access_token,
-    get_token_data,
 )
+from app.core.auth import get_cached_token_data
+from app.core.responses import ORJSONResponse
 from app.services.user_service import user_service
 from app.core.database import get_database
 import logging
@@ -26,8 +27,8 @@ security = HTTPBearer()
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> dict:
-    """Get current user from JWT token"""
-    token_data = get_token_data(credentials.credentials)
+    """Get current user from JWT token, reusing recently verified tokens"""
+    token_data = get_cached_token_data(credentials.credentials)
     if token_data is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -44,7 +45,7 @@ async def register(user_data: UserCreateSchema):
         # Create user in database
         user_model = await user_service.create_user(user_data)
 
-        logger.info(f"User registered successfully: {user_data.username}")
+        logger.info("User registered successfully: %s", user_data.username)
 
         return UserRegistrationResponse(
             message="User registered successfully",
@@ -56,11 +57,11 @@ async def register(user_data: UserCreateSchema):
 
     except ValueError as e:
         # Handle duplicate username/email
-        logger.warning(f"Registration failed for {user_data.username}: {e}")
+        logger.warning("Registration failed for %s: %s", user_data.username, e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         # Handle other errors
-        logger.error(f"Registration error for {user_data.username}: {e}")
+        logger.error("Registration error for %s: %s", user_data.username, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to register user",
@@ -75,8 +76,10 @@ async def login(user_credentials: UserLoginSchema):
         user = await user_service.get_user_by_username(user_credentials.username)
 
         if not user:
+            # Still run a hash check so unknown usernames can't be told apart by timing
+            await verify_password_async(user_credentials.password, None)
             logger.warning(
-                f"Login attempt with non-existent username: {user_credentials.username}"
+                "Login attempt with non-existent username: %s", user_credentials.username
             )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -84,10 +87,10 @@ async def login(user_credentials: UserLoginSchema):
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Verify password
-        if not verify_password(user_credentials.password, user.password_hash):
+        # Verify password off the event loop; bcrypt takes tens of milliseconds
+        if not await verify_password_async(user_credentials.password, user.password_hash):
             logger.warning(
-                f"Login attempt with incorrect password for user: {user_credentials.username}"
+                "Login attempt with incorrect password for user: %s", user_credentials.username
             )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -98,7 +101,7 @@ async def login(user_credentials: UserLoginSchema):
         # Check if user is active
         if not user.is_active:
             logger.warning(
-                f"Login attempt for inactive user: {user_credentials.username}"
+                "Login attempt for inactive user: %s", user_credentials.username
             )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -117,14 +120,14 @@ async def login(user_credentials: UserLoginSchema):
         }
         access_token = create_access_token(data=token_data)
 
-        logger.info(f"User logged in successfully: {user_credentials.username}")
-        return TokenSchema(access_token=access_token)
+        logger.info("User logged in successfully: %s", user_credentials.username)
+        return ORJSONResponse(TokenSchema(access_token=access_token).model_dump())
 
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
-        logger.error(f"Login error for {user_credentials.username}: {e}")
+        logger.error("Login error for %s: %s", user_credentials.username, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Login failed"
         )
@@ -141,8 +144,8 @@ async def logout(_: dict = Depends(get_current_user)):
 @router.get("/me", response_model=dict)
 async def get_current_user_info(current_user: dict = Depends(get_current_user)):
     """Get current user information"""
-    return {
+    return ORJSONResponse({
         "username": current_user["username"],
         "user_id": current_user["user_id"],
         "role": current_user["role"],
-    }
+    })
@@ -6,9 +6,10 @@ including retrieving, marking as read, and managing user notifications.
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from typing import Optional
 
+from app.core.responses import PreSerializedJSONResponse
 from app.routers.auth import get_current_user
 from app.services.notification_service import notification_service
 from app.schemas.notification import (
@@ -21,6 +22,26 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+# Clients must revalidate the counts on every poll, but may reuse their copy on 304
+_COUNT_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches an ETag
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        bool: True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
 
 @router.get("", response_model=NotificationListResponse)
 async def get_notifications(
@@ -44,12 +65,12 @@ async def get_notifications(
     Returns:
         NotificationListResponse: Paginated list of notifications with metadata
     """
+    user_id = current_user["user_id"]
+
     try:
-        user_id = current_user["user_id"]
-        
         logger.info(
-            f"Getting notifications for user {user_id} "
-            f"(page: {page}, limit: {limit}, unread_only: {unread_only})"
+            "Getting notifications for user %s (page: %d, limit: %d, unread_only: %s)",
+            user_id, page, limit, unread_only
         )
         
         # Get notifications from service
@@ -60,15 +81,18 @@ async def get_notifications(
             unread_only=unread_only
         )
         
-        logger.debug(
-            f"Retrieved {len(result.notifications)} notifications for user {user_id} "
-            f"(total: {result.total}, unread: {result.unread_count})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Retrieved %d notifications for user %s (total: %d, unread: %d)",
+                len(result.notifications), user_id, result.total, result.unread_count
+            )
         
-        return result
+        # Built by the service, so dump it straight to JSON instead of letting
+        # FastAPI revalidate it and encode it a second time
+        return PreSerializedJSONResponse(result.model_dump_json())
         
     except Exception as e:
-        logger.error(f"Error getting notifications for user {current_user.get('user_id')}: {str(e)}")
+        logger.error("Error getting notifications for user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve notifications"
@@ -76,36 +100,51 @@ async def get_notifications(
 
 
 @router.get("/unread-count", response_model=NotificationCountResponse)
-async def get_unread_count(current_user: dict = Depends(get_current_user)):
+async def get_unread_count(
+    request: Request,
+    current_user: dict = Depends(get_current_user)
+):
     """
     Get notification counts for the current user
     
     This endpoint returns the count of unread and total notifications
-    for the authenticated user.
+    for the authenticated user. The counts are tagged with an ETag; pollers
+    that send it back in If-None-Match get an empty 304 while nothing changed.
     
     Args:
+        request: Incoming request (for If-None-Match)
         current_user: Current authenticated user
         
     Returns:
-        NotificationCountResponse: Notification counts
+        NotificationCountResponse: Notification counts, or 304 Not Modified
     """
+    user_id = current_user["user_id"]
+
     try:
-        user_id = current_user["user_id"]
-        
-        logger.debug(f"Getting notification counts for user {user_id}")
+        logger.debug("Getting notification counts for user %s", user_id)
         
         # Get counts from service
         result = await notification_service.get_unread_count(user_id)
         
         logger.debug(
-            f"User {user_id} has {result.unread_count} unread notifications "
-            f"out of {result.total_count} total"
+            "User %s has %d unread notifications out of %d total",
+            user_id, result.unread_count, result.total_count
+        )
+
+        etag = f'W/"{result.unread_count}-{result.total_count}"'
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": _COUNT_CACHE_CONTROL}
+            )
+
+        return PreSerializedJSONResponse(
+            result.model_dump_json(),
+            headers={"ETag": etag, "Cache-Control": _COUNT_CACHE_CONTROL}
         )
-        
-        return result
         
     except Exception as e:
-        logger.error(f"Error getting notification counts for user {current_user.get('user_id')}: {str(e)}")
+        logger.error("Error getting notification counts for user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve notification counts"
@@ -130,19 +169,19 @@ async def mark_notification_as_read(
     Returns:
         dict: Success message
     """
+    user_id = current_user["user_id"]
+
     try:
-        user_id = current_user["user_id"]
-        
-        logger.info(f"Marking notification {notification_id} as read for user {user_id}")
+        logger.info("Marking notification %s as read for user %s", notification_id, user_id)
         
         # Mark notification as read
         success = await notification_service.mark_as_read(notification_id, user_id)
         
         if success:
-            logger.info(f"Successfully marked notification {notification_id} as read")
+            logger.info("Successfully marked notification %s as read", notification_id)
             return {"message": "Notification marked as read", "notification_id": notification_id}
         else:
-            logger.warning(f"Notification {notification_id} not found or already read")
+            logger.warning("Notification %s not found or already read", notification_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Notification not found or already read"
@@ -151,7 +190,7 @@ async def mark_notification_as_read(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error marking notification {notification_id} as read: {str(e)}")
+        logger.error("Error marking notification %s as read: %s", notification_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to mark notification as read"
@@ -171,15 +210,15 @@ async def mark_all_notifications_as_read(current_user: dict = Depends(get_curren
     Returns:
         dict: Success message with count of notifications marked as read
     """
+    user_id = current_user["user_id"]
+
     try:
-        user_id = current_user["user_id"]
-        
-        logger.info(f"Marking all notifications as read for user {user_id}")
+        logger.info("Marking all notifications as read for user %s", user_id)
         
         # Mark all notifications as read
         count = await notification_service.mark_all_as_read(user_id)
         
-        logger.info(f"Marked {count} notifications as read for user {user_id}")
+        logger.info("Marked %d notifications as read for user %s", count, user_id)
         
         return {
             "message": f"Marked {count} notifications as read",
@@ -187,7 +226,7 @@ async def mark_all_notifications_as_read(current_user: dict = Depends(get_curren
         }
         
     except Exception as e:
-        logger.error(f"Error marking all notifications as read for user {current_user.get('user_id')}: {str(e)}")
+        logger.error("Error marking all notifications as read for user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to mark all notifications as read"
@@ -212,19 +251,19 @@ async def delete_notification(
     Returns:
         dict: Success message
     """
+    user_id = current_user["user_id"]
+
     try:
-        user_id = current_user["user_id"]
-        
-        logger.info(f"Deleting notification {notification_id} for user {user_id}")
+        logger.info("Deleting notification %s for user %s", notification_id, user_id)
         
         # Delete notification
         success = await notification_service.delete_notification(notification_id, user_id)
         
         if success:
-            logger.info(f"Successfully deleted notification {notification_id}")
+            logger.info("Successfully deleted notification %s", notification_id)
             return {"message": "Notification deleted", "notification_id": notification_id}
         else:
-            logger.warning(f"Notification {notification_id} not found for user {user_id}")
+            logger.warning("Notification %s not found for user %s", notification_id, user_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Notification not found"
@@ -233,7 +272,7 @@ async def delete_notification(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting notification {notification_id}: {str(e)}")
+        logger.error("Error deleting notification %s: %s", notification_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete notification"
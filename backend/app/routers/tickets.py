@@ -50,24 +50,7 @@ async def create_ticket(
         )
 
         # Convert to response schema
-        ticket_response = TicketSchema(
-            id=str(ticket_model._id),
-            ticket_id=ticket_model.ticket_id,
-            title=ticket_model.title,
-            description=ticket_model.description,
-            urgency=ticket_model.urgency,
-            status=ticket_model.status,
-            department=ticket_model.department,
-            assignee_id=(
-                str(ticket_model.assignee_id) if ticket_model.assignee_id else None
-            ),
-            user_id=str(ticket_model.user_id),
-            created_at=ticket_model.created_at,
-            updated_at=ticket_model.updated_at,
-            closed_at=ticket_model.closed_at,
-            misuse_flag=ticket_model.misuse_flag,
-            feedback=ticket_model.feedback,
-        )
+        ticket_response = TicketSchema(**ticket_model.to_response_dict())
 
         logger.info(f"Successfully created ticket {ticket_model.ticket_id}")
         return ticket_response
@@ -165,23 +148,7 @@ async def get_tickets(
                 user_info = TicketUserInfo(**ticket_model.user_info)
 
             ticket_schema = TicketSchema(
-                id=str(ticket_model._id),
-                ticket_id=ticket_model.ticket_id,
-                title=ticket_model.title,
-                description=ticket_model.description,
-                urgency=ticket_model.urgency,
-                status=ticket_model.status,
-                department=ticket_model.department,
-                assignee_id=(
-                    str(ticket_model.assignee_id) if ticket_model.assignee_id else None
-                ),
-                user_id=str(ticket_model.user_id),
-                user_info=user_info,
-                created_at=ticket_model.created_at,
-                updated_at=ticket_model.updated_at,
-                closed_at=ticket_model.closed_at,
-                misuse_flag=ticket_model.misuse_flag,
-                feedback=ticket_model.feedback,
+                **ticket_model.to_response_dict(), user_info=user_info
             )
             tickets_response.append(ticket_schema)
 
@@ -257,24 +224,7 @@ async def get_ticket_by_id(
                 )
 
         # Convert to response schema
-        ticket_response = TicketSchema(
-            id=str(ticket_model._id),
-            ticket_id=ticket_model.ticket_id,
-            title=ticket_model.title,
-            description=ticket_model.description,
-            urgency=ticket_model.urgency,
-            status=ticket_model.status,
-            department=ticket_model.department,
-            assignee_id=(
-                str(ticket_model.assignee_id) if ticket_model.assignee_id else None
-            ),
-            user_id=str(ticket_model.user_id),
-            created_at=ticket_model.created_at,
-            updated_at=ticket_model.updated_at,
-            closed_at=ticket_model.closed_at,
-            misuse_flag=ticket_model.misuse_flag,
-            feedback=ticket_model.feedback,
-        )
+        ticket_response = TicketSchema(**ticket_model.to_response_dict())
 
         logger.info(
             f"Successfully retrieved ticket {ticket_id} for user {current_user['user_id']} with role {user_role.value}"
@@ -344,24 +294,7 @@ async def update_ticket(
                 )
 
         # Convert to response schema
-        ticket_response = TicketSchema(
-            id=str(updated_ticket._id),
-            ticket_id=updated_ticket.ticket_id,
-            title=updated_ticket.title,
-            description=updated_ticket.description,
-            urgency=updated_ticket.urgency,
-            status=updated_ticket.status,
-            department=updated_ticket.department,
-            assignee_id=(
-                str(updated_ticket.assignee_id) if updated_ticket.assignee_id else None
-            ),
-            user_id=str(updated_ticket.user_id),
-            created_at=updated_ticket.created_at,
-            updated_at=updated_ticket.updated_at,
-            closed_at=updated_ticket.closed_at,
-            misuse_flag=updated_ticket.misuse_flag,
-            feedback=updated_ticket.feedback,
-        )
+        ticket_response = TicketSchema(**updated_ticket.to_response_dict())
 
         logger.info(f"Successfully updated ticket {ticket_id}")
         logger.info(f"Returning updated ticket data: {ticket_response.model_dump()}")
@@ -6,7 +6,10 @@ to provide comprehensive answers to user queries. The agent uses LangGraph's cre
 with two main tools: RAG database querying and web search.
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, Any, List, Optional
 from langchain_core.tools import tool
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -332,6 +335,49 @@ def query_agent(query: str, session_id: Optional[str] = None) -> Dict[str, Any]:
         }
 
 
+# Dedicated worker pool for agent queries (lazy initialization)
+_agent_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_agent_executor() -> ThreadPoolExecutor:
+    """
+    Get the bounded thread pool used to run agent queries.
+
+    Returns:
+        ThreadPoolExecutor: Executor sized by AGENT_MAX_WORKERS
+    """
+    global _agent_executor
+
+    if _agent_executor is None:
+        _agent_executor = ThreadPoolExecutor(
+            max_workers=ai_config.AGENT_MAX_WORKERS,
+            thread_name_prefix="ai-agent"
+        )
+
+    return _agent_executor
+
+
+async def run_agent_query(query: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run query_agent without blocking the event loop.
+
+    Agent calls take seconds, so they run on their own bounded pool instead of
+    the default executor; a burst of agent queries then queues up here rather
+    than starving the database and file work that shares the default pool.
+
+    Args:
+        query (str): The user's question or request
+        session_id (Optional[str]): Optional session ID for conversation tracking
+
+    Returns:
+        Dict[str, Any]: Response containing the agent's answer and metadata
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_agent_executor(), partial(query_agent, query, session_id=session_id)
+    )
+
+
 # Global agent instance (lazy initialization)
 _agent_instance = None
 
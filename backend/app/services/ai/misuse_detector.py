@@ -132,7 +132,7 @@ async def _collect_user_tickets(user_id: str, window_hours: int) -> List[TicketM
         tickets_data = await cursor.to_list(length=None)  # Get all matching tickets
         
         # Convert to ticket models
-        tickets = [TicketModel.from_dict(ticket_data) for ticket_data in tickets_data]
+        tickets = TicketModel.from_dicts(tickets_data)
         
         logger.debug(f"Found {len(tickets)} tickets for user {user_id} in last {window_hours}h")
         return tickets
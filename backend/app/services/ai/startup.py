@@ -6,13 +6,19 @@ Should be called during application startup to ensure all AI components are read
 """
 
 import logging
+import threading
 from typing import Dict, Any
+from cachetools import TTLCache, cached
 from app.core.ai_config import ai_config
 from app.services.ai.vector_store import initialize_vector_store, get_vector_store_manager
 from app.services.ai.knowledge_base import initialize_knowledge_base
 
 logger = logging.getLogger(__name__)
 
+# Status and health results are display snapshots polled by the admin dashboard;
+# caching them briefly avoids re-querying the vector index on every refresh
+AI_STATUS_TTL_SECONDS = 2
+
 
 def initialize_ai_services() -> Dict[str, Any]:
     """
@@ -91,9 +97,12 @@ def initialize_ai_services() -> Dict[str, Any]:
         return initialization_result
 
 
+@cached(cache=TTLCache(maxsize=1, ttl=AI_STATUS_TTL_SECONDS), lock=threading.Lock())
 def get_ai_services_status() -> Dict[str, Any]:
     """
     Get current status of AI services.
+
+    Results are cached for AI_STATUS_TTL_SECONDS.
     
     Returns:
         Dict with current status information
@@ -149,9 +158,12 @@ def get_ai_services_status() -> Dict[str, Any]:
         }
 
 
+@cached(cache=TTLCache(maxsize=1, ttl=AI_STATUS_TTL_SECONDS), lock=threading.Lock())
 def health_check() -> Dict[str, Any]:
     """
     Perform health check on AI services.
+
+    Results are cached for AI_STATUS_TTL_SECONDS.
     
     Returns:
         Dict with health check results
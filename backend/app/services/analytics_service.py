@@ -106,6 +106,26 @@ class AnalyticsService:
             logger.error(f"Error generating overview analytics: {str(e)}")
             raise
     
+    async def get_resolution_statistics(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get resolution time statistics without computing the full overview.
+
+        Args:
+            days: Number of days to analyze (None for all-time)
+
+        Returns:
+            Dictionary containing overall and per-department resolution times
+        """
+        await self._ensure_db_connection()
+
+        try:
+            logger.info(f"Generating resolution statistics for {days or 'all-time'} days")
+            return await self._get_resolution_time_stats(self._get_date_filter(days))
+
+        except Exception as e:
+            logger.error(f"Error generating resolution statistics: {str(e)}")
+            raise
+    
     async def _get_ticket_volume_stats(self, date_filter: Dict[str, Any]) -> Dict[str, Any]:
         """Get ticket volume statistics"""
         pipeline = [
@@ -529,14 +549,17 @@ class AnalyticsService:
             # Get basic overview
             overview = await self.get_overview_analytics(days)
 
+            # Status, department and urgency breakdowns plus KPI inputs in one pass
+            breakdowns = await self._get_ticket_breakdowns(date_filter)
+
             # Get ticket status distribution for donut chart
-            status_distribution = await self._get_status_distribution(date_filter)
+            status_distribution = self._build_status_distribution(breakdowns["by_status"])
 
             # Get department workload for bar chart
-            department_workload = await self._get_department_workload(date_filter)
+            department_workload = self._build_department_workload(breakdowns["by_department"])
 
             # Get urgency distribution for pie chart
-            urgency_distribution = await self._get_urgency_distribution(date_filter)
+            urgency_distribution = self._build_urgency_distribution(breakdowns["by_urgency"])
 
             # Get daily ticket creation for line chart
             daily_creation = await self._get_daily_ticket_creation(days)
@@ -545,7 +568,7 @@ class AnalyticsService:
             agent_performance = await self._get_agent_performance_summary(date_filter)
 
             # Calculate key performance indicators
-            kpis = await self._calculate_kpis(date_filter)
+            kpis = self._build_kpis(breakdowns)
 
             dashboard_metrics = {
                 "period": f"Last {days} days",
@@ -661,21 +684,77 @@ class AnalyticsService:
             raise
 
     # Helper methods for dashboard metrics
-    async def _get_status_distribution(self, date_filter: Dict[str, Any]) -> Dict[str, Any]:
-        """Get ticket status distribution for donut chart"""
+    async def _get_ticket_breakdowns(self, date_filter: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the dashboard's ticket breakdowns with a single $facet aggregation
+
+        The status, department and urgency groupings and the KPI inputs all
+        read the same date-filtered tickets, so MongoDB scans them once.
+
+        Args:
+            date_filter: MongoDB date filter
+
+        Returns:
+            Dictionary of facet name to its grouped rows
+        """
         pipeline = [
             {"$match": date_filter},
             {
-                "$group": {
-                    "_id": "$status",
-                    "count": {"$sum": 1}
+                "$facet": {
+                    "by_status": [
+                        {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1}}
+                    ],
+                    "by_department": [
+                        {
+                            "$group": {
+                                "_id": "$department",
+                                "total_tickets": {"$sum": 1},
+                                "open_tickets": {
+                                    "$sum": {"$cond": [{"$eq": ["$status", "open"]}, 1, 0]}
+                                },
+                                "assigned_tickets": {
+                                    "$sum": {"$cond": [{"$eq": ["$status", "assigned"]}, 1, 0]}
+                                },
+                                "resolved_tickets": {
+                                    "$sum": {"$cond": [{"$eq": ["$status", "resolved"]}, 1, 0]}
+                                }
+                            }
+                        }
+                    ],
+                    "by_urgency": [
+                        {"$group": {"_id": "$urgency", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1}}
+                    ],
+                    "resolution_time": [
+                        {"$match": {"status": "closed", "closed_at": {"$ne": None}}},
+                        {
+                            "$group": {
+                                "_id": None,
+                                "avg_resolution_time": {
+                                    "$avg": {
+                                        "$divide": [
+                                            {"$subtract": ["$closed_at", "$created_at"]},
+                                            1000 * 60 * 60  # Convert to hours
+                                        ]
+                                    }
+                                }
+                            }
+                        }
+                    ],
+                    "feedback": [
+                        {"$match": {"feedback": {"$ne": None}}},
+                        {"$count": "feedback_count"}
+                    ]
                 }
-            },
-            {"$sort": {"count": -1}}
+            }
         ]
 
-        results = await self.tickets_collection.aggregate(pipeline).to_list(10)
+        result = await self.tickets_collection.aggregate(pipeline).to_list(1)
+        return result[0]
 
+    def _build_status_distribution(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build ticket status distribution for donut chart"""
         labels = []
         data = []
         colors = {
@@ -698,29 +777,8 @@ class AnalyticsService:
             "chart_type": "doughnut"
         }
 
-    async def _get_department_workload(self, date_filter: Dict[str, Any]) -> Dict[str, Any]:
-        """Get department workload for bar chart"""
-        pipeline = [
-            {"$match": date_filter},
-            {
-                "$group": {
-                    "_id": "$department",
-                    "total_tickets": {"$sum": 1},
-                    "open_tickets": {
-                        "$sum": {"$cond": [{"$eq": ["$status", "open"]}, 1, 0]}
-                    },
-                    "assigned_tickets": {
-                        "$sum": {"$cond": [{"$eq": ["$status", "assigned"]}, 1, 0]}
-                    },
-                    "resolved_tickets": {
-                        "$sum": {"$cond": [{"$eq": ["$status", "resolved"]}, 1, 0]}
-                    }
-                }
-            }
-        ]
-
-        results = await self.tickets_collection.aggregate(pipeline).to_list(10)
-
+    def _build_department_workload(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build department workload for bar chart"""
         departments = []
         total_data = []
         open_data = []
@@ -762,21 +820,8 @@ class AnalyticsService:
             "chart_type": "bar"
         }
 
-    async def _get_urgency_distribution(self, date_filter: Dict[str, Any]) -> Dict[str, Any]:
-        """Get urgency distribution for pie chart"""
-        pipeline = [
-            {"$match": date_filter},
-            {
-                "$group": {
-                    "_id": "$urgency",
-                    "count": {"$sum": 1}
-                }
-            },
-            {"$sort": {"count": -1}}
-        ]
-
-        results = await self.tickets_collection.aggregate(pipeline).to_list(10)
-
+    def _build_urgency_distribution(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build urgency distribution for pie chart"""
         labels = []
         data = []
         colors = {
@@ -902,13 +947,14 @@ class AnalyticsService:
             "chart_type": "table"
         }
 
-    async def _calculate_kpis(self, date_filter: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate key performance indicators"""
+    def _build_kpis(self, breakdowns: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Calculate key performance indicators from the ticket breakdowns"""
         # Get basic ticket counts
-        total_tickets = await self.tickets_collection.count_documents(date_filter)
-        open_tickets = await self.tickets_collection.count_documents({**date_filter, "status": "open"})
-        resolved_tickets = await self.tickets_collection.count_documents({**date_filter, "status": "resolved"})
-        closed_tickets = await self.tickets_collection.count_documents({**date_filter, "status": "closed"})
+        status_counts = {result["_id"]: result["count"] for result in breakdowns["by_status"]}
+        total_tickets = sum(status_counts.values())
+        open_tickets = status_counts.get("open", 0)
+        resolved_tickets = status_counts.get("resolved", 0)
+        closed_tickets = status_counts.get("closed", 0)
 
         # Calculate resolution rate
         resolution_rate = 0
@@ -917,37 +963,12 @@ class AnalyticsService:
 
         # Get average resolution time for closed tickets
         avg_resolution_time = 0
-        pipeline = [
-            {"$match": {**date_filter, "status": "closed", "closed_at": {"$ne": None}}},
-            {
-                "$addFields": {
-                    "resolution_time_hours": {
-                        "$divide": [
-                            {"$subtract": ["$closed_at", "$created_at"]},
-                            1000 * 60 * 60  # Convert to hours
-                        ]
-                    }
-                }
-            },
-            {
-                "$group": {
-                    "_id": None,
-                    "avg_resolution_time": {"$avg": "$resolution_time_hours"}
-                }
-            }
-        ]
-
-        resolution_result = await self.tickets_collection.aggregate(pipeline).to_list(1)
+        resolution_result = breakdowns["resolution_time"]
         if resolution_result:
             avg_resolution_time = round(resolution_result[0]["avg_resolution_time"], 1)
 
         # Get user satisfaction (from feedback)
-        satisfaction_pipeline = [
-            {"$match": {**date_filter, "feedback": {"$ne": None}}},
-            {"$count": "feedback_count"}
-        ]
-
-        feedback_result = await self.tickets_collection.aggregate(satisfaction_pipeline).to_list(1)
+        feedback_result = breakdowns["feedback"]
         feedback_count = feedback_result[0]["feedback_count"] if feedback_result else 0
 
         return {
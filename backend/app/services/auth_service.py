@@ -1,19 +1,42 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
+import orjson
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from dotenv import load_dotenv
-
-load_dotenv()
+from app.core.env import get_env
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is deliberately CPU-bound, so hashing gets its own pool capped at the
+# core count; login bursts queue here instead of starving the default executor
+PASSWORD_HASH_WORKERS = os.cpu_count() or 1
+_password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
 # JWT settings
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here-change-in-production")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+SECRET_KEY = get_env("SECRET_KEY", "your-secret-key-here-change-in-production")
+ALGORITHM = get_env("ALGORITHM", "HS256")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(get_env("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+
+# HMAC algorithms verified directly with hashlib instead of through python-jose
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+
+# Claims this module issues; tokens carrying anything else go through python-jose's
+# full claim validation
+_FAST_PATH_CLAIMS = frozenset({"sub", "user_id", "role", "exp"})
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -26,6 +49,41 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash checked for unknown usernames so they take as long as a wrong password"""
+    return pwd_context.hash(os.urandom(16).hex())
+
+
+def _verify_dummy_password(plain_password: str) -> None:
+    """Spend the time of a password check; only the elapsed time matters, not the outcome"""
+    with suppress(ValueError):
+        pwd_context.verify(plain_password, _dummy_password_hash())
+
+
+async def verify_password_async(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    Verify a password on the password hashing pool without blocking the event loop
+
+    Passing hashed_password=None (unknown user) checks against a dummy hash and
+    returns False, keeping the response time the same as for a wrong password.
+    """
+    loop = asyncio.get_running_loop()
+    if hashed_password is None:
+        await loop.run_in_executor(_password_executor, _verify_dummy_password, plain_password)
+        return False
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password hashing pool without blocking the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(
+        _password_executor, hash_password, password
+    )
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -40,8 +98,64 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment"""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_hmac_token(token: str, digest) -> Optional[dict]:
+    """
+    Verify and decode an HMAC-signed token issued by this module
+
+    The signature is checked with hmac/hashlib (C implementations) and the
+    segments parsed with orjson. Returns None when the token must be handled
+    by python-jose instead: malformed or unexpected tokens, and claims beyond
+    the ones create_access_token issues. Raises JWTError for tokens that are
+    definitely invalid.
+    """
+    try:
+        signing_input, _, signature_b64 = token.rpartition(".")
+        header_b64, _, payload_b64 = signing_input.partition(".")
+        header = orjson.loads(_b64url_decode(header_b64))
+        signature = _b64url_decode(signature_b64)
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except (ValueError, binascii.Error):
+        return None
+
+    if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+        return None
+    if not isinstance(payload, dict) or not payload.keys() <= _FAST_PATH_CLAIMS:
+        return None
+
+    expected = hmac.new(_SECRET_KEY_BYTES, signing_input.encode(), digest).digest()
+    if not hmac.compare_digest(expected, signature):
+        raise JWTError("Signature verification failed.")
+
+    exp = payload.get("exp")
+    if exp is not None:
+        if type(exp) is not int:
+            return None
+        if exp < int(time.time()):
+            raise JWTError("Signature has expired.")
+
+    sub = payload.get("sub")
+    if sub is not None and not isinstance(sub, str):
+        raise JWTError("Subject must be a string.")
+
+    return payload
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and validate a JWT access token"""
+    digest = _HMAC_DIGESTS.get(ALGORITHM)
+    if digest is not None:
+        try:
+            payload = _decode_hmac_token(token, digest)
+        except JWTError:
+            return None
+        if payload is not None:
+            return payload
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
@@ -55,6 +169,11 @@ def get_token_data(token: str) -> Optional[dict]:
     if payload is None:
         return None
 
+    return token_data_from_payload(payload)
+
+
+def token_data_from_payload(payload: dict) -> Optional[dict]:
+    """Extract user data from a decoded JWT payload"""
     username: str = payload.get("sub")
     if username is None:
         return None
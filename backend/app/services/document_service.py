@@ -5,6 +5,7 @@ This service handles document upload, text extraction, chunking,
 and storage in the vector database for RAG functionality.
 """
 
+import asyncio
 import logging
 import hashlib
 import tempfile
@@ -13,6 +14,7 @@ import time
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
+from cachetools import TTLCache
 
 import PyPDF2
 from docx import Document as DocxDocument
@@ -23,19 +25,30 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 from app.schemas.document import (
     DocumentType, DocumentCategory, DocumentUploadResponse,
-    DocumentMetadata, KnowledgeBaseStats
+    DocumentMetadata, DocumentProcessingStatus, KnowledgeBaseStats
 )
 from app.services.ai.vector_store import get_vector_store_manager
 from app.core.database import get_database
 
 logger = logging.getLogger(__name__)
 
+# Uploads are copied to disk in blocks of this size rather than read whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Knowledge base stats only change when a document is uploaded, which clears the cache
+KB_STATS_CACHE_TTL_SECONDS = 300
+
+# Background upload job records are removed by MongoDB this long after creation
+UPLOAD_JOB_TTL_SECONDS = 24 * 60 * 60
+
 
 class DocumentService:
     """Service for document processing and knowledge base management"""
     
     def __init__(self):
         self.collection_name = "documents"
+        self.jobs_collection_name = "document_jobs"
+        self._stats_cache: TTLCache = TTLCache(maxsize=1, ttl=KB_STATS_CACHE_TTL_SECONDS)
         self.max_file_size = 50 * 1024 * 1024  # 50MB
         self.supported_types = {
             "application/pdf": DocumentType.PDF,
@@ -75,77 +88,274 @@ class DocumentService:
         start_time = time.time()
         
         try:
-            # Validate file
-            await self._validate_file(file)
-            
-            # Determine document type
-            doc_type = self._get_document_type(file.content_type, file.filename)
-            
-            # Generate document ID and metadata
-            document_id = self._generate_document_id(file.filename, uploaded_by)
-            
-            # Save file temporarily for processing
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{doc_type.value}") as temp_file:
-                content = await file.read()
-                temp_file.write(content)
-                temp_file_path = temp_file.name
+            document_id, doc_type, temp_file_path = await self._stage_upload(file, uploaded_by)
             
             try:
-                # Extract text from document
-                text_content, pages_processed = await self._extract_text(temp_file_path, doc_type)
-                
-                # Create text chunks
-                chunks = self._create_chunks(text_content, document_id, file.filename, category)
-                
-                # Store in vector database
-                vectors_stored = await self._store_in_vector_db(chunks)
-                
-                # Save document metadata
-                metadata = DocumentMetadata(
-                    document_id=document_id,
-                    filename=file.filename,
-                    original_filename=file.filename,
-                    file_size=len(content),
-                    document_type=doc_type,
-                    category=category,
-                    uploaded_by=uploaded_by,
-                    uploaded_at=datetime.now(timezone.utc),
-                    pages_processed=pages_processed,
-                    chunks_created=len(chunks),
-                    vectors_stored=vectors_stored,
-                    processing_time=time.time() - start_time,
-                    checksum=hashlib.md5(content).hexdigest()
-                )
-                
-                await self._save_metadata(metadata)
-                
-                logger.info(f"Document processed successfully: {file.filename} -> {vectors_stored} vectors")
-                
-                return DocumentUploadResponse(
-                    document_id=document_id,
-                    filename=file.filename,
-                    file_size=len(content),
-                    document_type=doc_type,
-                    category=category,
-                    pages_processed=pages_processed,
-                    chunks_created=len(chunks),
-                    vectors_stored=vectors_stored,
-                    processing_time=time.time() - start_time,
-                    uploaded_at=metadata.uploaded_at,
-                    uploaded_by=uploaded_by
+                return await self._process_file(
+                    temp_file_path, document_id, file.filename, doc_type, category, uploaded_by, start_time
                 )
-                
             finally:
                 # Clean up temporary file
                 if os.path.exists(temp_file_path):
                     os.unlink(temp_file_path)
                     
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Document processing failed: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Document processing failed: {str(e)}"
             )
+
+    async def start_upload_job(
+        self,
+        file: UploadFile,
+        category: DocumentCategory,
+        uploaded_by: str
+    ) -> Tuple[DocumentProcessingStatus, Dict[str, Any]]:
+        """
+        Validate and stage an upload for processing in the background.
+
+        The file is validated and written to a temporary file before the request
+        returns; a job record keyed by the document ID tracks its progress.
+
+        Args:
+            file: Uploaded file object
+            category: Document category
+            uploaded_by: Username of the admin who uploaded the document
+
+        Returns:
+            Tuple of the initial job status and the keyword arguments for run_upload_job
+
+        Raises:
+            HTTPException: If file validation fails
+        """
+        document_id, doc_type, temp_file_path = await self._stage_upload(file, uploaded_by)
+
+        job_status = DocumentProcessingStatus(
+            document_id=document_id,
+            status="processing",
+            progress=0.0,
+            message=f"Processing {file.filename}"
+        )
+        db = get_database()
+        try:
+            await db[self.jobs_collection_name].insert_one({
+                "_id": document_id,
+                **job_status.model_dump(),
+                "filename": file.filename,
+                "uploaded_by": uploaded_by,
+                "created_at": datetime.now(timezone.utc)
+            })
+        except Exception:
+            # No job will pick up the staged file, so don't leave it behind
+            os.unlink(temp_file_path)
+            raise
+
+        job_args = {
+            "temp_file_path": temp_file_path,
+            "document_id": document_id,
+            "filename": file.filename,
+            "doc_type": doc_type,
+            "category": category,
+            "uploaded_by": uploaded_by,
+            "start_time": time.time()
+        }
+        return job_status, job_args
+
+    async def run_upload_job(self, temp_file_path: str, document_id: str, **kwargs: Any) -> None:
+        """
+        Process a staged upload and record the outcome on its job.
+
+        Intended to run as a background task after start_upload_job; the
+        temporary file is always removed.
+
+        Args:
+            temp_file_path: Path of the staged upload
+            document_id: Document ID, also used as the job ID
+            **kwargs: Remaining arguments returned by start_upload_job
+        """
+        db = get_database()
+        jobs = db[self.jobs_collection_name]
+        try:
+            result = await self._process_file(temp_file_path, document_id, **kwargs)
+            update = {
+                "status": "completed",
+                "progress": 1.0,
+                "message": f"{result.vectors_stored} vectors stored",
+                "error": None
+            }
+        except Exception as e:
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            logger.error(f"Background document processing failed for {document_id}: {detail}")
+            update = {"status": "failed", "progress": 1.0, "error": detail}
+        finally:
+            if os.path.exists(temp_file_path):
+                os.unlink(temp_file_path)
+
+        await jobs.update_one({"_id": document_id}, {"$set": update})
+
+    async def get_upload_job(self, document_id: str) -> Optional[DocumentProcessingStatus]:
+        """
+        Get the status of a background upload job.
+
+        Args:
+            document_id: Document ID returned when the job was started
+
+        Returns:
+            DocumentProcessingStatus, or None if no such job exists
+        """
+        db = get_database()
+        job = await db[self.jobs_collection_name].find_one({"_id": document_id})
+        if job is None:
+            return None
+        return DocumentProcessingStatus(**{
+            key: job.get(key) for key in ("document_id", "status", "progress", "message", "error")
+        })
+
+    async def ensure_indexes(self) -> None:
+        """Create the TTL index that expires finished upload job records"""
+        db = get_database()
+        await db[self.jobs_collection_name].create_index(
+            "created_at", expireAfterSeconds=UPLOAD_JOB_TTL_SECONDS
+        )
+
+    async def _stage_upload(self, file: UploadFile, uploaded_by: str) -> Tuple[str, DocumentType, str]:
+        """
+        Validate an upload and write it to a temporary file.
+
+        Args:
+            file: Uploaded file object
+            uploaded_by: Username of the admin who uploaded the document
+
+        Returns:
+            Tuple of (document ID, document type, temporary file path)
+        """
+        # Validate file
+        await self._validate_file(file)
+        
+        # Determine document type
+        doc_type = self._get_document_type(file.content_type, file.filename)
+        
+        # Generate document ID and metadata
+        document_id = self._generate_document_id(file.filename, uploaded_by)
+        
+        # Save file temporarily for processing
+        temp_file_path = await self._stream_to_temp_file(file, doc_type)
+
+        return document_id, doc_type, temp_file_path
+
+    async def _stream_to_temp_file(self, file: UploadFile, doc_type: DocumentType) -> str:
+        """
+        Copy an upload to a temporary file one chunk at a time.
+
+        Only UPLOAD_CHUNK_SIZE bytes are held in memory at once. The size guard
+        is re-checked while copying since the declared size cannot be trusted
+        for every client.
+
+        Args:
+            file: Uploaded file object
+            doc_type: Document type, used for the file suffix
+
+        Returns:
+            Path of the temporary file
+
+        Raises:
+            HTTPException: If the upload exceeds the maximum file size
+        """
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f".{doc_type.value}")
+        written = 0
+        try:
+            with temp_file:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    written += len(chunk)
+                    if written > self.max_file_size:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"File too large. Maximum size: {self.max_file_size / (1024*1024):.1f}MB"
+                        )
+                    await asyncio.to_thread(temp_file.write, chunk)
+        except BaseException:
+            os.unlink(temp_file.name)
+            raise
+        return temp_file.name
+
+    async def _process_file(
+        self,
+        temp_file_path: str,
+        document_id: str,
+        filename: str,
+        doc_type: DocumentType,
+        category: DocumentCategory,
+        uploaded_by: str,
+        start_time: float
+    ) -> DocumentUploadResponse:
+        """
+        Extract, chunk, embed and record a staged document.
+
+        Parsing and the vector store write are blocking, so they run in worker
+        threads to keep the event loop free for other requests.
+
+        Returns:
+            DocumentUploadResponse with processing results
+        """
+        file_size, checksum = await asyncio.to_thread(self._file_size_and_checksum, temp_file_path)
+
+        # Extract text from document
+        text_content, pages_processed = await self._extract_text(temp_file_path, doc_type)
+        
+        # Create text chunks
+        chunks = self._create_chunks(text_content, document_id, filename, category)
+        
+        # Store in vector database
+        vectors_stored = await self._store_in_vector_db(chunks)
+        
+        # Save document metadata
+        metadata = DocumentMetadata(
+            document_id=document_id,
+            filename=filename,
+            original_filename=filename,
+            file_size=file_size,
+            document_type=doc_type,
+            category=category,
+            uploaded_by=uploaded_by,
+            uploaded_at=datetime.now(timezone.utc),
+            pages_processed=pages_processed,
+            chunks_created=len(chunks),
+            vectors_stored=vectors_stored,
+            processing_time=time.time() - start_time,
+            checksum=checksum
+        )
+        
+        await self._save_metadata(metadata)
+        
+        logger.info(f"Document processed successfully: {filename} -> {vectors_stored} vectors")
+        
+        return DocumentUploadResponse(
+            document_id=document_id,
+            filename=filename,
+            file_size=file_size,
+            document_type=doc_type,
+            category=category,
+            pages_processed=pages_processed,
+            chunks_created=len(chunks),
+            vectors_stored=vectors_stored,
+            processing_time=time.time() - start_time,
+            uploaded_at=metadata.uploaded_at,
+            uploaded_by=uploaded_by
+        )
+
+    @staticmethod
+    def _file_size_and_checksum(file_path: str) -> Tuple[int, str]:
+        """Get the size and MD5 checksum of a file without loading it whole"""
+        digest = hashlib.md5()
+        file_size = 0
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+                file_size += len(block)
+        return file_size, digest.hexdigest()
     
     async def _validate_file(self, file: UploadFile) -> None:
         """Validate uploaded file"""
@@ -203,14 +413,15 @@ class DocumentService:
     async def _extract_text(self, file_path: str, doc_type: DocumentType) -> Tuple[str, Optional[int]]:
         """Extract text content from document"""
         try:
+            # Parsers are synchronous and CPU-bound; keep them off the event loop
             if doc_type == DocumentType.PDF:
-                return await self._extract_pdf_text(file_path)
+                return await asyncio.to_thread(self._extract_pdf_text, file_path)
             elif doc_type == DocumentType.DOCX:
-                return await self._extract_docx_text(file_path)
+                return await asyncio.to_thread(self._extract_docx_text, file_path)
             elif doc_type == DocumentType.PPTX:
-                return await self._extract_pptx_text(file_path)
+                return await asyncio.to_thread(self._extract_pptx_text, file_path)
             elif doc_type == DocumentType.TXT:
-                return await self._extract_txt_text(file_path)
+                return await asyncio.to_thread(self._extract_txt_text, file_path)
             else:
                 raise ValueError(f"Unsupported document type: {doc_type}")
                 
@@ -221,7 +432,7 @@ class DocumentService:
                 detail=f"Failed to extract text from document: {str(e)}"
             )
     
-    async def _extract_pdf_text(self, file_path: str) -> Tuple[str, int]:
+    def _extract_pdf_text(self, file_path: str) -> Tuple[str, int]:
         """Extract text from PDF file"""
         text_content = []
         pages_processed = 0
@@ -235,7 +446,7 @@ class DocumentService:
         
         return "\n\n".join(text_content), pages_processed
     
-    async def _extract_docx_text(self, file_path: str) -> Tuple[str, None]:
+    def _extract_docx_text(self, file_path: str) -> Tuple[str, None]:
         """Extract text from DOCX file"""
         doc = DocxDocument(file_path)
         text_content = []
@@ -246,7 +457,7 @@ class DocumentService:
         
         return "\n\n".join(text_content), None
     
-    async def _extract_pptx_text(self, file_path: str) -> Tuple[str, int]:
+    def _extract_pptx_text(self, file_path: str) -> Tuple[str, int]:
         """Extract text from PPTX file"""
         prs = Presentation(file_path)
         text_content = []
@@ -263,7 +474,7 @@ class DocumentService:
         
         return "\n\n".join(text_content), slides_processed
     
-    async def _extract_txt_text(self, file_path: str) -> Tuple[str, None]:
+    def _extract_txt_text(self, file_path: str) -> Tuple[str, None]:
         """Extract text from TXT file"""
         with open(file_path, 'r', encoding='utf-8') as file:
             return file.read(), None
@@ -317,7 +528,8 @@ class DocumentService:
                 detail="Vector database not available"
             )
 
-        success = vector_store.add_documents(documents)
+        # Embedding and upserting are blocking network calls
+        success = await asyncio.to_thread(vector_store.add_documents, documents)
 
         if not success:
             raise HTTPException(
@@ -337,6 +549,7 @@ class DocumentService:
             document_dict["_id"] = metadata.document_id
 
             await collection.insert_one(document_dict)
+            self._stats_cache.clear()
             logger.debug(f"Saved metadata for document: {metadata.filename}")
 
         except Exception as e:
@@ -347,7 +560,11 @@ class DocumentService:
             )
 
     async def get_knowledge_base_stats(self) -> KnowledgeBaseStats:
-        """Get statistics about the knowledge base"""
+        """Get statistics about the knowledge base (cached until the next upload)"""
+        stats = self._stats_cache.get("stats")
+        if stats is not None:
+            return stats
+
         try:
             db = get_database()
             collection = db[self.collection_name]
@@ -388,7 +605,7 @@ class DocumentService:
             last_doc = await collection.find_one({}, sort=[("uploaded_at", -1)])
             last_updated = last_doc["uploaded_at"] if last_doc else None
 
-            return KnowledgeBaseStats(
+            stats = KnowledgeBaseStats(
                 total_documents=total_documents,
                 total_vectors=total_vectors,
                 documents_by_category=documents_by_category,
@@ -396,6 +613,8 @@ class DocumentService:
                 total_size_mb=round(total_size_mb, 2),
                 last_updated=last_updated
             )
+            self._stats_cache["stats"] = stats
+            return stats
 
         except Exception as e:
             logger.error(f"Failed to get knowledge base stats: {str(e)}")
@@ -5,15 +5,82 @@ This service handles saving and managing misuse detection results in the misuse_
 Provides functionality to create, retrieve, and manage misuse reports with proper deduplication.
 """
 
+import base64
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from bson import ObjectId
+from cachetools import TTLCache
+from pymongo import DESCENDING
 from app.core.database import get_database
 from app.models.misuse_report import MisuseReportModel
 
 logger = logging.getLogger(__name__)
 
+# How long the unreviewed report count shown on the dashboard may be stale
+UNREVIEWED_COUNT_TTL_SECONDS = 30
+
+# Newest first, with _id as a tie-breaker so keyset pagination is stable
+_REPORT_SORT = [("detection_date", DESCENDING), ("_id", DESCENDING)]
+
+# Joins the flagged user's username onto each report server-side
+_USER_NAME_LOOKUP_STAGES = [
+    {
+        "$lookup": {
+            "from": "users",
+            "let": {"user_id": "$user_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$user_id"]}}},
+                {"$project": {"_id": 0, "username": 1}},
+            ],
+            "as": "_user",
+        }
+    },
+    {
+        "$addFields": {
+            "user_name": {
+                "$ifNull": [{"$arrayElemAt": ["$_user.username", 0]}, "Unknown User"]
+            }
+        }
+    },
+    {"$project": {"_user": 0}},
+]
+
+
+def encode_report_cursor(detection_date: datetime, report_id: ObjectId) -> str:
+    """
+    Encode the sort key of the last report on a page as an opaque cursor
+
+    Args:
+        detection_date: Detection date of the last report
+        report_id: ObjectId of the last report
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    raw = f"{detection_date.isoformat()}|{report_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_report_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """
+    Decode a cursor produced by encode_report_cursor
+
+    Args:
+        cursor: Cursor token
+
+    Returns:
+        Tuple of (detection_date, report ObjectId)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        date_part, id_part = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(date_part), ObjectId(id_part)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 
 class MisuseReportsService:
     """Service for managing misuse reports in MongoDB"""
@@ -21,6 +88,7 @@ class MisuseReportsService:
     def __init__(self):
         self.db = None
         self.collection = None
+        self._unreviewed_count_cache = TTLCache(maxsize=1, ttl=UNREVIEWED_COUNT_TTL_SECONDS)
 
     def _ensure_db_connection(self):
         """Ensure database connection is established"""
@@ -73,6 +141,7 @@ class MisuseReportsService:
             # Insert into database
             result = await self.collection.insert_one(report_doc)
             report_id = str(result.inserted_id)
+            self._unreviewed_count_cache.clear()
             
             logger.info(f"Created misuse report {report_id} for user {user_id}")
             return report_id
@@ -207,6 +276,34 @@ class MisuseReportsService:
             logger.error(f"Error getting reports for user {user_id}: {str(e)}")
             return []
     
+    async def get_report_by_id(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a single misuse report.
+
+        Args:
+            report_id: ID of the report to retrieve
+
+        Returns:
+            Misuse report document, or None if no report has that ID
+        """
+        self._ensure_db_connection()
+        if not ObjectId.is_valid(report_id):
+            return None
+
+        report = await self.collection.find_one({"_id": ObjectId(report_id)})
+        if report is None:
+            return None
+
+        # Convert ObjectIds to strings for JSON serialization
+        report["_id"] = str(report["_id"])
+        report["user_id"] = str(report["user_id"])
+        if "evidence_data" in report and "ticket_ids" in report["evidence_data"]:
+            report["evidence_data"]["ticket_ids"] = [
+                str(tid) for tid in report["evidence_data"]["ticket_ids"]
+            ]
+
+        return report
+
     async def get_all_unreviewed_reports(self) -> List[Dict[str, Any]]:
         """
         Get all unreviewed misuse reports for admin dashboard.
@@ -293,6 +390,117 @@ class MisuseReportsService:
                 "total_pages": 0
             }
 
+    async def get_reports_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        unreviewed_only: bool = False,
+        page: int = 1,
+        include_total: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Get a page of misuse reports ordered by (detection_date, _id) descending.
+
+        When a cursor is given the page starts right after it using a range
+        query, so the cost does not grow with depth. Without a cursor the
+        page number is used with skip for backwards compatibility. Each report
+        carries the flagged user's user_name, joined in the same aggregation.
+
+        Args:
+            limit: Number of reports per page
+            cursor: Cursor from a previous page's next_cursor
+            unreviewed_only: If True, only return unreviewed reports
+            page: Page number (1-based), used only when no cursor is given
+            include_total: If True, count all matching reports (total_count is
+                None otherwise; use has_next to drive paging)
+
+        Returns:
+            Dict containing reports, counts and next_cursor/has_next
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        self._ensure_db_connection()
+        base_filter = {"admin_reviewed": False} if unreviewed_only else {}
+        query = dict(base_filter)
+        skip = 0
+        if cursor:
+            last_date, last_id = decode_report_cursor(cursor)
+            query["$or"] = [
+                {"detection_date": {"$lt": last_date}},
+                {"detection_date": last_date, "_id": {"$lt": last_id}},
+            ]
+        else:
+            skip = (page - 1) * limit
+
+        try:
+            total_count = (
+                await self.collection.count_documents(base_filter) if include_total else None
+            )
+            unreviewed_count = await self.get_unreviewed_count()
+
+            # Fetch one extra document to learn whether another page exists
+            pipeline = [{"$match": query}, {"$sort": dict(_REPORT_SORT)}]
+            if skip:
+                pipeline.append({"$skip": skip})
+            pipeline.append({"$limit": limit + 1})
+            pipeline.extend(_USER_NAME_LOOKUP_STAGES)
+            reports = await self.collection.aggregate(pipeline).to_list(length=limit + 1)
+
+            has_next = len(reports) > limit
+            reports = reports[:limit]
+            next_cursor = (
+                encode_report_cursor(reports[-1]["detection_date"], reports[-1]["_id"])
+                if has_next
+                else None
+            )
+
+            # Convert ObjectIds to strings for JSON serialization
+            for report in reports:
+                report["_id"] = str(report["_id"])
+                report["user_id"] = str(report["user_id"])
+                if "evidence_data" in report and "ticket_ids" in report["evidence_data"]:
+                    report["evidence_data"]["ticket_ids"] = [
+                        str(tid) for tid in report["evidence_data"]["ticket_ids"]
+                    ]
+
+            return {
+                "reports": reports,
+                "total_count": total_count,
+                "unreviewed_count": unreviewed_count,
+                "next_cursor": next_cursor,
+                "has_next": has_next,
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting misuse reports page: {str(e)}")
+            return {
+                "reports": [],
+                "total_count": 0,
+                "unreviewed_count": 0,
+                "next_cursor": None,
+                "has_next": False,
+            }
+
+    async def get_unreviewed_count(self) -> int:
+        """
+        Get the number of unreviewed reports, cached for a short period.
+
+        Returns:
+            int: Number of reports not yet reviewed by an admin
+        """
+        self._ensure_db_connection()
+        count = self._unreviewed_count_cache.get("unreviewed")
+        if count is None:
+            count = await self.collection.count_documents({"admin_reviewed": False})
+            self._unreviewed_count_cache["unreviewed"] = count
+        return count
+
+    async def ensure_indexes(self) -> None:
+        """Create the index backing the report listing sort and keyset pagination"""
+        self._ensure_db_connection()
+        await self.collection.create_index(_REPORT_SORT)
+
     async def mark_report_reviewed(self, report_id: str, action_taken: Optional[str] = None) -> bool:
         """
         Mark a misuse report as reviewed by admin.
@@ -320,6 +528,7 @@ class MisuseReportsService:
             )
             
             if result.modified_count > 0:
+                self._unreviewed_count_cache.clear()
                 logger.info(f"Marked misuse report {report_id} as reviewed")
                 return True
             else:
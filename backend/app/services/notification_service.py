@@ -6,9 +6,10 @@ retrieval, updates, and management of user notifications.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional, Tuple
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
 from pymongo.errors import PyMongoError
 
 from app.core.database import get_database
@@ -23,6 +24,9 @@ from app.schemas.notification import (
 
 logger = logging.getLogger(__name__)
 
+# Serves the mark-all-read update, the unread/total counts and the newest-first listing
+_USER_READ_INDEX = [("user_id", ASCENDING), ("read", ASCENDING), ("created_at", DESCENDING)]
+
 
 class NotificationService:
     """Service class for handling notification operations"""
@@ -36,6 +40,11 @@ class NotificationService:
         if self.db is None:
             self.db = get_database()
         return self.db[self.collection_name]
+
+    async def ensure_indexes(self) -> None:
+        """Create the index backing the per-user read-state queries and updates"""
+        collection = await self._get_collection()
+        await collection.create_index(_USER_READ_INDEX)
     
     async def create_notification(
         self,
@@ -196,7 +205,7 @@ class NotificationService:
                 {
                     "$set": {
                         "read": True,
-                        "read_at": datetime.utcnow()
+                        "read_at": datetime.now(timezone.utc)
                     }
                 }
             )
@@ -225,7 +234,7 @@ class NotificationService:
         try:
             collection = await self._get_collection()
             
-            # Update all unread notifications for the user
+            # Update all unread notifications for the user in a single round-trip
             result = await collection.update_many(
                 {
                     "user_id": user_id,
@@ -234,7 +243,7 @@ class NotificationService:
                 {
                     "$set": {
                         "read": True,
-                        "read_at": datetime.utcnow()
+                        "read_at": datetime.now(timezone.utc)
                     }
                 }
             )
@@ -13,10 +13,15 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
+from cachetools import TTLCache
 from app.services.daily_misuse_job import daily_misuse_job_service
 
 logger = logging.getLogger(__name__)
 
+# Status is a display-only snapshot; a short TTL keeps dashboard polling from
+# contending with the scheduler thread for the job store lock
+SCHEDULER_STATUS_TTL_SECONDS = 2
+
 
 class SchedulerService:
     """Service for managing background job scheduling"""
@@ -25,6 +30,7 @@ class SchedulerService:
         """Initialize the scheduler service"""
         self.scheduler: Optional[AsyncIOScheduler] = None
         self.is_running = False
+        self._status_cache: TTLCache = TTLCache(maxsize=1, ttl=SCHEDULER_STATUS_TTL_SECONDS)
         
         # Configuration from environment variables
         self.misuse_detection_enabled = os.getenv("MISUSE_DETECTION_ENABLED", "true").lower() == "true"
@@ -62,6 +68,7 @@ class SchedulerService:
             # Start the scheduler
             self.scheduler.start()
             self.is_running = True
+            self._status_cache.clear()
             
             logger.info("APScheduler started successfully")
 
@@ -100,6 +107,7 @@ class SchedulerService:
             self.scheduler.shutdown(wait=True)
             self.scheduler = None
             self.is_running = False
+            self._status_cache.clear()
             
             logger.info("APScheduler stopped successfully")
             
@@ -274,6 +282,7 @@ class SchedulerService:
                 replace_existing=True
             )
             
+            self._status_cache.clear()
             logger.info(f"Scheduled one-time misuse detection job {job_id} for {run_at}")
             return job_id
             
@@ -284,6 +293,23 @@ class SchedulerService:
     def get_scheduler_status(self) -> Dict[str, Any]:
         """
         Get the current status of the scheduler
+
+        Results are cached for SCHEDULER_STATUS_TTL_SECONDS; starting, stopping
+        or scheduling jobs invalidates the cache.
+        
+        Returns:
+            Dict containing scheduler status information
+        """
+        status = self._status_cache.get("status")
+        if status is None:
+            status = self._build_scheduler_status()
+            if "error" not in status:
+                self._status_cache["status"] = status
+        return status
+
+    def _build_scheduler_status(self) -> Dict[str, Any]:
+        """
+        Build the scheduler status by introspecting the APScheduler job store
         
         Returns:
             Dict containing scheduler status information
@@ -334,10 +360,12 @@ class SchedulerService:
     
     def _job_executed_listener(self, event):
         """Listener for successful job executions"""
+        self._status_cache.clear()
         logger.info(f"Job {event.job_id} executed successfully")
     
     def _job_error_listener(self, event):
         """Listener for job execution errors"""
+        self._status_cache.clear()
         logger.error(f"Job {event.job_id} failed with error: {event.exception}")
 
 
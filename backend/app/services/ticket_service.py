@@ -1,6 +1,7 @@
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any
 from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
 from app.core.database import get_database
 from app.models.ticket import TicketModel
 from app.schemas.ticket import (
@@ -143,7 +144,9 @@ class TicketService:
 
         try:
             # Insert ticket into database
-            result = await collection.insert_one(ticket_model.to_dict())
+            result = await collection.insert_one(
+                RawBSONDocument(ticket_model.to_raw_bson())
+            )
             ticket_model._id = result.inserted_id
 
             logger.info(
@@ -268,9 +271,7 @@ class TicketService:
             tickets_data = await cursor.to_list(length=limit)
 
             # Convert to ticket models
-            tickets = [
-                TicketModel.from_dict(ticket_data) for ticket_data in tickets_data
-            ]
+            tickets = TicketModel.from_dicts(tickets_data)
 
             logger.info(
                 f"Retrieved {len(tickets)} tickets for user {user_id} (page {page})"
@@ -516,9 +517,7 @@ class TicketService:
             tickets_data = await cursor.to_list(length=limit)
 
             # Convert to ticket models
-            tickets = [
-                TicketModel.from_dict(ticket_data) for ticket_data in tickets_data
-            ]
+            tickets = TicketModel.from_dicts(tickets_data)
 
             # For agents and admins, populate user information
             tickets_with_user_info = []
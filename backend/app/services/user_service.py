@@ -1,21 +1,43 @@
+import asyncio
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from bson import ObjectId
+from cachetools import TTLCache
 from pymongo.errors import DuplicateKeyError
 from app.core.database import get_database
 from app.models.user import UserModel
 from app.schemas.user import UserCreateSchema
-from app.services.auth_service import hash_password
+from app.services.auth_service import hash_password_async
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Users looked up by ID are reused for this long, e.g. across admin report pages
+USER_CACHE_TTL_SECONDS = 300
+USER_CACHE_MAX_SIZE = 10000
+
 
 class UserService:
     """Service for user database operations"""
 
     def __init__(self):
         self.collection_name = "users"
+        self._user_cache: TTLCache = TTLCache(
+            maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS
+        )
+        self._user_cache_locks: Dict[str, asyncio.Lock] = {}
+
+    def invalidate_user_cache(self, user_id: Optional[str] = None) -> None:
+        """
+        Drop cached users so the next lookup reads from the database
+
+        Args:
+            user_id: User ID to evict, or None to clear the whole cache
+        """
+        if user_id is None:
+            self._user_cache.clear()
+        else:
+            self._user_cache.pop(user_id, None)
 
     async def create_user(self, user_data: UserCreateSchema) -> UserModel:
         """
@@ -57,7 +79,7 @@ class UserService:
         user_model = UserModel(
             username=user_data.username,
             email=user_data.email,
-            password_hash=hash_password(user_data.password),
+            password_hash=await hash_password_async(user_data.password),
             role=user_data.role,
             is_active=True,
             created_at=datetime.now(timezone.utc),
@@ -86,6 +108,9 @@ class UserService:
         """
         Get user by username
 
+        Always read from the database: login checks password_hash and
+        is_active from this result, so it must never be stale.
+
         Args:
             username: Username to search for
 
@@ -128,12 +153,33 @@ class UserService:
         """
         Get user by ID
 
+        Found users are cached for USER_CACHE_TTL_SECONDS; concurrent lookups
+        of the same ID share a single database query.
+
         Args:
             user_id: User ID to search for
 
         Returns:
             UserModel or None if not found
         """
+        user = self._user_cache.get(user_id)
+        if user is not None:
+            return user
+
+        lock = self._user_cache_locks.setdefault(user_id, asyncio.Lock())
+        try:
+            async with lock:
+                user = self._user_cache.get(user_id)
+                if user is None:
+                    user = await self._fetch_user_by_id(user_id)
+                    if user is not None:
+                        self._user_cache[user_id] = user
+                return user
+        finally:
+            self._user_cache_locks.pop(user_id, None)
+
+    async def _fetch_user_by_id(self, user_id: str) -> Optional[UserModel]:
+        """Load a single user by ID from the database, bypassing the cache"""
         db = get_database()
         if db is None:
             return None
@@ -148,6 +194,84 @@ class UserService:
 
         return None
 
+    async def get_users_by_ids(self, user_ids: Iterable[str]) -> Dict[str, UserModel]:
+        """
+        Get several users by ID in a single query
+
+        Args:
+            user_ids: User IDs to look up (duplicates and invalid IDs are ignored)
+
+        Returns:
+            Dict mapping user ID string to UserModel for the users that were found
+        """
+        users = {}
+        missing_ids = set()
+        for uid in user_ids:
+            user = self._user_cache.get(uid)
+            if user is not None:
+                users[uid] = user
+            elif ObjectId.is_valid(uid):
+                missing_ids.add(uid)
+
+        if not missing_ids:
+            return users
+
+        db = get_database()
+        if db is None:
+            return users
+
+        collection = db[self.collection_name]
+        try:
+            cursor = collection.find({"_id": {"$in": [ObjectId(uid) for uid in missing_ids]}})
+            async for user_doc in cursor:
+                uid = str(user_doc["_id"])
+                users[uid] = self._user_cache[uid] = UserModel.from_dict(user_doc)
+        except Exception as e:
+            logger.error(f"Error getting users by IDs: {e}")
+        return users
+
+    async def get_usernames_by_ids(self, user_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Get usernames for several users in a single projected query
+
+        Cached users are answered from the user cache; the rest are fetched
+        with a {_id, username} projection so full user documents are not
+        transferred just to display a name.
+
+        Args:
+            user_ids: User IDs to look up (duplicates and invalid IDs are ignored)
+
+        Returns:
+            Dict mapping user ID string to username for the users that were found
+        """
+        usernames = {}
+        missing_ids = set()
+        for uid in user_ids:
+            user = self._user_cache.get(uid)
+            if user is not None:
+                usernames[uid] = user.username
+            elif ObjectId.is_valid(uid):
+                missing_ids.add(uid)
+
+        if not missing_ids:
+            return usernames
+
+        db = get_database()
+        if db is None:
+            return usernames
+
+        collection = db[self.collection_name]
+        try:
+            cursor = collection.find(
+                {"_id": {"$in": [ObjectId(uid) for uid in missing_ids]}},
+                {"_id": 1, "username": 1}
+            )
+            async for user_doc in cursor:
+                usernames[str(user_doc["_id"])] = user_doc["username"]
+        except Exception as e:
+            logger.error(f"Error getting usernames by IDs: {e}")
+        return usernames
+
     async def update_last_login(self, username: str) -> bool:
         """
         Update user's last login timestamp
@@ -164,11 +288,17 @@ class UserService:
 
         collection = db[self.collection_name]
         try:
-            result = await collection.update_one(
+            # Return the user's _id from the same round trip so the cached
+            # copy (keyed by ID) can be evicted directly
+            user_doc = await collection.find_one_and_update(
                 {"username": username},
                 {"$set": {"last_login": datetime.now(timezone.utc)}},
+                projection={"_id": 1},
             )
-            return result.modified_count > 0
+            if user_doc is None:
+                return False
+            self._user_cache.pop(str(user_doc["_id"]), None)
+            return True
         except Exception as e:
             logger.error(f"Error updating last login for {username}: {e}")
             return False
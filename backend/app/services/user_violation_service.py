@@ -9,13 +9,13 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from bson import ObjectId
 from app.core.database import get_database
+from app.services.user_service import user_service
 from app.models.user_violation import (
     UserViolationModel,
     UserViolationCreateSchema,
     ViolationType,
     ViolationSeverity
 )
-from app.services.user_service import user_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -51,8 +51,8 @@ class UserViolationService:
             
             collection = db[self.collection_name]
             
-            # Create violation model
-            violation = UserViolationModel(
+            # Create violation model; fields were already validated by the create schema
+            violation = UserViolationModel.model_construct(
                 user_id=user_id,
                 violation_type=violation_data.violation_type,
                 severity=violation_data.severity,
@@ -173,12 +173,16 @@ class UserViolationService:
             ]
             
             results = await collection.aggregate(pipeline).to_list(limit)
+
+            # Violations store user_id as a string; resolve the whole page's
+            # usernames in one query instead of one lookup per user
+            usernames = await user_service.get_usernames_by_ids(
+                str(result["_id"]) for result in results
+            )
             
-            # Enrich with user information
             summaries = []
             for result in results:
                 user_id = str(result["_id"])
-                user = await user_service.get_user_by_id(user_id)
                 
                 # Calculate risk level
                 risk_level = self._calculate_risk_level(
@@ -189,7 +193,7 @@ class UserViolationService:
                 
                 summary = {
                     "user_id": user_id,
-                    "username": user.username if user else "Unknown",
+                    "username": usernames.get(user_id, "Unknown"),
                     "total_violations": result["total_violations"],
                     "violation_types": result["violation_types"],
                     "latest_violation": result["latest_violation"],
@@ -1,14 +1,27 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import auth, home, tickets, webhooks, ai_bot, ai_agent, ws_chat, admin, notifications
+from fastapi.middleware.gzip import GZipMiddleware
+from app.routers import auth, home, tickets, webhooks, ai_bot, ai_agent, ai_agent_endpoint, ws_chat, admin, notifications
+from app.core.ai_config import ai_config
 from app.core.database import connect_to_mongo, close_mongo_connection
+from app.core.openapi import install_openapi_components
+from app.core.responses import ORJSONResponse
 from app.services.ai.startup import initialize_ai_services, get_ai_services_status, health_check as ai_health_check
 from app.services.scheduler_service import scheduler_service
+from app.services.misuse_reports_service import misuse_reports_service
+from app.services.notification_service import notification_service
+from app.services.document_service import document_service
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for blocking calls (LLM/RAG queries, document parsing) run via
+# asyncio.to_thread; the interpreter default is only min(32, cpu_count + 4)
+BLOCKING_IO_THREADS = 64
+
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
@@ -16,6 +29,10 @@ async def lifespan(_: FastAPI):
     # Startup
     logger.info("Starting application initialization")
 
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_IO_THREADS, thread_name_prefix="blocking-io")
+    )
+
     # Initialize MongoDB connection
     try:
         await connect_to_mongo()
@@ -23,6 +40,23 @@ async def lifespan(_: FastAPI):
     except Exception as e:
         logger.warning(f"Could not connect to MongoDB: {e}")
         print(f"Warning: Could not connect to MongoDB: {e}")
+    else:
+        try:
+            await misuse_reports_service.ensure_indexes()
+        except Exception as e:
+            logger.warning(f"Could not create misuse report indexes: {e}")
+        try:
+            await notification_service.ensure_indexes()
+        except Exception as e:
+            logger.warning(f"Could not create notification indexes: {e}")
+        try:
+            await document_service.ensure_indexes()
+        except Exception as e:
+            logger.warning(f"Could not create document job indexes: {e}")
+
+    # Log the effective AI configuration (built only if it will actually be emitted)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("AI Configuration loaded: %s", ai_config.get_safe_config())
 
     # Initialize AI services
     try:
@@ -72,7 +106,8 @@ app = FastAPI(
     title="AI-First Internal Helpdesk Portal",
     description="Internal ticket-based helpdesk system with AI routing, response suggestion, and misuse detection",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -84,6 +119,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (info/home payloads, notification and ticket lists)
+# for clients that accept gzip; small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """
+    Return a generic 500 for an unhandled error
+
+    ServerErrorMiddleware re-raises the error after this handler runs, so the
+    server logs its traceback; only the request it failed on is logged here.
+    """
+    logger.error("Unhandled error on %s %s: %r", request.method, request.url.path, exc)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"}
+    )
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(home.router)
@@ -91,10 +144,14 @@ app.include_router(tickets.router)
 app.include_router(webhooks.router)
 app.include_router(ai_bot.router)
 app.include_router(ai_agent.router)
+app.include_router(ai_agent_endpoint.router)
 app.include_router(ws_chat.router)
 app.include_router(admin.router)
 app.include_router(notifications.router)
 
+# Publish the nested schemas of request bodies parsed by dependencies
+install_openapi_components(app)
+
 @app.get("/")
 async def root():
     """Root endpoint for health check"""
@@ -199,19 +199,17 @@ class TestAdminAnalyticsEndpoints:
     
     def test_resolution_time_analytics_success(self, client, admin_user):
         """Test successful resolution time analytics retrieval"""
-        mock_overview = {
-            "resolution_statistics": {
-                "overall": {"avg_hours": 24.5, "total_resolved": 100},
-                "by_department": {
-                    "IT": {"avg_resolution_hours": 20.0, "total_resolved": 60},
-                    "HR": {"avg_resolution_hours": 32.0, "total_resolved": 40}
-                }
+        mock_resolution_stats = {
+            "overall": {"avg_hours": 24.5, "total_resolved": 100},
+            "by_department": {
+                "IT": {"avg_resolution_hours": 20.0, "total_resolved": 60},
+                "HR": {"avg_resolution_hours": 32.0, "total_resolved": 40}
             }
         }
         
-        with patch("routers.admin.analytics_service.get_overview_analytics", new_callable=AsyncMock) as mock_service:
+        with patch("routers.admin.analytics_service.get_resolution_statistics", new_callable=AsyncMock) as mock_service:
             with patch("routers.admin.require_admin", return_value=admin_user):
-                mock_service.return_value = mock_overview
+                mock_service.return_value = mock_resolution_stats
 
                 response = client.get("/admin/analytics/resolution-times?days=30")
                 
@@ -12,7 +12,9 @@ from fastapi.testclient import TestClient
 from bson import ObjectId
 
 from main import app
+from app.core.auth import require_admin
 from app.models.user import UserModel, UserRole
+from app.schemas.document import DocumentProcessingStatus
 
 
 class TestAdminEndpoints:
@@ -280,14 +282,131 @@ class TestAdminEndpoints:
             assert response.status_code == 500
             data = response.json()
             assert "Failed to get scheduler status" in data["detail"]
-    
-    def test_get_misuse_report_by_id_not_implemented(self, client, admin_user):
-        """Test getting a specific misuse report by ID (not yet implemented)"""
+
+
+class TestMisuseReportById:
+    """Test cases for fetching a single misuse report"""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client authenticated as an admin"""
+        app.dependency_overrides[require_admin] = lambda: {"username": "admin_user", "role": "admin"}
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_get_misuse_report_by_id(self, client):
+        """Test that a stored report is returned in the response schema's shape"""
         report_id = str(ObjectId())
-        
-        with patch('app.routers.admin.require_admin', return_value=admin_user):
+        user_id = str(ObjectId())
+        report = {
+            "_id": report_id,
+            "user_id": user_id,
+            "detection_date": datetime(2026, 1, 5, 2, 0),
+            "misuse_type": "spam_content",
+            "severity_level": "high",
+            "evidence_data": {
+                "ticket_ids": [str(ObjectId())],
+                "content_samples": ["buy now"],
+                "pattern_analysis": "Repeated promotional content"
+            },
+            "admin_reviewed": False,
+            "ai_analysis_metadata": {
+                "detection_confidence": 0.9,
+                "model_reasoning": "Promotional spam",
+                "analysis_timestamp": datetime(2026, 1, 5, 2, 0)
+            }
+        }
+
+        with patch('app.routers.admin.misuse_reports_service.get_report_by_id',
+                   AsyncMock(return_value=report)) as get_report:
             response = client.get(f"/admin/misuse-reports/{report_id}")
-            
-            assert response.status_code == 501
-            data = response.json()
-            assert "Get report by ID not yet implemented" in data["detail"]
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == report_id
+        assert data["user_id"] == user_id
+        assert data["misuse_type"] == "spam_content"
+        assert data["evidence_data"]["pattern_analysis"] == "Repeated promotional content"
+        assert data["ai_analysis_metadata"]["detection_confidence"] == 0.9
+        assert data["action_taken"] is None
+        get_report.assert_awaited_once_with(report_id)
+
+    def test_get_misuse_report_by_id_not_found(self, client):
+        """Test getting a misuse report that doesn't exist"""
+        with patch('app.routers.admin.misuse_reports_service.get_report_by_id',
+                   AsyncMock(return_value=None)):
+            response = client.get("/admin/misuse-reports/missing")
+
+        assert response.status_code == 404
+
+
+class TestDocumentUploadJobs:
+    """Test cases for background document uploads"""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client authenticated as an admin"""
+        app.dependency_overrides[require_admin] = lambda: {"username": "admin_user", "role": "admin"}
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    @pytest.fixture
+    def job_status(self):
+        """Initial status of a queued upload job"""
+        return DocumentProcessingStatus(
+            document_id="doc-123",
+            status="processing",
+            progress=0.0,
+            message="Processing guide.txt"
+        )
+
+    def test_upload_document_background_returns_202(self, client, job_status):
+        """Test that a background upload is accepted and processed after the response"""
+        job_args = {"temp_file_path": "/tmp/staged.txt", "document_id": "doc-123"}
+
+        with patch('app.routers.admin.document_service.start_upload_job',
+                   AsyncMock(return_value=(job_status, job_args))) as start_job, \
+             patch('app.routers.admin.document_service.run_upload_job', AsyncMock()) as run_job, \
+             patch('app.routers.admin.document_service.upload_document', AsyncMock()) as upload:
+
+            response = client.post(
+                "/admin/documents/upload",
+                params={"background": "true"},
+                data={"category": "general"},
+                files={"file": ("guide.txt", b"How to reset a password", "text/plain")}
+            )
+
+            assert response.status_code == 202
+            assert response.json() == job_status.model_dump()
+            start_job.assert_awaited_once()
+            assert start_job.await_args.kwargs["uploaded_by"] == "admin_user"
+            run_job.assert_awaited_once_with(**job_args)
+            upload.assert_not_called()
+
+    def test_get_document_upload_job(self, client, job_status):
+        """Test polling the status of an upload job"""
+        with patch('app.routers.admin.document_service.get_upload_job',
+                   AsyncMock(return_value=job_status)) as get_job:
+
+            response = client.get("/admin/documents/jobs/doc-123")
+
+            assert response.status_code == 200
+            assert response.json() == job_status.model_dump()
+            get_job.assert_awaited_once_with("doc-123")
+
+    def test_get_document_upload_job_not_found(self, client):
+        """Test polling an unknown upload job"""
+        with patch('app.routers.admin.document_service.get_upload_job', AsyncMock(return_value=None)):
+
+            response = client.get("/admin/documents/jobs/missing")
+
+            assert response.status_code == 404
+
+    def test_upload_document_documents_202_response(self, client):
+        """Test that the 202 job status response is part of the OpenAPI spec"""
+        spec = client.get("/openapi.json").json()
+        responses = spec["paths"]["/admin/documents/upload"]["post"]["responses"]
+
+        assert responses["202"]["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/DocumentProcessingStatus"
+        }
@@ -5,7 +5,7 @@ Unit tests for AI Agent endpoints
 import pytest
 from fastapi.testclient import TestClient
 from main import app
-from app.routers.auth import get_current_user
+from app.core.auth import get_current_user
 
 # Create a test client
 client = TestClient(app)
@@ -0,0 +1,92 @@
+"""
+Tests for the "Resolve with AI" agent endpoints
+"""
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+
+from main import app
+from app.core.auth import get_current_user
+from app.routers.ai_agent_endpoint import _TEST_QUERIES, _build_ai_status
+
+client = TestClient(app)
+
+MOCK_USER = {"username": "test_user", "user_id": "507f1f77bcf86cd799439011", "role": "user"}
+
+
+@pytest.fixture
+def authenticated():
+    """Authenticate requests as MOCK_USER"""
+    app.dependency_overrides[get_current_user] = lambda: MOCK_USER
+    yield
+    app.dependency_overrides.clear()
+
+
+def test_resolve_with_ai(authenticated):
+    """Test that /ai/resolve returns the agent's answer with the caller's details"""
+    agent_result = {"answer": "Restart the VPN client.", "sources": ["kb"], "session_id": "s1"}
+
+    with patch("app.routers.ai_agent_endpoint.run_agent_query", AsyncMock(return_value=agent_result)) as run_query:
+        response = client.post("/ai/resolve", json={"query": "VPN keeps dropping", "session_id": "s1"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["answer"] == "Restart the VPN client."
+    assert data["metadata"]["user_id"] == MOCK_USER["user_id"]
+    assert data["metadata"]["username"] == MOCK_USER["username"]
+    run_query.assert_awaited_once_with("VPN keeps dropping", session_id="s1")
+
+
+def test_resolve_with_ai_requires_authentication():
+    """Test that /ai/resolve rejects anonymous requests"""
+    response = client.post("/ai/resolve", json={"query": "VPN keeps dropping"})
+
+    assert response.status_code in (401, 403)
+
+
+def test_ai_test_streams_ndjson(authenticated):
+    """Test that /ai/test?stream=true sends one line per probe and a summary line"""
+    agent_result = {"answer": "ok", "sources": []}
+
+    with patch("app.routers.ai_agent_endpoint.run_agent_query", AsyncMock(return_value=agent_result)):
+        response = client.post("/ai/test", params={"stream": "true"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [orjson.loads(line) for line in response.content.splitlines()]
+    assert len(lines) == len(_TEST_QUERIES) + 1
+    assert sorted(line["query"] for line in lines[:-1]) == sorted(_TEST_QUERIES)
+    assert lines[-1] == {
+        "test_completed": True,
+        "total_queries": len(_TEST_QUERIES),
+        "successful_queries": len(_TEST_QUERIES),
+        "tester": MOCK_USER["username"],
+    }
+
+
+def test_ai_status_is_cached():
+    """Test that /ai/status builds its payload once within the cache TTL"""
+    safe_config = {
+        "rag_enabled": True,
+        "web_search_enabled": False,
+        "serper_api_key_configured": False,
+        "google_api_key_configured": True,
+        "gemini_model": "gemini-test",
+    }
+    _build_ai_status.cache_clear()
+
+    try:
+        with patch("app.routers.ai_agent_endpoint.ai_config.get_safe_config", return_value=safe_config) as get_config:
+            first = client.get("/ai/status")
+            second = client.get("/ai/status")
+    finally:
+        _build_ai_status.cache_clear()
+
+    assert first.status_code == 200
+    assert first.json() == second.json()
+    assert first.json()["health"] == "healthy"
+    assert first.json()["capabilities"]["llm_model"] == "gemini-test"
+    get_config.assert_called_once()
@@ -2,7 +2,9 @@
 Unit tests for AI Bot endpoints and RAG query functionality
 """
 
+import asyncio
 import pytest
+from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 from main import app
 from app.services.ai.rag_query import rag_query
@@ -193,6 +195,30 @@ class TestSelfServeQueryEndpoint:
         
         assert response.status_code == 422  # Validation error
 
+    def test_self_serve_query_answers_are_cached_and_shared(self):
+        """Test identical concurrent queries share a single agent call"""
+        from app.routers import ai_bot
+
+        async def slow_agent(query, session_id=None):
+            await asyncio.sleep(0.05)
+            return {"answer": "Use the self-service portal.", "metadata": {}}
+
+        async def ask_concurrently():
+            return await asyncio.gather(
+                ai_bot._get_answer("How do I reset my password?", "s1"),
+                ai_bot._get_answer("  how do I reset my PASSWORD? ", "s2"),
+            )
+
+        ai_bot._answer_cache.clear()
+        with patch.object(ai_bot, "run_agent_query", AsyncMock(side_effect=slow_agent)) as agent:
+            answers = asyncio.run(ask_concurrently())
+            cached = asyncio.run(ai_bot._get_answer("How do I reset my password?", None))
+        ai_bot._answer_cache.clear()
+
+        assert answers == ["Use the self-service portal."] * 2
+        assert cached == "Use the self-service portal."
+        assert agent.await_count == 1
+
 
 class TestSelfServeInfoEndpoint:
     """Test cases for the self-serve info endpoint"""
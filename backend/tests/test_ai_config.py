@@ -0,0 +1,45 @@
+"""
+Tests for the AI configuration
+"""
+
+import pytest
+
+from app.core.ai_config import ai_config
+
+
+@pytest.fixture
+def ai_env(monkeypatch):
+    """Set AI environment variables and re-read the configuration from them"""
+    def set_env(**values):
+        for key, value in values.items():
+            monkeypatch.setenv(key, value)
+        ai_config.reload()
+
+    yield set_env
+
+    # Restore the environment before re-reading it for later tests
+    monkeypatch.undo()
+    ai_config.reload()
+
+
+def test_validate_config_reports_missing_keys(ai_env):
+    """Test that a missing Google API key is reported as an error"""
+    ai_env(GOOGLE_API_KEY="", RAG_ENABLED="false", WEB_SEARCH_ENABLED="false")
+
+    result = ai_config.validate_config()
+
+    assert result["valid"] is False
+    assert "GOOGLE_API_KEY is required for LLM operations" in result["errors"]
+
+
+def test_reload_picks_up_environment_changes(ai_env):
+    """Test that cached settings and results are rebuilt after reload"""
+    ai_env(GOOGLE_API_KEY="", GEMINI_MODEL="gemini-a", RAG_ENABLED="false", WEB_SEARCH_ENABLED="false")
+    assert ai_config.validate_config()["valid"] is False
+    assert ai_config.get_safe_config()["gemini_model"] == "gemini-a"
+
+    ai_env(GOOGLE_API_KEY="test-key", GEMINI_MODEL="gemini-b")
+
+    assert ai_config.validate_config()["valid"] is True
+    assert ai_config.get_safe_config()["gemini_model"] == "gemini-b"
+    assert ai_config.get_safe_config()["google_api_key_configured"] is True
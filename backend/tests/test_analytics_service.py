@@ -354,3 +354,52 @@ class TestAnalyticsService:
         assert "HR" in resolution_stats["by_department"]
         assert resolution_stats["by_department"]["IT"]["avg_resolution_hours"] == 24.5
         assert resolution_stats["by_department"]["HR"]["avg_resolution_hours"] == 48.0
+    
+    @pytest.mark.asyncio
+    async def test_get_resolution_statistics_single_aggregation(self, mock_db_collections):
+        """Test resolution statistics run only the resolution time aggregation"""
+        mock_db_collections["tickets_cursor"].to_list = AsyncMock(return_value=[{
+            "_id": "IT",
+            "avg_resolution_time": 12.0,
+            "min_resolution_time": 1.0,
+            "max_resolution_time": 30.0,
+            "total_resolved": 4
+        }])
+        
+        resolution_stats = await analytics_service.get_resolution_statistics(30)
+        
+        assert mock_db_collections["tickets"].aggregate.call_count == 1
+        assert resolution_stats["overall"] == {"avg_hours": 12.0, "total_resolved": 4}
+        assert resolution_stats["by_department"]["IT"]["max_resolution_hours"] == 30.0
+    
+    @pytest.mark.asyncio
+    async def test_get_ticket_breakdowns_build_dashboard_charts_and_kpis(self, mock_db_collections):
+        """Test dashboard charts and KPIs are built from one $facet aggregation"""
+        mock_db_collections["tickets_cursor"].to_list = AsyncMock(return_value=[{
+            "by_status": [{"_id": "open", "count": 6}, {"_id": "closed", "count": 3}, {"_id": "resolved", "count": 1}],
+            "by_department": [{
+                "_id": None, "total_tickets": 10, "open_tickets": 6,
+                "assigned_tickets": 0, "resolved_tickets": 1
+            }],
+            "by_urgency": [{"_id": "high", "count": 10}],
+            "resolution_time": [{"_id": None, "avg_resolution_time": 5.25}],
+            "feedback": []
+        }])
+        
+        breakdowns = await analytics_service._get_ticket_breakdowns({})
+        
+        assert mock_db_collections["tickets"].aggregate.call_count == 1
+        pipeline = mock_db_collections["tickets"].aggregate.call_args[0][0]
+        assert set(pipeline[1]["$facet"]) == {"by_status", "by_department", "by_urgency", "resolution_time", "feedback"}
+        
+        assert analytics_service._build_status_distribution(breakdowns["by_status"])["labels"] == ["Open", "Closed", "Resolved"]
+        assert analytics_service._build_department_workload(breakdowns["by_department"])["labels"] == ["Unassigned"]
+        assert analytics_service._build_urgency_distribution(breakdowns["by_urgency"])["data"] == [10]
+        assert analytics_service._build_kpis(breakdowns) == {
+            "total_tickets": 10,
+            "open_tickets": 6,
+            "resolution_rate": 40.0,
+            "avg_resolution_time_hours": 5.2,
+            "tickets_with_feedback": 0,
+            "backlog_size": 6
+        }
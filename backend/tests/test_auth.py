@@ -148,3 +148,95 @@ async def test_logout(setup_test_users):
         })
         assert response.status_code == 200
         assert response.json()["message"] == "Logout successful"
+
+
+def test_cached_token_data_reuses_verified_token():
+    """Test that a verified token is decoded only once while cached"""
+    from unittest.mock import patch
+    from app.core import auth as core_auth
+    from app.services.auth_service import create_access_token, decode_access_token
+
+    core_auth._token_cache.clear()
+    token = create_access_token({"sub": "cacheuser", "user_id": "u1", "role": "user"})
+
+    with patch("app.core.auth.decode_access_token", side_effect=decode_access_token) as mock_decode:
+        first = core_auth.get_cached_token_data(token)
+        second = core_auth.get_cached_token_data(token)
+
+    assert first == {"username": "cacheuser", "user_id": "u1", "role": "user"}
+    assert second == first
+    assert mock_decode.call_count == 1
+
+
+def test_cached_token_data_does_not_cache_invalid_token():
+    """Test that failed validations are never cached"""
+    from unittest.mock import patch
+    from app.core import auth as core_auth
+
+    core_auth._token_cache.clear()
+
+    with patch("app.core.auth.decode_access_token", return_value=None) as mock_decode:
+        assert core_auth.get_cached_token_data("invalid_token") is None
+        assert core_auth.get_cached_token_data("invalid_token") is None
+
+    assert mock_decode.call_count == 2
+    assert len(core_auth._token_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_current_user_reused_from_request_state():
+    """Test that the resolved user is stored on and reused from request.state"""
+    from types import SimpleNamespace
+    from unittest.mock import patch
+    from fastapi.security import HTTPAuthorizationCredentials
+    from app.core import auth as core_auth
+    from app.services.auth_service import create_access_token
+
+    core_auth._token_cache.clear()
+    token = create_access_token({"sub": "stateuser", "user_id": "u2", "role": "admin"})
+    request = SimpleNamespace(state=SimpleNamespace())
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with patch("app.core.auth.get_cached_token_data", wraps=core_auth.get_cached_token_data) as mock_lookup:
+        first = await core_auth.get_current_user(request, credentials)
+        second = await core_auth.get_current_user(request, credentials)
+
+    assert request.state.user == first
+    assert second is first
+    assert mock_lookup.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_router_current_user_uses_token_cache():
+    """Test that the auth router dependency reuses the shared token cache"""
+    from unittest.mock import patch
+    from fastapi.security import HTTPAuthorizationCredentials
+    from app.core import auth as core_auth
+    from app.routers import auth as auth_router_module
+    from app.services.auth_service import create_access_token, decode_access_token
+
+    core_auth._token_cache.clear()
+    token = create_access_token({"sub": "pollinguser", "user_id": "u3", "role": "user"})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with patch("app.core.auth.decode_access_token", side_effect=decode_access_token) as mock_decode:
+        first = await auth_router_module.get_current_user(credentials)
+        second = await auth_router_module.get_current_user(credentials)
+
+    assert first == second == {"username": "pollinguser", "user_id": "u3", "role": "user"}
+    assert mock_decode.call_count == 1
+
+
+def test_decode_access_token_rejects_tampered_and_expired_tokens():
+    """Test that the HMAC fast path enforces the signature and expiry"""
+    from datetime import timedelta
+    from app.services.auth_service import create_access_token, decode_access_token
+
+    token = create_access_token({"sub": "fastpath", "user_id": "u4", "role": "user"})
+    header, payload, signature = token.split(".")
+    forged_signature = ("A" if signature[0] != "A" else "B") + signature[1:]
+    expired = create_access_token({"sub": "fastpath"}, expires_delta=timedelta(seconds=-5))
+
+    assert decode_access_token(token)["sub"] == "fastpath"
+    assert decode_access_token(f"{header}.{payload}.{forged_signature}") is None
+    assert decode_access_token(expired) is None
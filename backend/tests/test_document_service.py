@@ -0,0 +1,183 @@
+"""
+Unit tests for the document service.
+
+Tests staging of uploaded documents for the knowledge base and the
+background upload jobs that process them.
+"""
+
+import io
+import os
+import tempfile
+import pytest
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+
+from app.schemas.document import DocumentCategory
+from app.services.document_service import DocumentService, UPLOAD_JOB_TTL_SECONDS
+
+
+def make_upload(content: bytes, filename: str = "guide.txt") -> UploadFile:
+    """Build an UploadFile the way the multipart parser does"""
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=filename,
+        headers=Headers({"content-type": "text/plain"})
+    )
+
+
+@contextmanager
+def track_temp_files():
+    """Record the paths of temporary files created by the service"""
+    temp_paths = []
+    named_temporary_file = tempfile.NamedTemporaryFile
+
+    def tracking_temp_file(*args, **kwargs):
+        temp_file = named_temporary_file(*args, **kwargs)
+        temp_paths.append(temp_file.name)
+        return temp_file
+
+    with patch("app.services.document_service.tempfile.NamedTemporaryFile", tracking_temp_file):
+        yield temp_paths
+
+
+def make_jobs_db():
+    """Build a mock database whose collections share one mocked jobs collection"""
+    jobs = MagicMock()
+    jobs.insert_one = AsyncMock()
+    jobs.update_one = AsyncMock()
+    jobs.find_one = AsyncMock()
+    jobs.create_index = AsyncMock()
+    db = MagicMock()
+    db.__getitem__.return_value = jobs
+    return db, jobs
+
+
+class TestDocumentService:
+    """Test cases for DocumentService"""
+
+    @pytest.fixture
+    def document_service(self):
+        """Create a DocumentService with a small size limit"""
+        service = DocumentService()
+        service.max_file_size = 16
+        return service
+
+    @pytest.mark.asyncio
+    async def test_upload_document_oversized_stream_returns_413(self, document_service):
+        """Test that an upload exceeding the limit while streaming is rejected with 413"""
+        # Skip the declared-size check so the guard in the copy loop is hit
+        document_service._validate_file = AsyncMock()
+
+        with track_temp_files() as temp_paths:
+            with pytest.raises(HTTPException) as exc_info:
+                await document_service.upload_document(
+                    make_upload(b"x" * 64), DocumentCategory.GENERAL, "admin"
+                )
+
+        assert exc_info.value.status_code == 413
+        assert len(temp_paths) == 1
+        assert not os.path.exists(temp_paths[0])
+
+    @pytest.mark.asyncio
+    async def test_upload_document_validation_error_is_not_wrapped(self, document_service):
+        """Test that validation errors keep their status code"""
+        upload = UploadFile(file=io.BytesIO(b"data"), filename="", headers=Headers())
+
+        with pytest.raises(HTTPException) as exc_info:
+            await document_service.upload_document(upload, DocumentCategory.GENERAL, "admin")
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_start_upload_job_records_job(self, document_service):
+        """Test that starting a background upload stages the file and records a job"""
+        db, jobs = make_jobs_db()
+
+        with patch("app.services.document_service.get_database", return_value=db):
+            job_status, job_args = await document_service.start_upload_job(
+                make_upload(b"reset steps"), DocumentCategory.FAQ, "admin"
+            )
+
+        try:
+            assert job_status.status == "processing"
+            assert job_args["document_id"] == job_status.document_id
+            with open(job_args["temp_file_path"], "rb") as staged:
+                assert staged.read() == b"reset steps"
+
+            db.__getitem__.assert_called_with("document_jobs")
+            record = jobs.insert_one.await_args.args[0]
+            assert record["_id"] == job_status.document_id
+            assert record["uploaded_by"] == "admin"
+            assert "created_at" in record
+        finally:
+            os.unlink(job_args["temp_file_path"])
+
+    @pytest.mark.asyncio
+    async def test_start_upload_job_insert_failure_removes_temp_file(self, document_service):
+        """Test that the staged file is removed when the job cannot be recorded"""
+        db, jobs = make_jobs_db()
+        jobs.insert_one.side_effect = Exception("Database unavailable")
+
+        with patch("app.services.document_service.get_database", return_value=db), \
+             track_temp_files() as temp_paths:
+            with pytest.raises(Exception, match="Database unavailable"):
+                await document_service.start_upload_job(
+                    make_upload(b"reset steps"), DocumentCategory.FAQ, "admin"
+                )
+
+        assert len(temp_paths) == 1
+        assert not os.path.exists(temp_paths[0])
+
+    @pytest.mark.asyncio
+    async def test_run_upload_job_records_failure(self, document_service):
+        """Test that a failed background upload is recorded and its temp file removed"""
+        db, jobs = make_jobs_db()
+        temp_file_path = tempfile.NamedTemporaryFile(delete=False).name
+        document_service._process_file = AsyncMock(side_effect=Exception("Unreadable file"))
+
+        with patch("app.services.document_service.get_database", return_value=db):
+            await document_service.run_upload_job(temp_file_path, "doc-123")
+
+        assert not os.path.exists(temp_file_path)
+        jobs.update_one.assert_awaited_once()
+        query, update = jobs.update_one.await_args.args
+        assert query == {"_id": "doc-123"}
+        assert update["$set"]["status"] == "failed"
+        assert update["$set"]["error"] == "Unreadable file"
+
+    @pytest.mark.asyncio
+    async def test_get_upload_job(self, document_service):
+        """Test reading the status of a recorded job"""
+        db, jobs = make_jobs_db()
+        jobs.find_one.return_value = {
+            "_id": "doc-123",
+            "document_id": "doc-123",
+            "status": "completed",
+            "progress": 1.0,
+            "message": "12 vectors stored",
+            "error": None,
+            "uploaded_by": "admin"
+        }
+
+        with patch("app.services.document_service.get_database", return_value=db):
+            job_status = await document_service.get_upload_job("doc-123")
+            jobs.find_one.return_value = None
+            missing = await document_service.get_upload_job("missing")
+
+        assert job_status.status == "completed"
+        assert job_status.message == "12 vectors stored"
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_expires_jobs(self, document_service):
+        """Test that job records get a TTL index on their creation time"""
+        db, jobs = make_jobs_db()
+
+        with patch("app.services.document_service.get_database", return_value=db):
+            await document_service.ensure_indexes()
+
+        jobs.create_index.assert_awaited_once_with(
+            "created_at", expireAfterSeconds=UPLOAD_JOB_TTL_SECONDS
+        )
@@ -252,6 +252,99 @@ class TestMisuseReportsService:
         
         assert reports == []
     
+    @pytest.mark.asyncio
+    async def test_get_reports_page_cursor_round_trip(self, reports_service):
+        """Test keyset pagination returns a cursor that resumes after the last report"""
+        from app.services.misuse_reports_service import decode_report_cursor
+
+        detection_date = datetime(2024, 1, 2, 3, 4, 5)
+        mock_reports = [
+            {
+                "_id": ObjectId(),
+                "user_id": ObjectId(),
+                "detection_date": detection_date,
+                "evidence_data": {"ticket_ids": []}
+            }
+            for _ in range(3)
+        ]
+        last_id = mock_reports[1]["_id"]
+
+        mock_cursor = MagicMock()
+        mock_cursor.to_list = AsyncMock(return_value=mock_reports)
+        reports_service.collection.aggregate = MagicMock(return_value=mock_cursor)
+        reports_service.collection.count_documents.return_value = 3
+
+        result = await reports_service.get_reports_page(limit=2)
+
+        assert len(result["reports"]) == 2
+        assert result["has_next"] is True
+        assert decode_report_cursor(result["next_cursor"]) == (detection_date, last_id)
+        pipeline = reports_service.collection.aggregate.call_args[0][0]
+        assert {"$limit": 3} in pipeline
+        assert any("$lookup" in stage for stage in pipeline)
+
+        mock_cursor.to_list = AsyncMock(return_value=[])
+        await reports_service.get_reports_page(limit=2, cursor=result["next_cursor"])
+
+        pipeline = reports_service.collection.aggregate.call_args[0][0]
+        assert pipeline[0] == {"$match": {
+            "$or": [
+                {"detection_date": {"$lt": detection_date}},
+                {"detection_date": detection_date, "_id": {"$lt": last_id}},
+            ]
+        }}
+
+    @pytest.mark.asyncio
+    async def test_get_reports_page_counts(self, reports_service):
+        """Test that the total is only counted on request and the unreviewed count is cached"""
+        mock_cursor = MagicMock()
+        mock_cursor.to_list = AsyncMock(return_value=[])
+        reports_service.collection.aggregate = MagicMock(return_value=mock_cursor)
+        reports_service.collection.count_documents.return_value = 7
+
+        first = await reports_service.get_reports_page()
+        second = await reports_service.get_reports_page(include_total=True)
+
+        assert first["total_count"] is None
+        assert second["total_count"] == 7
+        assert second["unreviewed_count"] == 7
+        # One cached unreviewed count plus the requested total
+        assert reports_service.collection.count_documents.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_reports_page_invalid_cursor(self, reports_service):
+        """Test that a malformed cursor is rejected"""
+        with pytest.raises(ValueError):
+            await reports_service.get_reports_page(cursor="not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_get_report_by_id(self, reports_service):
+        """Test getting a single report with its ObjectIds converted to strings"""
+        report_id = ObjectId()
+        user_id = ObjectId()
+        ticket_id = ObjectId()
+        reports_service.collection.find_one.return_value = {
+            "_id": report_id,
+            "user_id": user_id,
+            "evidence_data": {"ticket_ids": [ticket_id]}
+        }
+        
+        report = await reports_service.get_report_by_id(str(report_id))
+        
+        assert report["_id"] == str(report_id)
+        assert report["user_id"] == str(user_id)
+        assert report["evidence_data"]["ticket_ids"] == [str(ticket_id)]
+        reports_service.collection.find_one.assert_called_once_with({"_id": report_id})
+    
+    @pytest.mark.asyncio
+    async def test_get_report_by_id_invalid_or_missing(self, reports_service):
+        """Test that unknown and malformed report IDs return None"""
+        reports_service.collection.find_one.return_value = None
+        
+        assert await reports_service.get_report_by_id(str(ObjectId())) is None
+        assert await reports_service.get_report_by_id("not-an-object-id") is None
+        reports_service.collection.find_one.assert_called_once()
+    
     @pytest.mark.asyncio
     async def test_mark_report_reviewed_success(self, reports_service):
         """Test successfully marking a report as reviewed"""
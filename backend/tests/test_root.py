@@ -19,3 +19,26 @@ def test_health_endpoint():
     data = response.json()
     assert data["status"] == "healthy"
     assert data["service"] == "helpdesk-api"
+
+
+def test_openapi_refs_resolve():
+    """Test that every $ref in the OpenAPI spec points at an existing component"""
+    spec = client.get("/openapi.json").json()
+    schemas = spec.get("components", {}).get("schemas", {})
+
+    def collect_refs(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "$ref":
+                    yield value
+                else:
+                    yield from collect_refs(value)
+        elif isinstance(node, list):
+            for item in node:
+                yield from collect_refs(item)
+
+    refs = set(collect_refs(spec))
+    prefix = "#/components/schemas/"
+    assert refs
+    assert all(ref.startswith(prefix) for ref in refs)
+    assert sorted(ref[len(prefix):] for ref in refs if ref[len(prefix):] not in schemas) == []
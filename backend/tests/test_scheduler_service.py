@@ -248,6 +248,24 @@ class TestSchedulerService:
         assert "error" in status
         assert status["error"] == "Status error"
     
+    def test_get_scheduler_status_cached(self, scheduler_service):
+        """Test scheduler status is cached until the scheduler changes state"""
+        mock_scheduler = MagicMock()
+        mock_scheduler.get_jobs.return_value = []
+        scheduler_service.scheduler = mock_scheduler
+        scheduler_service.is_running = True
+        
+        first = scheduler_service.get_scheduler_status()
+        second = scheduler_service.get_scheduler_status()
+        
+        assert first is second
+        mock_scheduler.get_jobs.assert_called_once()
+        
+        scheduler_service._job_executed_listener(MagicMock(job_id="daily_misuse_detection"))
+        scheduler_service.get_scheduler_status()
+        
+        assert mock_scheduler.get_jobs.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_run_daily_misuse_detection_job(self, scheduler_service):
         """Test the scheduled daily misuse detection job execution"""
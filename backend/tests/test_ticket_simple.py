@@ -72,6 +72,50 @@ def test_create_ticket_with_dependency_override():
             # Clean up dependency override
             app.dependency_overrides.clear()
 
+def test_ticket_model_from_dicts_matches_from_dict():
+    """Test that bulk hydration applies the same defaults as from_dict"""
+    from app.models.ticket import TicketModel
+    from app.schemas.ticket import TicketDepartment, TicketStatus, TicketUrgency
+
+    from datetime import datetime, timezone
+
+    user_id = ObjectId(MOCK_USER["user_id"])
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    docs = [
+        {
+            "ticket_id": "TKT-1-AAAAAA",
+            "title": "A",
+            "description": "a",
+            "user_id": user_id,
+            "created_at": created,
+            "updated_at": created,
+        },
+        {
+            "ticket_id": "TKT-1-BBBBBB",
+            "title": "B",
+            "description": "b",
+            "user_id": user_id,
+            "urgency": "high",
+            "status": "assigned",
+            "department": "HR",
+            "created_at": created,
+            "updated_at": created,
+        },
+    ]
+
+    tickets = TicketModel.from_dicts(docs)
+
+    assert [t.ticket_id for t in tickets] == ["TKT-1-AAAAAA", "TKT-1-BBBBBB"]
+    assert tickets[0].urgency == TicketUrgency.MEDIUM
+    assert tickets[0].status == TicketStatus.OPEN
+    assert tickets[0].department is None
+    assert tickets[1].urgency == TicketUrgency.HIGH
+    assert tickets[1].status == TicketStatus.ASSIGNED
+    assert tickets[1].department == TicketDepartment.HR
+    assert [t.to_dict() for t in tickets] == [
+        TicketModel.from_dict(doc).to_dict() for doc in docs
+    ]
+
 if __name__ == "__main__":
     test_create_ticket_unauthorized()
     test_create_ticket_with_dependency_override()
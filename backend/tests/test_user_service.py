@@ -172,3 +172,121 @@ async def test_get_user_by_username():
         if db is not None:
             await db.users.delete_many({"username": "findme"})
         await close_mongo_connection()
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_single_query():
+    """Test that users are fetched by ID in one $in query and keyed by ID string"""
+    from unittest.mock import MagicMock, patch
+    from bson import ObjectId
+
+    user_id = ObjectId()
+    user_doc = {
+        "_id": user_id,
+        "username": "batchuser",
+        "email": "batch@example.com",
+        "password_hash": "hash",
+        "role": "user",
+    }
+
+    async def cursor():
+        yield user_doc
+
+    collection = MagicMock()
+    collection.find.return_value = cursor()
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+
+    with patch("app.services.user_service.get_database", return_value=db):
+        users = await user_service.get_users_by_ids([str(user_id), str(user_id), "not-an-id"])
+
+    collection.find.assert_called_once_with({"_id": {"$in": [user_id]}})
+    assert list(users) == [str(user_id)]
+    assert users[str(user_id)].username == "batchuser"
+
+
+@pytest.mark.asyncio
+async def test_get_usernames_by_ids_projects_username():
+    """Test that usernames are fetched with an {_id, username} projection"""
+    from unittest.mock import MagicMock, patch
+    from bson import ObjectId
+
+    user_id = ObjectId()
+
+    async def cursor():
+        yield {"_id": user_id, "username": "projected"}
+
+    collection = MagicMock()
+    collection.find.return_value = cursor()
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+
+    with patch("app.services.user_service.get_database", return_value=db):
+        usernames = await user_service.get_usernames_by_ids([str(user_id), "not-an-id"])
+
+    collection.find.assert_called_once_with(
+        {"_id": {"$in": [user_id]}}, {"_id": 1, "username": 1}
+    )
+    assert usernames == {str(user_id): "projected"}
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_uses_cache():
+    """Test that repeated lookups of the same user hit the database once"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+    from bson import ObjectId
+
+    user_id = ObjectId()
+    collection = MagicMock()
+    collection.find_one = AsyncMock(return_value={
+        "_id": user_id,
+        "username": "cacheduser",
+        "email": "cached@example.com",
+        "password_hash": "hash",
+        "role": "user",
+    })
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+
+    with patch("app.services.user_service.get_database", return_value=db):
+        first = await user_service.get_user_by_id(str(user_id))
+        second = await user_service.get_user_by_id(str(user_id))
+        user_service.invalidate_user_cache(str(user_id))
+        await user_service.get_user_by_id(str(user_id))
+
+    assert first is second
+    assert collection.find_one.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_login_lookup_is_fresh_and_last_login_evicts_by_id():
+    """Test that username lookups skip the cache and last-login updates evict the cached user"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+    from bson import ObjectId
+
+    user_id = ObjectId()
+    user_doc = {
+        "_id": user_id,
+        "username": "loginuser",
+        "email": "login@example.com",
+        "password_hash": "hash",
+        "role": "user",
+    }
+    collection = MagicMock()
+    collection.find_one = AsyncMock(return_value=user_doc)
+    collection.find_one_and_update = AsyncMock(return_value={"_id": user_id})
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+
+    user_service.invalidate_user_cache()
+    with patch("app.services.user_service.get_database", return_value=db):
+        cached = await user_service.get_user_by_id(str(user_id))
+        first = await user_service.get_user_by_username("loginuser")
+        second = await user_service.get_user_by_username("loginuser")
+        assert await user_service.update_last_login("loginuser") is True
+    evicted = str(user_id) not in user_service._user_cache
+    user_service.invalidate_user_cache()
+
+    assert first is not second and first is not cached
+    assert collection.find_one.await_count == 3
+    assert evicted
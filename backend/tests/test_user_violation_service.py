@@ -0,0 +1,48 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+from app.services.user_service import user_service
+from app.services.user_violation_service import user_violation_service
+
+
+@pytest.mark.asyncio
+async def test_flagged_users_summary_resolves_string_user_ids():
+    """Test that usernames are found for violations storing user_id as a string"""
+    flagged_id = ObjectId()
+    unknown_id = ObjectId()
+    grouped = [
+        {
+            "_id": str(uid),
+            "total_violations": 2,
+            "violation_types": ["spam"],
+            "latest_violation": datetime(2026, 1, 1),
+            "unreviewed_count": 1,
+            "high_severity_count": 0,
+        }
+        for uid in (flagged_id, unknown_id)
+    ]
+
+    violations = MagicMock()
+    violations.aggregate.return_value.to_list = AsyncMock(return_value=grouped)
+    violations_db = MagicMock()
+    violations_db.__getitem__.return_value = violations
+
+    async def user_cursor():
+        yield {"_id": flagged_id, "username": "flaggeduser"}
+
+    users = MagicMock()
+    users.find.return_value = user_cursor()
+    users_db = MagicMock()
+    users_db.__getitem__.return_value = users
+
+    user_service.invalidate_user_cache()
+    with patch("app.services.user_violation_service.get_database", return_value=violations_db), \
+            patch("app.services.user_service.get_database", return_value=users_db):
+        summaries = await user_violation_service.get_flagged_users_summary(limit=10)
+
+    assert [(s["user_id"], s["username"]) for s in summaries] == [
+        (str(flagged_id), "flaggeduser"),
+        (str(unknown_id), "Unknown"),
+    ]
+    assert users.find.call_count == 1